@@ -0,0 +1,28 @@
+# ------------------------------------------------------------------#
+# Configuracion del cache de la aplicacion                          #
+# ------------------------------------------------------------------#
+# Este archivo carga las variables de entorno que se encuentren     #
+# disponibles en el archivo .env y las mantiene estaticas para      #
+# el tiempo de ejecucion completo de la aplicacion.                 #
+# ------------------------------------------------------------------#
+
+from lib.environment.env import Env
+
+cache = {
+
+    # Almacen por defecto: 'memory' (por proceso) o 'sqlite' (compartido entre workers).
+    'driver' : Env.get("CACHE_DRIVER", "memory"),
+
+    # Segundos de vida por defecto de cada entrada.
+    'ttl' : int(Env.get("CACHE_TTL", 60)),
+
+    # Maximo de entradas que conserva cada almacen.
+    'size' : int(Env.get("CACHE_SIZE", 1024)),
+
+    # Archivo del almacen compartido, relativo a la raiz del proyecto.
+    'path' : Env.get("CACHE_PATH", "bootstrap/cache/cache.sqlite"),
+
+    # Cabeceras de la solicitud que forman parte de la llave del cache de respuestas.
+    'headers' : ['Accept', 'Accept-Language']
+
+}
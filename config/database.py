@@ -15,7 +15,27 @@ connections = {
             "username" : Env.get("DB_SIGWARE_USERNAME"),
             "password" : Env.get("DB_SIGWARE_PASSWORD"),
             "host" : Env.get("DB_SIGWARE_HOST"),
-            "service" : Env.get("DB_SIGWARE_SERVICE")
+            "service" : Env.get("DB_SIGWARE_SERVICE"),
+            "pool" : {
+
+                # Sesiones que se abren al crear el pool.
+                "min" : 1,
+
+                # Maximo de sesiones simultaneas del pool.
+                "max" : 10,
+
+                # Sesiones que se abren cada vez que el pool debe crecer.
+                "increment" : 1,
+
+                # Segundos maximos de espera por una sesion libre.
+                "timeout" : 30,
+
+                # Segundos de inactividad tras los cuales se hace ping al entregar la sesion (0 = siempre).
+                "ping_interval" : 0,
+
+                # Sentencias preparadas que conserva cada sesion (cache de sentencias).
+                "statement_cache" : 50
+            }
         }
     },
     'sqlserver' : {
@@ -24,7 +44,25 @@ connections = {
             "password" : Env.get("DB_PTL_PASSWORD_PTL"),
             "host" : Env.get("DB_PTL_HOST_PTL"),
             "database" : Env.get("DB_PTL_DATABASE_PTL"),
-            "port" : 1433
+            "port" : 1433,
+            "pool" : {
+
+                # Maximo de conexiones simultaneas del pool.
+                "max" : 10,
+
+                # Segundos maximos de espera por una conexion libre.
+                "timeout" : 30,
+
+                # Segundos de inactividad tras los cuales se cierra una conexion libre.
+                "idle_timeout" : 300,
+
+                # Segundos de vida maxima de una conexion.
+                "max_lifetime" : 1800,
+
+                # Consulta de validacion y segundos de inactividad tras los cuales se ejecuta (0 = siempre).
+                "validation" : "SELECT 1",
+                "ping_interval" : 30
+            }
         },
     }
 }
\ No newline at end of file
@@ -0,0 +1,22 @@
+# ------------------------------------------------------------------#
+# Configuracion del motor de vistas (Jinja2)                        #
+# ------------------------------------------------------------------#
+# Este archivo carga las variables de entorno que se encuentren     #
+# disponibles en el archivo .env y las mantiene estaticas para      #
+# el tiempo de ejecucion completo de la aplicacion.                 #
+# ------------------------------------------------------------------#
+
+from lib.environment.env import Env
+
+view = {
+
+    # Maximo de templates compilados que se conservan en memoria.
+    'cache_size' : int(Env.get("VIEW_CACHE_SIZE", 400)),
+
+    # Guardar en disco el bytecode de los templates compilados.
+    'bytecode_cache' : str(Env.get("VIEW_BYTECODE_CACHE", True)).lower() in ('true', '1'),
+
+    # Carpeta del bytecode de los templates, relativa a la raiz del proyecto.
+    'compiled' : Env.get("VIEW_COMPILED_PATH", "bootstrap/cache/views")
+
+}
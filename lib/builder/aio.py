@@ -0,0 +1,224 @@
+import asyncio
+import threading
+from abc import ABC, abstractmethod
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+from lib.builder.oracle import Oracle
+from lib.builder.sqlserver import SQLServer
+
+class AsyncBuilder(ABC):
+    """
+    Fachada asíncrona de los builders de base de datos (cada driver define su builder y size()).
+
+    Cada llamada se ejecuta en un pool de hilos acotado al tamaño del pool de conexiones,
+    de modo que nunca hay más consultas en curso que conexiones disponibles; dentro de una
+    solicitud que ya reservó una conexión, las llamadas la reutilizan. Permite lanzar
+    varias consultas independientes en paralelo con gather().
+
+    Uso (vista asíncrona):
+        db = AsyncOracle()
+        ventas, clientes = await db.gather(db.select(sql_ventas), db.select(sql_clientes))
+
+    Uso (vista síncrona, sin un ciclo de eventos en curso):
+        ventas, clientes = db.run(db.select(sql_ventas), db.select(sql_clientes))
+    """
+
+    # Builder que envuelve la fachada.
+    _builder = None
+
+    # Pools de hilos por driver y nombre de conexion.
+    _executors = {}
+    _lock = threading.Lock()
+
+    def __init__(self, connection='default'):
+        """
+        Inicializa la fachada para la conexión indicada.
+
+        Args:
+            connection (str): El nombre de la conexión a utilizar. Por defecto, es 'default'.
+        """
+        self.name = connection
+        self.builder = self._builder(connection)
+
+    @abstractmethod
+    def size(self):
+        """
+        Retorna la cantidad máxima de hilos del pool (el máximo de conexiones de la conexión).
+
+        Returns:
+            int: El tamaño del pool de hilos.
+        """
+
+    def executor(self):
+        """
+        Retorna el pool de hilos de la conexión, creándolo una sola vez por proceso.
+
+        Returns:
+            ThreadPoolExecutor: El pool de hilos.
+        """
+        key = (self._builder.__name__, self.name)
+
+        executor = AsyncBuilder._executors.get(key)
+        if executor is None:
+            with AsyncBuilder._lock:
+                if key not in AsyncBuilder._executors:
+                    AsyncBuilder._executors[key] = ThreadPoolExecutor(
+                        max_workers=self.size(),
+                        thread_name_prefix=f"{self._builder.__name__.lower()}.{self.name}"
+                    )
+                executor = AsyncBuilder._executors[key]
+
+        return executor
+
+    async def _run(self, method, *args, **kwargs):
+        """
+        Ejecuta un método del builder en el pool de hilos.
+
+        Si el hilo que llama ya tiene una conexión reservada (la de la solicitud Flask, un bloque
+        session() o transaction()), el hilo del pool usa esa misma conexión en lugar de tomar otra,
+        por lo que la solicitud nunca ocupa dos conexiones del pool. Las llamadas que comparten la
+        conexión se ejecutan una a la vez.
+
+        Args:
+            method (str): El nombre del método del builder.
+            *args: Argumentos posicionales del método.
+            **kwargs: Argumentos de palabras clave del método.
+
+        Returns:
+            any: El resultado del método.
+        """
+        loop = asyncio.get_running_loop()
+        call = partial(getattr(self.builder, method), *args, **kwargs)
+
+        connection = self.builder.reserved()
+        if connection is not None:
+            local = self.builder._local
+            lock = getattr(local, 'borrowed', None)
+            if lock is None:
+                lock = local.borrowed = threading.Lock()
+            call = partial(self._borrow, connection, self.builder.in_transaction(), lock, call)
+
+        return await loop.run_in_executor(self.executor(), call)
+
+    def _borrow(self, connection, transaction, lock, call):
+        """
+        Ejecuta la llamada en el hilo del pool usando la conexión reservada por el hilo que la lanzó.
+
+        Args:
+            connection (object): La conexión reservada.
+            transaction (bool): Si la conexión pertenece a un bloque transaction() (no se confirma cada sentencia).
+            lock (threading.Lock): Bloqueo que serializa el uso de la conexión.
+            call (callable): La llamada al builder.
+
+        Returns:
+            any: El resultado de la llamada.
+        """
+        local = self.builder._local
+
+        with lock:
+            local.connection = connection
+            local.transaction = transaction
+            try:
+                return call()
+            finally:
+                local.connection = None
+                local.transaction = False
+
+    async def select(self, statement, params=None, columnar=False):
+        """Ejecuta builder.select() sin bloquear el ciclo de eventos."""
+        return await self._run('select', statement, params, columnar=columnar)
+
+    async def execute(self, statement, params=None):
+        """Ejecuta builder.execute() sin bloquear el ciclo de eventos."""
+        return await self._run('execute', statement, params)
+
+    async def executemany(self, statement, params, batch_size=None):
+        """Ejecuta builder.executemany() sin bloquear el ciclo de eventos."""
+        return await self._run('executemany', statement, params, batch_size=batch_size)
+
+    async def insert(self, statement, params=None):
+        """Ejecuta builder.insert() sin bloquear el ciclo de eventos."""
+        return await self._run('insert', statement, params)
+
+    async def update(self, statement, params=None):
+        """Ejecuta builder.update() sin bloquear el ciclo de eventos."""
+        return await self._run('update', statement, params)
+
+    async def delete(self, statement, params=None):
+        """Ejecuta builder.delete() sin bloquear el ciclo de eventos."""
+        return await self._run('delete', statement, params)
+
+    async def bulk_insert(self, table, rows, **kwargs):
+        """Ejecuta builder.bulk_insert() sin bloquear el ciclo de eventos."""
+        return await self._run('bulk_insert', table, rows, **kwargs)
+
+    @staticmethod
+    async def gather(*queries):
+        """
+        Espera varias consultas independientes que se ejecutan en paralelo.
+
+        Args:
+            *queries: Las corrutinas de las consultas (por ejemplo db.select(...)).
+
+        Returns:
+            list: Los resultados en el mismo orden de las consultas.
+        """
+        return list(await asyncio.gather(*queries))
+
+    @staticmethod
+    def run(*queries):
+        """
+        Ejecuta varias consultas en paralelo desde código síncrono (por ejemplo una vista Flask tradicional).
+
+        Crea su propio ciclo de eventos, por lo que no puede usarse dentro de uno en curso
+        (vistas async def); allí se debe usar await AsyncBuilder.gather(...).
+
+        Args:
+            *queries: Las corrutinas de las consultas (por ejemplo db.select(...)).
+
+        Returns:
+            list: Los resultados en el mismo orden de las consultas.
+
+        Raises:
+            RuntimeError: Si se llama con un ciclo de eventos en curso en el hilo actual.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(AsyncBuilder.gather(*queries))
+
+        # Descartar las corrutinas que no se ejecutaran.
+        for query in queries:
+            query.close()
+
+        raise RuntimeError("[DB Async]: run() no puede usarse dentro de un ciclo de eventos en curso; use await AsyncBuilder.gather(...).")
+
+class AsyncOracle(AsyncBuilder):
+    """
+    Fachada asíncrona de Oracle.
+    """
+
+    _builder = Oracle
+
+    def size(self):
+        """Máximo de sesiones del pool de Oracle."""
+        return self.builder.pool_max
+
+    async def packageProcess(self, spname, paramsIn=[], paramsOut=[]):
+        """Ejecuta builder.packageProcess() sin bloquear el ciclo de eventos."""
+        return await self._run('packageProcess', spname, paramsIn, paramsOut)
+
+class AsyncSQLServer(AsyncBuilder):
+    """
+    Fachada asíncrona de SQL Server.
+    """
+
+    _builder = SQLServer
+
+    def size(self):
+        """Máximo de conexiones del pool de SQL Server."""
+        return int(self.builder.pool_config.get("max", 10))
+
+    async def bulk_upsert(self, table, rows, keys, **kwargs):
+        """Ejecuta builder.bulk_upsert() sin bloquear el ciclo de eventos."""
+        return await self._run('bulk_upsert', table, rows, keys, **kwargs)
@@ -0,0 +1,251 @@
+import hashlib
+import threading
+from lib.cache.store import MemoryStore
+from lib.environment.config import Config
+
+class QueryCache:
+    """
+    Cache de resultados de consultas SELECT compartido por todos los builders del proceso.
+
+    Las entradas se indexan por el texto normalizado de la sentencia y sus parámetros,
+    se desalojan por LRU al superar el tamaño configurado y pueden invalidarse por etiqueta.
+    Las consultas idénticas concurrentes se resuelven con una sola ida a la base de datos
+    (las demás esperan el resultado de la primera).
+
+    Cada etiqueta lleva una generación que aumenta con forget(): el resultado de una consulta
+    que inició antes de invalidar alguna de sus etiquetas se entrega pero no se almacena.
+    """
+
+    _store = None
+
+    # Indice de etiquetas {etiqueta: llaves}, su inverso {llave: etiquetas} y generaciones {etiqueta: n}.
+    _tags = {}
+    _keys = {}
+    _generations = {}
+
+    # Generacion global (aumenta con flush()).
+    _generation = 0
+
+    _flights = {}
+    _lock = threading.RLock()
+
+    # Marca de entrada inexistente.
+    _missing = object()
+
+    @staticmethod
+    def store():
+        """
+        Retorna el almacen en memoria del cache de consultas (se crea una sola vez).
+
+        Returns:
+            MemoryStore: El almacen de resultados.
+        """
+        if QueryCache._store is None:
+            with QueryCache._lock:
+                if QueryCache._store is None:
+                    QueryCache._store = MemoryStore(size=Config.cache('size') or 1024, on_evict=QueryCache._evicted)
+        return QueryCache._store
+
+    @staticmethod
+    def _evicted(key):
+        """
+        Retira del índice de etiquetas una llave desalojada o expirada del almacen.
+
+        Args:
+            key (str): La llave retirada.
+        """
+        with QueryCache._lock:
+            QueryCache._unlink(key)
+
+    @staticmethod
+    def _unlink(key):
+        """Retira la llave de las etiquetas que la referencian (requiere el bloqueo)."""
+        for tag in QueryCache._keys.pop(key, ()):
+            keys = QueryCache._tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del QueryCache._tags[tag]
+
+    @staticmethod
+    def _stamp(tags):
+        """Retorna la generación actual de las etiquetas (requiere el bloqueo)."""
+        return (QueryCache._generation, tuple(QueryCache._generations.get(tag, 0) for tag in tags))
+
+    @staticmethod
+    def key(prefix, statement, params=None, columnar=False):
+        """
+        Construye la llave de una consulta.
+
+        Args:
+            prefix (str): Driver y nombre de la conexión (por ejemplo 'oracle.default').
+            statement (str): La sentencia SQL; se normalizan los espacios en blanco.
+            params (dict|tuple|list, optional): Los parámetros de la sentencia.
+            columnar (bool): Si el resultado es una colección columnar.
+
+        Returns:
+            str: La llave de la consulta.
+        """
+        if params is None:
+            params = ()
+        elif isinstance(params, dict):
+            params = tuple(sorted(params.items()))
+        else:
+            params = tuple(params)
+
+        normalized = ' '.join(str(statement).split())
+        raw = repr((prefix, normalized, params, bool(columnar)))
+
+        return 'query:' + hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def remember(key, ttl, tags, callback):
+        """
+        Retorna el resultado almacenado o ejecuta la consulta una sola vez y lo almacena.
+
+        Args:
+            key (str): La llave de la consulta.
+            ttl (int): Segundos de vida del resultado.
+            tags (list): Etiquetas con las que se podrá invalidar el resultado.
+            callback (callable): Función que ejecuta la consulta.
+
+        Returns:
+            any: El resultado de la consulta.
+        """
+        store = QueryCache.store()
+
+        value = store.get(key, QueryCache._missing)
+        if value is not QueryCache._missing:
+            return value
+
+        # Determinar si esta solicitud ejecuta la consulta o espera a la que ya está en curso.
+        with QueryCache._lock:
+            flight = QueryCache._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = QueryCache._flights[key] = {
+                    'event': threading.Event(),
+                    'value': None,
+                    'error': None,
+                    'tags': set(tags),
+                    'stamp': QueryCache._stamp(tags)
+                }
+
+        if not leader:
+            flight['event'].wait()
+            if flight['error'] is not None:
+                raise flight['error']
+            return flight['value']
+
+        try:
+            value = callback()
+            flight['value'] = value
+
+            # Almacenar y registrar las etiquetas, salvo que se hayan invalidado durante la consulta.
+            with QueryCache._lock:
+                if QueryCache._stamp(tags) == flight['stamp']:
+                    store.set(key, value, ttl)
+                    QueryCache._unlink(key)
+                    if tags:
+                        QueryCache._keys[key] = set(tags)
+                        for tag in tags:
+                            QueryCache._tags.setdefault(tag, set()).add(key)
+
+            return value
+
+        except Exception as e:
+            flight['error'] = e
+            raise
+
+        finally:
+            with QueryCache._lock:
+                if QueryCache._flights.get(key) is flight:
+                    del QueryCache._flights[key]
+            flight['event'].set()
+
+    @staticmethod
+    def forget(*tags):
+        """
+        Invalida todos los resultados asociados a las etiquetas indicadas.
+
+        Args:
+            *tags (str): Las etiquetas a invalidar.
+
+        Returns:
+            int: Cantidad de entradas eliminadas.
+        """
+        with QueryCache._lock:
+            keys = set()
+            for tag in tags:
+                QueryCache._generations[tag] = QueryCache._generations.get(tag, 0) + 1
+                keys |= QueryCache._tags.get(tag, set())
+
+            for key in keys:
+                QueryCache._unlink(key)
+
+            # Las consultas en curso con estas etiquetas no reciben nuevas solicitudes en espera.
+            for key, flight in list(QueryCache._flights.items()):
+                if flight['tags'] & set(tags):
+                    del QueryCache._flights[key]
+
+        store = QueryCache.store()
+        return sum(1 for key in keys if store.forget(key))
+
+    @staticmethod
+    def flush():
+        """
+        Elimina todos los resultados del cache de consultas.
+        """
+        with QueryCache._lock:
+            QueryCache._generation += 1
+            QueryCache._tags.clear()
+            QueryCache._keys.clear()
+            QueryCache._flights.clear()
+        QueryCache.store().flush()
+
+class CachedQuery:
+    """
+    Envoltura de un builder que resuelve sus consultas SELECT a través del QueryCache.
+    Se obtiene con Oracle().cached(...) o SQLServer().cached(...).
+
+    Los resultados son compartidos entre solicitudes, por lo que no deben modificarse.
+    """
+
+    def __init__(self, builder, prefix, ttl=60, tags=None):
+        """
+        Inicializa la envoltura.
+
+        Args:
+            builder (Oracle|SQLServer): El builder que ejecuta la consulta.
+            prefix (str): Driver y nombre de la conexión.
+            ttl (int): Segundos de vida de los resultados.
+            tags (str|list, optional): Etiqueta o etiquetas de invalidación.
+        """
+        if tags is None:
+            tags = []
+        elif isinstance(tags, str):
+            tags = [tags]
+
+        self.builder = builder
+        self.prefix = prefix
+        self.ttl = ttl
+        self.tags = list(tags)
+
+    def select(self, statement, params=None, columnar=False):
+        """
+        Ejecuta la consulta SELECT o retorna su resultado almacenado.
+
+        Args:
+            statement (str): La consulta SELECT a ejecutar.
+            params (tuple|dict, optional): Parámetros para la consulta SELECT.
+            columnar (bool, optional): Si es True retorna una colección columnar.
+
+        Returns:
+            Collection: El resultado de la consulta.
+        """
+        return QueryCache.remember(
+            key=QueryCache.key(self.prefix, statement, params, columnar),
+            ttl=self.ttl,
+            tags=self.tags,
+            callback=lambda: self.builder.select(statement, params, columnar=columnar)
+        )
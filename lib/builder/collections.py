@@ -1,4 +1,203 @@
-class Collection:
+from array import array
+from itertools import islice
+
+class Enumerable:
+    """
+    Operadores comunes de las colecciones.
+
+    Todos se construyen sobre la iteración de la colección (__iter__): map, filter y pluck retornan
+    una LazyCollection que no copia los datos, chunk_iter entrega los bloques bajo demanda y los
+    índices de key_by y group_by se construyen una sola vez por llave y se reutilizan.
+
+    Las llaves pueden ser el nombre de una columna o una función que recibe el elemento.
+    """
+
+    @staticmethod
+    def _retriever(key):
+        """Retorna la función que extrae el valor de la llave de cada elemento."""
+        if key is None:
+            return lambda item: item
+        if callable(key):
+            return key
+        return lambda item: item.get(key)
+
+    def _values(self, key=None):
+        """Recorre los valores de la llave en cada elemento (o los elementos si key es None)."""
+        if key is None:
+            return iter(self)
+        return map(self._retriever(key), self)
+
+    def _index(self, name, key, build):
+        """Construye una única vez el índice solicitado y lo reutiliza en los siguientes llamados."""
+        indexes = self.__dict__.setdefault('_indexes', {})
+        if callable(key):
+            return build()
+        if (name, key) not in indexes:
+            indexes[(name, key)] = build()
+        return indexes[(name, key)]
+
+    def chunk_iter(self, size:int):
+        """
+        Genera la colección en bloques de tamaño especificado sin copiarla completa.
+
+        Args:
+            size (int): El tamaño de cada bloque.
+
+        Yields:
+            list: Cada bloque de datos.
+        """
+        if size <= 0:
+            raise ValueError("El tamaño de chunk debe ser un entero positivo mayor que cero.")
+
+        iterator = iter(self)
+        while True:
+            block = list(islice(iterator, size))
+            if not block:
+                return
+            yield block
+
+    def map(self, callback):
+        """
+        Aplica la función a cada elemento de forma diferida.
+
+        Args:
+            callback (callable): Función que recibe el elemento y retorna el nuevo valor.
+
+        Returns:
+            LazyCollection: La colección transformada.
+        """
+        return LazyCollection(lambda: map(callback, self))
+
+    def filter(self, callback=None):
+        """
+        Conserva los elementos para los cuales la función retorna un valor verdadero, de forma diferida.
+
+        Args:
+            callback (callable, optional): Función de evaluación. Por defecto, conserva los elementos verdaderos.
+
+        Returns:
+            LazyCollection: La colección filtrada.
+        """
+        return LazyCollection(lambda: filter(callback, self))
+
+    def pluck(self, key):
+        """
+        Extrae los valores de una llave de cada elemento, de forma diferida.
+
+        Args:
+            key (str|callable): La columna o función a extraer.
+
+        Returns:
+            LazyCollection: Los valores de la llave.
+        """
+        return LazyCollection(lambda: self._values(key))
+
+    def key_by(self, key):
+        """
+        Indexa la colección por el valor de la llave (el último elemento gana en caso de repetidos).
+        El índice se construye una sola vez y se reutiliza en búsquedas posteriores.
+
+        Args:
+            key (str|callable): La columna o función que define la llave.
+
+        Returns:
+            dict: Los elementos indexados por el valor de la llave.
+        """
+        retriever = self._retriever(key)
+        return self._index('key_by', key, lambda: {retriever(item): item for item in self})
+
+    def group_by(self, key):
+        """
+        Agrupa los elementos por el valor de la llave.
+        La agrupación se construye una sola vez y se reutiliza en llamados posteriores.
+
+        Args:
+            key (str|callable): La columna o función que define el grupo.
+
+        Returns:
+            dict: Listas de elementos agrupadas por el valor de la llave.
+        """
+        retriever = self._retriever(key)
+
+        def build():
+            groups = {}
+            for item in self:
+                groups.setdefault(retriever(item), []).append(item)
+            return groups
+
+        return self._index('group_by', key, build)
+
+    def sort_by(self, key, reverse:bool = False):
+        """
+        Ordena la colección por el valor de la llave. Los valores None quedan al final.
+
+        Args:
+            key (str|callable): La columna o función que define el orden.
+            reverse (bool, optional): Si es True ordena de forma descendente. Por defecto, es False.
+
+        Returns:
+            Collection: Una nueva colección ordenada.
+        """
+        retriever = self._retriever(key)
+        present, missing = [], []
+        for item in self:
+            (missing if retriever(item) is None else present).append(item)
+        return Collection(data=sorted(present, key=retriever, reverse=reverse) + missing)
+
+    def sum(self, key=None):
+        """
+        Suma los valores de la llave (o los elementos), ignorando los valores None.
+
+        Args:
+            key (str|callable, optional): La columna o función a sumar.
+
+        Returns:
+            int|float: La suma de los valores.
+        """
+        return sum(value for value in self._values(key) if value is not None)
+
+    def avg(self, key=None):
+        """
+        Promedia los valores de la llave (o los elementos), ignorando los valores None.
+
+        Args:
+            key (str|callable, optional): La columna o función a promediar.
+
+        Returns:
+            float: El promedio de los valores o None si no hay valores.
+        """
+        total, count = 0, 0
+        for value in self._values(key):
+            if value is not None:
+                total += value
+                count += 1
+        return total / count if count else None
+
+    def min(self, key=None):
+        """
+        Retorna el menor valor de la llave (o de los elementos), ignorando los valores None.
+
+        Args:
+            key (str|callable, optional): La columna o función a evaluar.
+
+        Returns:
+            any: El menor valor o None si no hay valores.
+        """
+        return min((value for value in self._values(key) if value is not None), default=None)
+
+    def max(self, key=None):
+        """
+        Retorna el mayor valor de la llave (o de los elementos), ignorando los valores None.
+
+        Args:
+            key (str|callable, optional): La columna o función a evaluar.
+
+        Returns:
+            any: El mayor valor o None si no hay valores.
+        """
+        return max((value for value in self._values(key) if value is not None), default=None)
+
+class Collection(Enumerable):
     """
     Clase que representa una colección de datos.
 
@@ -57,3 +256,225 @@ class Collection:
 
         return [self.data[i:i + size] for i in range(0, len(self.data), size)]
 
+    def __len__(self):
+        """Retorna la cantidad de elementos de la colección."""
+        return len(self.data)
+
+    def __iter__(self):
+        """Recorre los elementos de la colección."""
+        return iter(self.data)
+
+class ColumnarCollection(Collection):
+    """
+    Colección de resultados almacenada por columnas.
+
+    Guarda una única tupla de encabezados y los valores de cada columna en un contenedor propio:
+    las columnas enteras o decimales se compactan en arreglos numéricos (array) y las demás en tuplas.
+    Los diccionarios por fila solo se construyen al acceder a ellos, evitando repetir las llaves
+    en cada registro y reduciendo varias veces la memoria de consultas grandes.
+
+    Expone la misma interfaz de Collection (first, last, get, chunk).
+
+    Attributes:
+        headers (tuple): Los nombres de las columnas.
+        columns (list): Los valores de cada columna, en el mismo orden de los encabezados.
+    """
+
+    # Tipos de arreglo segun el tipo exacto de la columna.
+    _typecodes = {int: 'q', float: 'd'}
+
+    def __init__(self, headers, rows=()):
+        """
+        Inicializa la colección a partir de los encabezados y un iterable de filas (tuplas).
+        Las filas se consumen una a una, por lo que se puede alimentar directamente desde un cursor.
+
+        Args:
+            headers (list): Los nombres de las columnas.
+            rows (iterable): Las filas de la consulta.
+        """
+        self.headers = tuple(headers)
+
+        columns = [[] for _ in self.headers]
+        appends = [column.append for column in columns]
+        length = 0
+        for row in rows:
+            for append, value in zip(appends, row):
+                append(value)
+            length += 1
+
+        self._length = length
+        self.columns = [self._pack(column) for column in columns]
+
+    @classmethod
+    def _pack(cls, values):
+        """
+        Compacta los valores de una columna en un arreglo numérico si todos son del mismo tipo numérico.
+
+        Args:
+            values (list): Los valores de la columna.
+
+        Returns:
+            array|tuple: El contenedor compacto de la columna.
+        """
+        kinds = set(map(type, values))
+        if len(kinds) == 1:
+            typecode = cls._typecodes.get(kinds.pop())
+            if typecode is not None:
+                try:
+                    return array(typecode, values)
+                except OverflowError:
+                    pass
+        return tuple(values)
+
+    @property
+    def data(self):
+        """
+        Materializa todas las filas como lista de diccionarios.
+
+        Returns:
+            list: Todas las filas de la colección.
+        """
+        return self.get()
+
+    def row(self, index:int):
+        """
+        Construye el diccionario de una fila.
+
+        Args:
+            index (int): La posición de la fila (admite índices negativos).
+
+        Returns:
+            dict: La fila indexada por el nombre de sus columnas.
+        """
+        return dict(zip(self.headers, [column[index] for column in self.columns]))
+
+    def first(self):
+        """
+        Devuelve el primer elemento de la colección o None si la colección está vacía.
+
+        Returns:
+            dict: El primer elemento de la colección o None si está vacía.
+        """
+        return self.row(0) if self._length else None
+
+    def last(self):
+        """
+        Devuelve el último elemento de la colección o None si la colección está vacía.
+
+        Returns:
+            dict: El último elemento de la colección o None si está vacía.
+        """
+        return self.row(-1) if self._length else None
+
+    def get(self):
+        """
+        Devuelve todos los datos almacenados en la colección como lista de diccionarios.
+
+        Returns:
+            list: Todos los datos almacenados en la colección.
+        """
+        return list(self)
+
+    def chunk(self, size:int):
+        """
+        Divide la colección en bloques de tamaño especificado.
+
+        Args:
+            size (int): El tamaño de cada bloque.
+
+        Returns:
+            list: Una lista de listas, donde cada sublista es un bloque de datos.
+        """
+        if size <= 0:
+            raise ValueError("El tamaño de chunk debe ser un entero positivo mayor que cero.")
+
+        rows = self.get()
+        return [rows[i:i + size] for i in range(0, len(rows), size)]
+
+    def _values(self, key=None):
+        """Recorre directamente el contenedor de la columna cuando la llave es un encabezado."""
+        if isinstance(key, str) and key in self.headers:
+            return iter(self.columns[self.headers.index(key)])
+        return super()._values(key)
+
+    def __len__(self):
+        """Retorna la cantidad de filas de la colección."""
+        return self._length
+
+    def __iter__(self):
+        """Recorre las filas construyendo cada diccionario bajo demanda."""
+        headers = self.headers
+        for values in zip(*self.columns):
+            yield dict(zip(headers, values))
+
+class LazyCollection(Enumerable):
+    """
+    Colección diferida construida a partir de un generador.
+
+    Los elementos se producen solo al recorrerla, por lo que encadenar operadores
+    (map, filter, pluck...) no crea listas intermedias.
+    """
+
+    def __init__(self, source):
+        """
+        Inicializa la colección diferida.
+
+        Args:
+            source (callable|iterable): Función que retorna un nuevo iterador en cada recorrido, o un iterable.
+        """
+        self.source = source
+
+    def __iter__(self):
+        """Recorre los elementos producidos por la fuente."""
+        return iter(self.source() if callable(self.source) else self.source)
+
+    def first(self):
+        """
+        Devuelve el primer elemento de la colección o None si la colección está vacía.
+
+        Returns:
+            any: El primer elemento de la colección o None si está vacía.
+        """
+        return next(iter(self), None)
+
+    def last(self):
+        """
+        Devuelve el último elemento de la colección o None si la colección está vacía.
+
+        Returns:
+            any: El último elemento de la colección o None si está vacía.
+        """
+        item = None
+        for item in self:
+            pass
+        return item
+
+    def get(self):
+        """
+        Materializa todos los elementos de la colección.
+
+        Returns:
+            list: Todos los elementos de la colección.
+        """
+        return list(self)
+
+    def chunk(self, size:int):
+        """
+        Divide la colección en bloques de tamaño especificado.
+
+        Args:
+            size (int): El tamaño de cada bloque.
+
+        Returns:
+            list: Una lista de listas, donde cada sublista es un bloque de datos.
+        """
+        return list(self.chunk_iter(size))
+
+    def collect(self):
+        """
+        Materializa la colección diferida en una Collection.
+
+        Returns:
+            Collection: La colección con todos los elementos.
+        """
+        return Collection(data=self.get())
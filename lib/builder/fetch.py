@@ -1,10 +1,11 @@
-from lib.builder.collections import Collection
+from lib.builder.collections import Collection, ColumnarCollection
 
 class Fetch:
 
-    def __init__(self, cursor):
-        """Recibe la data de la consulta"""
+    def __init__(self, cursor, release=None):
+        """Recibe la data de la consulta y, opcionalmente, la funcion que devuelve la sesion al pool"""
         self.cursor = cursor
+        self._release = release
 
     def headers(self):
         """Retorna solo el nombre de las columnas"""
@@ -12,20 +13,76 @@ class Fetch:
 
     def column(self, position:int):
         """Retorna solo los valoresde la columna de acuerdo a su posición"""
-        rows = self.cursor.fetchall()
-
-        data = []
-        for row in rows:
-            data.append(row[position])
-
-        return data
+        return [row[position] for row in self.stream()]
 
     def rows(self):
         """Retorna solo los valores solo de las filas"""
-        return self.cursor.fetchall()
+        rows = self.cursor.fetchall()
+        self.close()
+        return rows
 
     def fetch(self):
         """Retorna una coleccion de valores indexados"""
         headers_featch = [desc[0] for desc in self.cursor.description]
         rows_featch = [dict(zip(headers_featch, row)) for row in self.cursor.fetchall()]
-        return Collection(data=rows_featch)
\ No newline at end of file
+        self.close()
+        return Collection(data=rows_featch)
+
+    def columnar(self, batch_size:int = 1000):
+        """Retorna una coleccion columnar (compacta en memoria) leyendo el cursor por lotes"""
+        return ColumnarCollection(headers=self.headers(), rows=self.stream(batch_size=batch_size))
+
+    def stream(self, batch_size:int = 1000):
+        """
+        Generador que retorna las filas una a una, leyéndolas del cursor por lotes (fetchmany).
+        Nunca mantiene en memoria más de un lote, por lo que permite exportar resultados
+        de millones de filas. La sesión se devuelve al pool al agotar el generador.
+
+        Args:
+            batch_size (int): Cantidad de filas por viaje a la base de datos (arraysize del cursor).
+
+        Yields:
+            tuple: Cada fila del resultado.
+        """
+        if batch_size <= 0:
+            raise ValueError("El tamaño de lote debe ser un entero positivo mayor que cero.")
+
+        # Ajustar el tamaño de los viajes siguientes (el primero se define con Oracle.query(arraysize=...)).
+        self.cursor.arraysize = batch_size
+
+        try:
+            while True:
+                rows = self.cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            self.close()
+
+    def iter_dicts(self, batch_size:int = 1000):
+        """
+        Generador que retorna las filas una a una como diccionarios indexados por columna.
+
+        Args:
+            batch_size (int): Cantidad de filas por viaje a la base de datos (arraysize del cursor).
+
+        Yields:
+            dict: Cada fila del resultado indexada por el nombre de sus columnas.
+        """
+        headers = self.headers()
+        for row in self.stream(batch_size=batch_size):
+            yield dict(zip(headers, row))
+
+    def close(self):
+        """Cierra el cursor y devuelve la sesion al pool (una sola vez)"""
+        if self._release is not None:
+            release, self._release = self._release, None
+            try:
+                self.cursor.close()
+            except Exception:
+                pass
+            release()
+
+    def __del__(self):
+        """Garantiza la devolucion de la sesion si el Fetch no se consumio por completo"""
+        self.close()
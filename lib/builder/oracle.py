@@ -1,8 +1,13 @@
+import re
 import cx_Oracle
+import threading
+from contextlib import contextmanager, closing
+from itertools import chain
 from typing import Dict
 from lib.environment.config import Config
-from lib.builder.collections import Collection
+from lib.builder.collections import Collection, LazyCollection
 from lib.builder.fetch import Fetch
+from lib.builder.cache import QueryCache, CachedQuery
 
 class Oracle:
     """
@@ -23,7 +28,10 @@ class Oracle:
 
     # Diccionario para almacenar las instancias de conexiones Oracle.
     _instances: Dict[str, 'Oracle'] = {}
-    connection = None
+    _lock = threading.Lock()
+
+    # Pool de sesiones de la conexion.
+    _pool = None
 
     def __new__(cls, connection='default'):
         """
@@ -36,9 +44,12 @@ class Oracle:
             Returns:
                 Oracle: Instancia de la conexión Oracle.
         """
-        if connection not in cls._instances:
-            cls._instances[connection] = super().__new__(cls)
-        return cls._instances[connection]
+        with cls._lock:
+            if connection not in cls._instances:
+                instance = super().__new__(cls)
+                instance._local = threading.local()
+                cls._instances[connection] = instance
+            return cls._instances[connection]
 
     def __init__(self, connection='default'):
         """
@@ -73,61 +84,199 @@ class Oracle:
         self.encoding = "UTF-8"
         self.nencoding = "UTF-8"
 
+        # Parametros del pool de sesiones.
+        pool = dataConnection.get("pool") or {}
+        self.pool_min = int(pool.get("min", 1))
+        self.pool_max = int(pool.get("max", 10))
+        self.pool_increment = int(pool.get("increment", 1))
+        self.pool_timeout = int(pool.get("timeout", 30))
+        self.pool_ping_interval = int(pool.get("ping_interval", 0))
+        self.pool_statement_cache = int(pool.get("statement_cache", 50))
+
+    def pool(self):
+        """
+            Método para obtener el pool de sesiones de la conexión.
+            El pool se crea una única vez por nombre de conexión y es compartido por todos los hilos.
+
+            Returns:
+                cx_Oracle.SessionPool: El pool de sesiones de la conexión.
+
+            Raises:
+                RuntimeError: Si la creación del pool falla.
+        """
+        if self._pool is None:
+
+            with self._lock:
+
+                if self._pool is None:
+
+                    try:
+
+                        # Crea el pool de sesiones a la base de datos Oracle.
+                        self._pool = cx_Oracle.SessionPool(
+                            user=self.username,
+                            password=self.password,
+                            dsn=self.tns,
+                            min=self.pool_min,
+                            max=self.pool_max,
+                            increment=self.pool_increment,
+                            threaded=True,
+                            getmode=cx_Oracle.SPOOL_ATTRVAL_TIMEDWAIT,
+                            wait_timeout=self.pool_timeout * 1000,
+                            ping_interval=self.pool_ping_interval,
+                            stmtcachesize=self.pool_statement_cache,
+                            encoding=self.encoding,
+                            nencoding=self.nencoding
+                        )
+
+                    except Exception as e:
+
+                        # Detiene la Ejecucion por Excepción
+                        raise RuntimeError(f"[DB Oracle]: Conexión Fallida, {e}")
+
+        return self._pool
 
     def connect(self):
         """
-            Método para establecer la conexión a la base de datos Oracle.
+            Método para tomar una sesión del pool de la base de datos Oracle.
+            La sesión debe devolverse al pool con el método release().
+            Dentro de un bloque transaction() retorna siempre la sesión de la transacción.
 
             Returns:
-                cx_Oracle.Connection: La conexión establecida con la base de datos.
+                cx_Oracle.Connection: La sesión tomada del pool.
 
             Raises:
-                RuntimeError: Si la conexión a la base de datos falla.
+                RuntimeError: Si no es posible obtener una sesión del pool.
         """
-        if not self.connection or self.connection is None:
+        # Sesion reservada para la transaccion del hilo actual.
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None:
+            return connection
+
+        try:
+
+            # Toma una sesion libre (con ping de salud) del pool.
+            return self.pool().acquire()
+
+        except RuntimeError:
 
+            raise
+
+        except Exception as e:
+
+            # Detiene la Ejecucion por Excepción
+            raise RuntimeError(f"[DB Oracle]: Conexión Fallida, {e}")
+
+    def release(self, connection):
+        """
+            Método para devolver una sesión al pool de la base de datos Oracle.
+
+            Args:
+                connection (cx_Oracle.Connection): La sesión tomada con connect().
+
+            Returns:
+                None
+        """
+        # La sesion de una transaccion se devuelve al finalizar el bloque.
+        if connection is None or connection is getattr(self._local, 'connection', None):
+            return
+
+        if self._pool is not None:
             try:
+                self._pool.release(connection)
+            except cx_Oracle.Error:
+                pass
 
-                # Crea la conexion a la base de datos Oracle.
-                self.connection = cx_Oracle.connect(
-                    user=self.username,
-                    password=self.password,
-                    dsn=self.tns,
-                    encoding=self.encoding,
-                    nencoding=self.nencoding
-                )
+    @contextmanager
+    def transaction(self):
+        """
+            Método para ejecutar todas las operaciones del bloque en una sola transacción del hilo actual.
+
+            Las sentencias del bloque usan la misma sesión y no se confirman una a una: se hace un único
+            commit al finalizar el bloque y un rollback si ocurre cualquier excepción. Los bloques
+            anidados hacen parte de la transacción exterior.
+
+            Uso:
+                with Oracle().transaction() as db:
+                    db.insert(...)
+                    db.update(...)
 
-            except Exception as e:
+            Returns:
+                Oracle: La instancia actual.
+        """
+        if self.in_transaction():
+            yield self
+            return
 
-                # Detiene la Ejecucion por Excepción
-                raise RuntimeError(f"[DB Oracle]: Conexión Fallida, {e}")
+        connection = self.connect()
+        self._local.connection = connection
 
-        return self.connection
+        try:
+            yield self
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            self._local.connection = None
+            self.release(connection)
+
+    def in_transaction(self):
+        """
+            Método para saber si el hilo actual se encuentra dentro de un bloque transaction().
+
+            Returns:
+                bool: True si hay una transacción en curso.
+        """
+        return getattr(self._local, 'connection', None) is not None
+
+    def reserved(self):
+        """
+            Método para obtener la sesión reservada por el hilo actual (la del bloque transaction()).
+
+            Returns:
+                cx_Oracle.Connection: La sesión reservada, o None si no existe.
+        """
+        return getattr(self._local, 'connection', None)
+
+    def _commit(self, connection):
+        """
+            Confirma la sentencia ejecutada, salvo dentro de un bloque transaction() (se confirma al finalizarlo).
+
+            Args:
+                connection (cx_Oracle.Connection): La sesión de la sentencia.
+        """
+        if not self.in_transaction():
+            connection.commit()
 
     def close(self):
         """
-            Método para cerrar la conexión a la base de datos Oracle.
+            Método para cerrar el pool de sesiones de la base de datos Oracle.
 
             Returns:
                 None
         """
 
-        if self.connection:
+        if self._pool is not None:
+
+            # Cierra el pool y todas sus sesiones.
+            self._pool.close(force=True)
 
-            # Cierra la conexion.
-            self.connection.close()
+            # Vaciar Valor del pool
+            self._pool = None
 
-            # Vaciar Valor de la conexion
-            self.connection = None
-            self._instances[self.name_conecction] = None
+        with self._lock:
+            self._instances.pop(self.name_conecction, None)
 
-    def query(self, statement, params=None):
+    def query(self, statement, params=None, arraysize=None):
         """
             Método para ejecutar una consulta genérica en la base de datos Oracle.
 
             Args:
                 statement (str): La consulta SQL a ejecutar.
                 params (tuple, optional): Parámetros para la consulta SQL (si es necesario). Por defecto, es None.
+                arraysize (int, optional): Filas por viaje a la base de datos; se aplica antes de ejecutar la consulta
+                    (arraysize y prefetchrows), por ejemplo con el mismo tamaño de lote de Fetch.stream(). Por defecto, es None.
 
             Returns:
                 dict: Un diccionario con los encabezados y las filas de la respuesta de la base de datos.
@@ -135,20 +284,30 @@ class Oracle:
             Raises:
                 ValueError: Si la consulta SQL falla.
         """
+        connection = None
         try:
             # Ejecucion de Query
             connection = self.connect()
             cursor = connection.cursor()
+
+            # El tamano de los viajes solo aplica si se define antes de ejecutar.
+            if arraysize:
+                cursor.arraysize = arraysize
+                cursor.prefetchrows = arraysize + 1
+
             if params:
                 cursor.execute(statement, params)
             else:
                 cursor.execute(statement)
 
             # Retorna una instancia de la clase Fetch
-            return Fetch(cursor=cursor)
+            return Fetch(cursor=cursor, release=lambda: self.release(connection))
 
         except Exception as e:
 
+            # Devolver la sesion al pool.
+            self.release(connection)
+
             # Lanzar excepcion
             raise ValueError(f"[DB Oracle]: Query Fallido, {e}")
 
@@ -166,32 +325,39 @@ class Oracle:
             Raises:
                 ValueError: Si la sentencia SQL falla.
         """
+        connection = None
         try:
             # Ejecucion de la sentencia.
             connection = self.connect()
-            cursor = connection.cursor()
-            if params:
-                cursor.execute(statement, params)
-            else:
-                cursor.execute(statement)
-            connection.commit()
-
-            # Retorna true como bandera de exito.
-            return True
+            with closing(connection.cursor()) as cursor:
+                if params:
+                    cursor.execute(statement, params)
+                else:
+                    cursor.execute(statement)
+                self._commit(connection)
+
+                # Retorna true como bandera de exito.
+                return True
 
         except Exception as e:
 
             # Lanzar excepcion
             raise ValueError(f"[DB Oracle]: Sentencia Fallida, {e}")
 
-    def executemany(self, statement, params):
+        finally:
+
+            # Devolver la sesion al pool.
+            self.release(connection)
+
+    def executemany(self, statement, params, batch_size=None):
         """
             Método para ejecutar una sentencia en la base de datos Oracle.
             Ejecucion masiva.
 
             Args:
                 statement (str): La sentencia SQL a ejecutar.
-                params (tuple): Parámetros para la sentencia SQL (si es necesario). Por defecto, es None.
+                params (iterable): Parámetros para la sentencia SQL (si es necesario). Por defecto, es None.
+                batch_size (int, optional): Si se indica, la sentencia se ejecuta y confirma por lotes de este tamaño.
 
             Returns:
                 bool: True si la ejecución fue exitosa.
@@ -199,28 +365,128 @@ class Oracle:
             Raises:
                 ValueError: Si la sentencia SQL falla.
         """
+        connection = None
         try:
             # Ejecucion de la sentencia.
             connection = self.connect()
-            cursor = connection.cursor()
-            cursor.executemany(statement, params)
-            connection.commit()
-
-            # Retorna true como bandera de exito.
-            return True
+            with closing(connection.cursor()) as cursor:
+                if batch_size:
+                    for batch in LazyCollection(params).chunk_iter(batch_size):
+                        cursor.executemany(statement, batch)
+                        self._commit(connection)
+                else:
+                    cursor.executemany(statement, params)
+                    self._commit(connection)
+
+                # Retorna true como bandera de exito.
+                return True
 
         except Exception as e:
 
             # Lanzar excepcion
             raise ValueError(f"[DB Oracle]: Sentencia Fallida, {e}")
 
-    def select(self, statement, params=None):
+        finally:
+
+            # Devolver la sesion al pool.
+            self.release(connection)
+
+    def bulk_insert(self, table, rows, batch_size=10000, columns=None, input_sizes=None):
+        """
+            Método para realizar cargas masivas en la base de datos Oracle mediante array binding.
+
+            Las filas se envían y confirman por lotes; nunca se mantiene en memoria más de un lote,
+            por lo que se puede cargar un generador o una colección de millones de registros.
+            Las filas que fallan no detienen la carga (batcherrors) y se informan en el resultado.
+
+            Args:
+                table (str): Nombre de la tabla destino (puede incluir el esquema).
+                rows (iterable): Collection, generador o lista de diccionarios o tuplas.
+                batch_size (int, optional): Filas por lote (un viaje y un commit por lote). Por defecto, es 10000.
+                columns (list, optional): Columnas destino. Obligatorias si las filas son tuplas; si son diccionarios, por defecto se usan las llaves de la primera fila.
+                input_sizes (dict|list, optional): Tipos de cada columna para cursor.setinputsizes (por ejemplo {'DESCRIPCION': Oracle.CLOB}).
+
+            Returns:
+                dict: Resumen de la carga con las filas procesadas (rows), insertadas (inserted), los lotes (batches) y los errores por fila (errors).
+
+            Raises:
+                ValueError: Si los parámetros no son válidos o la carga falla.
+        """
+        if batch_size <= 0:
+            raise ValueError("[DB Oracle]: El tamaño de lote debe ser un entero positivo mayor que cero.")
+
+        report = {'rows': 0, 'inserted': 0, 'batches': 0, 'errors': []}
+
+        # Tomar la primera fila para determinar las columnas.
+        iterator = iter(rows)
+        first = next(iterator, None)
+        if first is None:
+            return report
+
+        if columns is None:
+            if not isinstance(first, dict):
+                raise ValueError("[DB Oracle]: Debe indicar las columnas cuando las filas no son diccionarios.")
+            columns = list(first.keys())
+
+        # Validar los identificadores que se interpolan en la sentencia.
+        for name in [table] + list(columns):
+            if not re.fullmatch(r'[A-Za-z_][\w$#]*(\.[A-Za-z_][\w$#]*)?', str(name)):
+                raise ValueError(f"[DB Oracle]: Identificador no válido para la carga masiva: {name}")
+
+        statement = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join(f':{i}' for i in range(1, len(columns) + 1))})"
+
+        # Tipos de las columnas.
+        if isinstance(input_sizes, dict):
+            input_sizes = [input_sizes.get(column) for column in columns]
+
+        # Filas como tuplas en el orden de las columnas.
+        values = LazyCollection(chain([first], iterator)).map(
+            lambda row: tuple(row[column] for column in columns) if isinstance(row, dict) else tuple(row)
+        )
+
+        connection = None
+        try:
+            # Ejecucion de la carga por lotes.
+            connection = self.connect()
+            with closing(connection.cursor()) as cursor:
+                for batch in values.chunk_iter(batch_size):
+
+                    if input_sizes:
+                        cursor.setinputsizes(*input_sizes)
+
+                    cursor.executemany(statement, batch, batcherrors=True)
+                    errors = cursor.getbatcherrors()
+                    self._commit(connection)
+
+                    # Registrar las filas fallidas con su posicion en la carga completa.
+                    for error in errors:
+                        report['errors'].append({'row': report['rows'] + error.offset, 'message': error.message})
+
+                    report['rows'] += len(batch)
+                    report['inserted'] += len(batch) - len(errors)
+                    report['batches'] += 1
+
+                # Retorna el resumen de la carga.
+                return report
+
+        except Exception as e:
+
+            # Lanzar excepcion
+            raise ValueError(f"[DB Oracle]: Carga Masiva Fallida en la fila {report['rows']}, {e}")
+
+        finally:
+
+            # Devolver la sesion al pool.
+            self.release(connection)
+
+    def select(self, statement, params=None, columnar=False):
         """
             Método para ejecutar una consulta SELECT con retorno de datos indexados en la base de datos Oracle.
 
             Args:
                 statement (str): La consulta SELECT a ejecutar.
                 params (tuple, optional): Parámetros para la consulta SELECT (si es necesario). Por defecto, es None.
+                columnar (bool, optional): Si es True retorna una colección columnar (encabezados únicos y valores por columna). Por defecto, es False.
 
             Returns:
                 list: Una lista de diccionarios representando las filas de la respuesta de la base de datos, con columnas indexadas por nombre.
@@ -228,27 +494,63 @@ class Oracle:
             Raises:
                 ValueError: Si la consulta SELECT falla.
         """
+        connection = None
         try:
             # Ejecucion Select.
             connection = self.connect()
-            cursor = connection.cursor()
-            if params:
-                cursor.execute(statement, params)
-            else:
-                cursor.execute(statement)
+            with closing(connection.cursor()) as cursor:
+                if params:
+                    cursor.execute(statement, params)
+                else:
+                    cursor.execute(statement)
+
+                # Coleccion columnar compacta en memoria.
+                if columnar:
+                    return Fetch(cursor=cursor).columnar()
 
-            # Convertir a diccionarios
-            headers = [desc[0] for desc in cursor.description]
-            rows = [dict(zip(headers, row)) for row in cursor.fetchall()]
+                # Convertir a diccionarios
+                headers = [desc[0] for desc in cursor.description]
+                rows = [dict(zip(headers, row)) for row in cursor.fetchall()]
 
-            # Retorno de valores asociados.
-            return Collection(data=rows)
+                # Retorno de valores asociados.
+                return Collection(data=rows)
 
         except Exception as e:
 
             # Lanzar excepcion
             raise ValueError(f"[DB Oracle]: Select Fallido, {e}")
 
+        finally:
+
+            # Devolver la sesion al pool.
+            self.release(connection)
+
+    def cached(self, ttl=60, tags=None):
+        """
+            Método para resolver las consultas SELECT a través del cache de resultados.
+            Ejemplo: Oracle().cached(ttl=60, tags='catalogos').select(sql, params)
+
+            Args:
+                ttl (int, optional): Segundos de vida de los resultados. Por defecto, es 60.
+                tags (str|list, optional): Etiqueta o etiquetas para invalidar los resultados con forget().
+
+            Returns:
+                CachedQuery: Envoltura de la conexión cuyo select() usa el cache.
+        """
+        return CachedQuery(builder=self, prefix=f"oracle.{self.name_conecction}", ttl=ttl, tags=tags)
+
+    def forget(self, *tags):
+        """
+            Método para invalidar los resultados almacenados con las etiquetas indicadas.
+
+            Args:
+                *tags (str): Las etiquetas a invalidar.
+
+            Returns:
+                int: Cantidad de resultados eliminados del cache.
+        """
+        return QueryCache.forget(*tags)
+
     def insert(self, statement, params=None):
         """
             Método para insertar datos en la base de datos Oracle.
@@ -263,28 +565,34 @@ class Oracle:
             Raises:
                 ValueError: Si la inserción de datos falla.
         """
+        connection = None
         try:
             # Ejecucion inserción.
             connection = self.connect()
-            cursor = connection.cursor()
-            if params:
-                cursor.execute(statement, params)
-            else:
-                cursor.execute(statement)
-            connection.commit()
-
-            # Retorna el ultimo ID insertado si es aplicable
-            if cursor.lastrowid is not None:
-                return cursor.lastrowid
-            else:
-                # Si la inserción no generó un ID, devuelve un valor indicativo, como True
-                return True
+            with closing(connection.cursor()) as cursor:
+                if params:
+                    cursor.execute(statement, params)
+                else:
+                    cursor.execute(statement)
+                self._commit(connection)
+
+                # Retorna el ultimo ID insertado si es aplicable
+                if cursor.lastrowid is not None:
+                    return cursor.lastrowid
+                else:
+                    # Si la inserción no generó un ID, devuelve un valor indicativo, como True
+                    return True
 
         except Exception as e:
 
             # Lanzar excepcion
             raise ValueError(f"[DB Oracle]: Insert Fallido, {e}")
 
+        finally:
+
+            # Devolver la sesion al pool.
+            self.release(connection)
+
     def update(self, statement, params=None):
         """
             Método para actualizar registros en la base de datos Oracle.
@@ -299,24 +607,30 @@ class Oracle:
             Raises:
                 ValueError: Si la actualización de registros falla.
         """
+        connection = None
         try:
             # Ejecucion de la actualizacion.
             connection = self.connect()
-            cursor = connection.cursor()
-            if params:
-                cursor.execute(statement, params)
-            else:
-                cursor.execute(statement)
-            connection.commit()
-
-            # Retorna true como bandera de exito.
-            return True
+            with closing(connection.cursor()) as cursor:
+                if params:
+                    cursor.execute(statement, params)
+                else:
+                    cursor.execute(statement)
+                self._commit(connection)
+
+                # Retorna true como bandera de exito.
+                return True
 
         except Exception as e:
 
             # Lanzar excepcion
             raise ValueError(f"[DB Oracle]: Update Fallido, {e}")
 
+        finally:
+
+            # Devolver la sesion al pool.
+            self.release(connection)
+
     def delete(self, statement, params=None):
         """
             Método para eliminar un registro de la base de datos Oracle.
@@ -331,24 +645,30 @@ class Oracle:
             Raises:
                 ValueError: Si la eliminación de registros falla.
         """
+        connection = None
         try:
             # Ejecuta la eliminación.
             connection = self.connect()
-            cursor = connection.cursor()
-            if params:
-                cursor.execute(statement, params)
-            else:
-                cursor.execute(statement)
-            connection.commit()
-
-            # Bandera de proceso Exitoso
-            return True
+            with closing(connection.cursor()) as cursor:
+                if params:
+                    cursor.execute(statement, params)
+                else:
+                    cursor.execute(statement)
+                self._commit(connection)
+
+                # Bandera de proceso Exitoso
+                return True
 
         except Exception as e:
 
             # Lanzar excepcion
             raise ValueError(f"[DB Oracle]: Delete Fallido, {e}")
 
+        finally:
+
+            # Devolver la sesion al pool.
+            self.release(connection)
+
     def packageProcess(self, spname, paramsIn=[], paramsOut=[]):
         """
             Método para ejecutar procedimientos en paquetes de la base de datos Oracle.
@@ -364,24 +684,29 @@ class Oracle:
             Raises:
                 ValueError: Si la ejecución del procedimiento falla.
         """
+        connection = None
         try:
             # Ejecuta la eliminación.
             connection = self.connect()
-            cursor = connection.cursor()
-
-            # Define las variables de enlace para los parámetros de salida
-            bind_vars = [cursor.var(t) for t in paramsOut]
+            with closing(connection.cursor()) as cursor:
+                # Define las variables de enlace para los parámetros de salida
+                bind_vars = [cursor.var(t) for t in paramsOut]
 
-            # Ejecuta el procedimiento almacenado con los parámetros de entrada y salida
-            cursor.callproc(str(spname).lower(), paramsIn + bind_vars)
+                # Ejecuta el procedimiento almacenado con los parámetros de entrada y salida
+                cursor.callproc(str(spname).lower(), paramsIn + bind_vars)
 
-            # Recupera los valores de los parámetros de salida
-            output_values = [var.getvalue() for var in bind_vars]
+                # Recupera los valores de los parámetros de salida
+                output_values = [var.getvalue() for var in bind_vars]
 
-            # Retorna los valores de los parámetros de salida
-            return output_values
+                # Retorna los valores de los parámetros de salida
+                return output_values
 
         except Exception as e:
 
             # Lanzar excepcion
-            raise ValueError(f"[DB Oracle]: Delete Fallido, {e}")
\ No newline at end of file
+            raise ValueError(f"[DB Oracle]: Delete Fallido, {e}")
+
+        finally:
+
+            # Devolver la sesion al pool.
+            self.release(connection)
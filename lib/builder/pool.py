@@ -0,0 +1,272 @@
+import time
+import threading
+from collections import deque
+from flask import g, has_app_context
+
+class ConnectionPool:
+    """
+    Pool acotado de conexiones a base de datos.
+
+    Mantiene un máximo de conexiones abiertas, reutiliza las conexiones libres y descarta
+    las que superan el tiempo de inactividad o el tiempo de vida máximo. Antes de entregar
+    una conexión inactiva se valida con la función de validación configurada.
+
+    Es seguro para hilos y se utiliza en los drivers que no cuentan con un pool nativo.
+    """
+
+    # Llave del contexto de Flask donde se alojan las conexiones de la solicitud.
+    _scope = '_pooled_connections'
+
+    def __init__(self, factory, max_size=10, timeout=30, idle_timeout=300, max_lifetime=1800, ping_interval=30, validate=None, reset=None):
+        """
+        Inicializa el pool de conexiones.
+
+        Args:
+            factory (callable): Función que crea una nueva conexión.
+            max_size (int): Máximo de conexiones abiertas (en uso + libres).
+            timeout (int): Segundos máximos de espera por una conexión libre.
+            idle_timeout (int): Segundos de inactividad tras los cuales se cierra una conexión libre (0 = nunca).
+            max_lifetime (int): Segundos de vida máxima de una conexión (0 = ilimitado).
+            ping_interval (int): Segundos de inactividad tras los cuales se valida la conexión al entregarla (0 = siempre).
+            validate (callable, optional): Función que recibe la conexión y lanza excepción si no es válida.
+            reset (callable, optional): Función que limpia el estado de la conexión al devolverla al pool.
+        """
+        if int(max_size) <= 0:
+            raise ValueError("[DB Pool]: El tamaño máximo del pool debe ser un entero positivo mayor que cero.")
+
+        self._factory = factory
+        self._validate = validate
+        self._reset = reset
+        self.max_size = int(max_size)
+        self.timeout = float(timeout)
+        self.idle_timeout = float(idle_timeout)
+        self.max_lifetime = float(max_lifetime)
+        self.ping_interval = float(ping_interval)
+
+        # Conexiones libres como (conexion, ultimo uso).
+        self._idle = deque()
+        self._born = {}
+        self._in_use = 0
+        self._closed = False
+        self._condition = threading.Condition()
+
+        # Estadisticas de espera.
+        self._waits = 0
+        self._wait_time = 0.0
+
+    def _expired(self, connection, now):
+        """Indica si la conexión superó su tiempo de vida máximo."""
+        born = self._born.get(id(connection), now)
+        return self.max_lifetime > 0 and now - born >= self.max_lifetime
+
+    def _evict(self, now):
+        """Retira del pool las conexiones libres inactivas o vencidas (requiere el bloqueo)."""
+        evicted = []
+        for item in list(self._idle):
+            connection, last_used = item
+            if (self.idle_timeout > 0 and now - last_used >= self.idle_timeout) or self._expired(connection, now):
+                self._idle.remove(item)
+                self._born.pop(id(connection), None)
+                evicted.append(connection)
+        return evicted
+
+    def _discard(self, connections):
+        """Cierra las conexiones retiradas del pool."""
+        for connection in connections:
+            try:
+                connection.close()
+            except Exception:
+                pass
+
+    def _create(self):
+        """Crea una nueva conexión y registra su marca de creación."""
+        connection = self._factory()
+        with self._condition:
+            self._born[id(connection)] = time.monotonic()
+        return connection
+
+    def acquire(self):
+        """
+        Toma una conexión del pool, esperando si todas se encuentran en uso.
+
+        Returns:
+            object: Una conexión lista para usar.
+
+        Raises:
+            RuntimeError: Si el pool está cerrado o se agota el tiempo de espera.
+        """
+        start = time.monotonic()
+        deadline = start + self.timeout
+        waited = False
+        evicted = []
+
+        with self._condition:
+            while True:
+
+                if self._closed:
+                    raise RuntimeError("[DB Pool]: El pool de conexiones se encuentra cerrado.")
+
+                now = time.monotonic()
+                evicted += self._evict(now)
+
+                # Reutilizar la conexion libre usada mas recientemente.
+                if self._idle:
+                    connection, last_used = self._idle.pop()
+                    self._in_use += 1
+                    break
+
+                # Abrir una nueva conexion si hay cupo.
+                if self._in_use + len(self._idle) < self.max_size:
+                    connection, last_used = None, None
+                    self._in_use += 1
+                    break
+
+                remaining = deadline - now
+                if remaining <= 0:
+                    raise RuntimeError(f"[DB Pool]: Tiempo de espera agotado ({self.timeout:g}s) por una conexión libre.")
+
+                waited = True
+                self._condition.wait(remaining)
+
+            if waited:
+                self._waits += 1
+                self._wait_time += time.monotonic() - start
+
+        self._discard(evicted)
+
+        try:
+
+            # Validar la conexion libre si estuvo inactiva mas del intervalo.
+            if connection is not None and self._validate is not None and time.monotonic() - last_used >= self.ping_interval:
+                try:
+                    self._validate(connection)
+                except Exception:
+                    with self._condition:
+                        self._born.pop(id(connection), None)
+                    self._discard([connection])
+                    connection = None
+
+            if connection is None:
+                connection = self._create()
+
+            return connection
+
+        except Exception:
+
+            # Liberar el cupo reservado.
+            with self._condition:
+                self._in_use -= 1
+                self._condition.notify()
+            raise
+
+    def release(self, connection, discard=False):
+        """
+        Devuelve una conexión al pool.
+
+        Args:
+            connection (object): La conexión tomada con acquire().
+            discard (bool): Si es True la conexión se cierra en lugar de reutilizarse.
+        """
+        if connection is None:
+            return
+
+        if not discard and self._reset is not None:
+            try:
+                self._reset(connection)
+            except Exception:
+                discard = True
+
+        with self._condition:
+            self._in_use -= 1
+            if discard or self._closed or self._expired(connection, time.monotonic()):
+                self._born.pop(id(connection), None)
+                connection_to_close = connection
+            else:
+                self._idle.append((connection, time.monotonic()))
+                connection_to_close = None
+            self._condition.notify()
+
+        if connection_to_close is not None:
+            self._discard([connection_to_close])
+
+    def close(self):
+        """
+        Cierra todas las conexiones libres y evita nuevas entregas.
+        Las conexiones en uso se cierran al ser devueltas.
+        """
+        with self._condition:
+            self._closed = True
+            connections = [connection for connection, _ in self._idle]
+            self._idle.clear()
+            self._born.clear()
+            self._condition.notify_all()
+
+        self._discard(connections)
+
+    def stats(self):
+        """
+        Retorna las estadísticas actuales del pool.
+
+        Returns:
+            dict: Conexiones en uso, libres, tamaño, máximo y tiempos de espera (segundos).
+        """
+        with self._condition:
+            return {
+                'in_use': self._in_use,
+                'idle': len(self._idle),
+                'size': self._in_use + len(self._idle),
+                'max': self.max_size,
+                'waits': self._waits,
+                'wait_time': round(self._wait_time, 6),
+                'wait_avg': round(self._wait_time / self._waits, 6) if self._waits else 0.0
+            }
+
+    @staticmethod
+    def scoped(key, pool):
+        """
+        Retorna la conexión del pool asociada a la solicitud Flask en curso.
+        La conexión se toma en el primer uso y se devuelve al finalizar la solicitud.
+
+        Args:
+            key (str): Identificador de la conexión (driver y nombre).
+            pool (ConnectionPool): El pool del cual tomar la conexión.
+
+        Returns:
+            object: La conexión de la solicitud, o None si no hay un contexto de Flask activo.
+        """
+        if not has_app_context():
+            return None
+
+        connections = g.setdefault(ConnectionPool._scope, {})
+        if key not in connections:
+            connections[key] = (pool, pool.acquire())
+
+        return connections[key][1]
+
+    @staticmethod
+    def current(key):
+        """
+        Retorna la conexión ya reservada para la solicitud Flask en curso, sin tomar una nueva.
+
+        Args:
+            key (str): Identificador de la conexión (driver y nombre).
+
+        Returns:
+            object: La conexión de la solicitud, o None si no existe.
+        """
+        if not has_app_context():
+            return None
+
+        scoped = g.get(ConnectionPool._scope) or {}
+        return scoped[key][1] if key in scoped else None
+
+    @staticmethod
+    def teardown(exception=None):
+        """
+        Devuelve a sus pools todas las conexiones tomadas durante la solicitud Flask.
+        Se registra en el Kernel como manejador de fin de contexto.
+        """
+        connections = g.pop(ConnectionPool._scope, None) if has_app_context() else None
+        if connections:
+            for pool, connection in connections.values():
+                pool.release(connection)
@@ -1,8 +1,15 @@
+import re
+import uuid
 import pyodbc
+import threading
+from itertools import chain
+from contextlib import contextmanager, closing
 from typing import Dict
 from lib.environment.config import Config
-from lib.builder.collections import Collection
+from lib.builder.collections import Collection, LazyCollection
 from lib.builder.fetch import Fetch
+from lib.builder.cache import QueryCache, CachedQuery
+from lib.builder.pool import ConnectionPool
 
 class SQLServer:
     """
@@ -11,7 +18,10 @@ class SQLServer:
 
     # Diccionario para almacenar las instancias de conexiones SQL Server.
     _instances: Dict[str, 'SQLServer'] = {}
-    connection = None
+    _lock = threading.Lock()
+
+    # Pool de conexiones de la instancia.
+    _pool = None
 
     def __new__(cls, connection='default'):
         """
@@ -27,9 +37,12 @@ class SQLServer:
             SQLServer: La instancia existente o una nueva instancia de la clase SQLServer.
 
         """
-        if connection not in cls._instances:
-            cls._instances[connection] = super().__new__(cls)
-        return cls._instances[connection]
+        with cls._lock:
+            if connection not in cls._instances:
+                instance = super().__new__(cls)
+                instance._local = threading.local()
+                cls._instances[connection] = instance
+            return cls._instances[connection]
 
     def __init__(self, connection='default'):
         """
@@ -45,6 +58,9 @@ class SQLServer:
             RuntimeError: Si no se encuentra una configuración de base de datos SQL Server con el nombre proporcionado.
         """
 
+        # Guardar el nombre de la conexion
+        self.name_connection = connection
+
         # Determinar el camino de conexion.
         dataConnection = Config.database(f"sqlserver.{connection}")
 
@@ -62,50 +78,246 @@ class SQLServer:
         # Cadena de conexión.
         self.conn_str = f'DRIVER={{ODBC Driver 17 for SQL Server}};SERVER={self.host},{self.port};DATABASE={self.database};UID={self.username};PWD={self.password};Charset=UTF-8'
 
+        # Parametros del pool de conexiones.
+        self.pool_config = dataConnection.get("pool") or {}
+
+    def pool(self):
+        """
+        Método para obtener el pool de conexiones de la instancia.
+
+        El pool se crea una única vez por nombre de conexión y es compartido por todos los hilos.
+        Aplica el máximo de conexiones, el tiempo de inactividad, el tiempo de vida y la consulta
+        de validación definidos en la configuración de la conexión.
+
+        Returns:
+            ConnectionPool: El pool de conexiones de la instancia.
+        """
+        if self._pool is None:
+
+            with self._lock:
+
+                if self._pool is None:
+
+                    config = self.pool_config
+
+                    self._pool = ConnectionPool(
+                        factory=self._create,
+                        max_size=config.get("max", 10),
+                        timeout=config.get("timeout", 30),
+                        idle_timeout=config.get("idle_timeout", 300),
+                        max_lifetime=config.get("max_lifetime", 1800),
+                        ping_interval=config.get("ping_interval", 30),
+                        validate=self._validate if config.get("validation", "SELECT 1") else None,
+                        reset=lambda connection: connection.rollback()
+                    )
+
+        return self._pool
+
+    def _validate(self, connection):
+        """
+        Método para validar una conexión libre del pool con la consulta de validación configurada.
+
+        Args:
+            connection (pyodbc.Connection): La conexión a validar.
+        """
+        with closing(connection.cursor()) as cursor:
+            cursor.execute(self.pool_config.get("validation", "SELECT 1")).fetchall()
+
+    def _create(self):
+        """
+        Método para crear una nueva conexión física a la base de datos SQL Server.
+
+        Returns:
+            pyodbc.Connection: La conexión creada.
+
+        Raises:
+            ValueError: Si la conexión a la base de datos SQL Server falla.
+        """
+        try:
+
+            # Crea la conexión a la base de datos SQL Server.
+            return pyodbc.connect(self.conn_str)
+
+        except Exception as e:
+
+            # Lanzar Excepcion
+            raise ValueError(f"[DB SQL Server]: Conexión fallida, {e}")
+
     def connect(self):
         """
-        Método para establecer la conexión a la base de datos SQL Server.
+        Método para obtener una conexión a la base de datos SQL Server.
 
-        Este método intenta crear una conexión a la base de datos SQL Server utilizando la cadena de conexión
-        configurada en la instancia de la clase. Si la conexión no ha sido establecida previamente, se crea
-        una nueva conexión utilizando la cadena de conexión y se devuelve.
+        Dentro de un bloque session() retorna la conexión reservada para el bloque, dentro de una
+        solicitud Flask retorna la conexión reservada para la solicitud (se devuelve al finalizarla)
+        y en cualquier otro caso toma una conexión del pool que debe devolverse con release().
 
         Returns:
-            pyodbc.Connection: La conexión establecida a la base de datos SQL Server.
+            pyodbc.Connection: La conexión a la base de datos SQL Server.
 
         Raises:
             ValueError: Si la conexión a la base de datos SQL Server falla.
+            RuntimeError: Si se agota el tiempo de espera por una conexión libre.
+        """
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None:
+            return connection
+
+        connection = ConnectionPool.scoped(f"sqlserver.{self.name_connection}", self.pool())
+        if connection is not None:
+            return connection
+
+        return self.pool().acquire()
+
+    def release(self, connection):
         """
-        if not self.connection or self.connection is None:
+        Método para devolver al pool una conexión tomada con connect().
+
+        Las conexiones reservadas para un bloque session() o para la solicitud Flask
+        en curso no se devuelven hasta que finaliza su alcance.
+
+        Args:
+            connection (pyodbc.Connection): La conexión a devolver.
+        """
+        if connection is None or connection is getattr(self._local, 'connection', None):
+            return
+
+        if connection is ConnectionPool.current(f"sqlserver.{self.name_connection}"):
+            return
+
+        self.pool().release(connection)
+
+    def reserved(self):
+        """
+        Retorna la conexión ya reservada por el hilo actual: la del bloque session() o la de la
+        solicitud Flask en curso, sin tomar una nueva del pool.
+
+        Returns:
+            pyodbc.Connection: La conexión reservada, o None si no existe.
+        """
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None:
+            return connection
+
+        return ConnectionPool.current(f"sqlserver.{self.name_connection}")
+
+    @contextmanager
+    def session(self):
+        """
+        Reserva una conexión para todas las operaciones del bloque en el hilo actual.
+
+        Dentro de una solicitud Flask el bloque usa la conexión de la solicitud (ConnectionPool.scoped),
+        de modo que una solicitud nunca ocupa dos conexiones del pool; fuera de ella toma una
+        conexión del pool y la devuelve al finalizar el bloque.
+
+        Uso:
+            with SQLServer().session() as db:
+                db.select(...)
+
+        Returns:
+            SQLServer: La instancia actual.
+        """
+        if getattr(self._local, 'connection', None) is not None:
+            yield self
+            return
+
+        # Conexion de la solicitud Flask en curso (se devuelve al finalizar la solicitud).
+        connection = ConnectionPool.scoped(f"sqlserver.{self.name_connection}", self.pool())
+        owned = connection is None
+        if owned:
+            connection = self.pool().acquire()
+
+        self._local.connection = connection
+
+        try:
+            yield self
+        finally:
+            self._local.connection = None
+            if owned:
+                self.pool().release(connection)
+
+    @contextmanager
+    def transaction(self):
+        """
+        Ejecuta todas las operaciones del bloque en una sola transacción del hilo actual.
+
+        Las sentencias del bloque no se confirman una a una: se hace un único commit al finalizar
+        el bloque y un rollback si ocurre cualquier excepción. Los bloques anidados hacen parte
+        de la transacción exterior.
+
+        Uso:
+            with SQLServer().transaction() as db:
+                db.insert(...)
+                db.update(...)
+
+        Returns:
+            SQLServer: La instancia actual.
+        """
+        if self.in_transaction():
+            yield self
+            return
+
+        with self.session():
+
+            connection = self._local.connection
+            self._local.transaction = True
+
             try:
+                yield self
+                connection.commit()
+            except Exception:
+                connection.rollback()
+                raise
+            finally:
+                self._local.transaction = False
+
+    def in_transaction(self):
+        """
+        Indica si el hilo actual se encuentra dentro de un bloque transaction().
 
-                # Crea la conexión a la base de datos SQL Server.
-                self.connection = pyodbc.connect(self.conn_str)
+        Returns:
+            bool: True si hay una transacción en curso.
+        """
+        return getattr(self._local, 'transaction', False)
 
-            except Exception as e:
+    def _commit(self, connection):
+        """
+        Confirma la sentencia ejecutada, salvo dentro de un bloque transaction() (se confirma al finalizarlo).
 
-                # Lanzar Excepcion
-                raise ValueError(f"[DB SQL Server]: Conexión fallida, {e}")
+        Args:
+            connection (pyodbc.Connection): La conexión de la sentencia.
+        """
+        if not self.in_transaction():
+            connection.commit()
 
-        return self.connection
+    def stats(self):
+        """
+        Método para obtener las estadísticas del pool de conexiones.
+
+        Returns:
+            dict: Conexiones en uso, libres, tamaño y tiempos de espera.
+        """
+        return self.pool().stats()
 
     def close(self):
         """
-        Método para cerrar la conexión a la base de datos SQL Server.
+        Método para cerrar el pool de conexiones a la base de datos SQL Server.
 
-        Este método verifica si hay una conexión abierta y, si es así, la cierra. Luego, establece la
-        variable de conexión a None para indicar que no hay una conexión activa.
+        Cierra las conexiones libres del pool (las conexiones en uso se cierran al ser devueltas)
+        y descarta la instancia, de modo que SQLServer(nombre) cree un pool nuevo.
 
         Returns:
             None
         """
-        if self.connection:
+        if self._pool is not None:
+
+            # Cierra el pool.
+            self._pool.close()
 
-            # Cierra la conexión.
-            self.connection.close()
+            # Vaciar Valor del pool.
+            self._pool = None
 
-            # Valicar la conexion.
-            self.connection = None
+        with self._lock:
+            self._instances.pop(self.name_connection, None)
 
     def query(self, statement, params=None):
         """
@@ -124,6 +336,7 @@ class SQLServer:
         Raises:
             ValueError: Si la ejecución de la consulta SQL falla.
         """
+        connection = None
         try:
             # Ejecucion de Query
             connection = self.connect()
@@ -134,10 +347,13 @@ class SQLServer:
                 cursor.execute(statement)
 
             # Retorna una instancia de la clase Fetch
-            return Fetch(cursor=cursor)
+            return Fetch(cursor=cursor, release=lambda: self.release(connection))
 
         except Exception as e:
 
+            # Devolver la conexion al pool.
+            self.release(connection)
+
             # Lanzar excepcion
             raise ValueError(f"[SQLServer]: Query Fallido, {e}")
 
@@ -158,32 +374,39 @@ class SQLServer:
         Raises:
             ValueError: Si la ejecución de la sentencia SQL falla.
         """
+        connection = None
         try:
             # Ejecucion de la sentencia.
             connection = self.connect()
-            cursor = connection.cursor()
-            if params:
-                cursor.execute(statement, params)
-            else:
-                cursor.execute(statement)
-            connection.commit()
-
-            # Retorna true como bandera de exito.
-            return True
+            with closing(connection.cursor()) as cursor:
+                if params:
+                    cursor.execute(statement, params)
+                else:
+                    cursor.execute(statement)
+                self._commit(connection)
+
+                # Retorna true como bandera de exito.
+                return True
 
         except Exception as e:
 
             # Lanzar excepcion
             raise ValueError(f"[SQLServer]: Sentencia Fallida, {e}")
 
-    def executemany(self, statement, params):
+        finally:
+
+            # Devolver la conexion al pool.
+            self.release(connection)
+
+    def executemany(self, statement, params, batch_size=None):
         """
-            Método para ejecutar una sentencia en la base de datos Oracle.
+            Método para ejecutar una sentencia en la base de datos SQL Server.
             Ejecucion masiva.
 
             Args:
                 statement (str): La sentencia SQL a ejecutar.
-                params (tuple): Parámetros para la sentencia SQL (si es necesario). Por defecto, es None.
+                params (iterable): Parámetros para la sentencia SQL (si es necesario). Por defecto, es None.
+                batch_size (int, optional): Si se indica, la sentencia se ejecuta y confirma por lotes de este tamaño.
 
             Returns:
                 bool: True si la ejecución fue exitosa.
@@ -191,22 +414,221 @@ class SQLServer:
             Raises:
                 ValueError: Si la sentencia SQL falla.
         """
+        connection = None
         try:
             # Ejecucion de la sentencia.
             connection = self.connect()
-            cursor = connection.cursor()
-            cursor.executemany(statement, params)
-            connection.commit()
-
-            # Retorna true como bandera de exito.
-            return True
+            with closing(connection.cursor()) as cursor:
+                if batch_size:
+                    for batch in LazyCollection(params).chunk_iter(batch_size):
+                        cursor.executemany(statement, batch)
+                        self._commit(connection)
+                else:
+                    cursor.executemany(statement, params)
+                    self._commit(connection)
+
+                # Retorna true como bandera de exito.
+                return True
 
         except Exception as e:
 
             # Lanzar excepcion
             raise ValueError(f"[SQLServer]: Sentencia Fallida, {e}")
 
-    def select(self, statement, params=None):
+        finally:
+
+            # Devolver la conexion al pool.
+            self.release(connection)
+
+    def _bulk_rows(self, table, rows, columns=None):
+        """
+        Prepara las filas de una carga masiva.
+
+        Args:
+            table (str): Nombre de la tabla destino.
+            rows (iterable): Collection, generador o lista de diccionarios o tuplas.
+            columns (list, optional): Columnas destino; si se omiten se usan las llaves de la primera fila.
+
+        Returns:
+            tuple: Las columnas y una LazyCollection con cada fila como tupla, o (None, None) si no hay filas.
+
+        Raises:
+            ValueError: Si no es posible determinar las columnas o algún identificador no es válido.
+        """
+        iterator = iter(rows)
+        first = next(iterator, None)
+        if first is None:
+            return None, None
+
+        if columns is None:
+            if not isinstance(first, dict):
+                raise ValueError("[DB SQL Server]: Debe indicar las columnas cuando las filas no son diccionarios.")
+            columns = list(first.keys())
+
+        # Validar los identificadores que se interpolan en la sentencia.
+        for name in [table] + list(columns):
+            if not re.fullmatch(r'[A-Za-z_#@][\w$#@]*(\.[A-Za-z_][\w$#@]*){0,2}', str(name)):
+                raise ValueError(f"[DB SQL Server]: Identificador no válido para la carga masiva: {name}")
+
+        values = LazyCollection(chain([first], iterator)).map(
+            lambda row: tuple(row[column] for column in columns) if isinstance(row, dict) else tuple(row)
+        )
+
+        return list(columns), values
+
+    def bulk_insert(self, table, rows, batch_size=10000, columns=None):
+        """
+        Método para realizar cargas masivas en la base de datos SQL Server.
+
+        Usa fast_executemany de pyodbc (los parámetros de cada lote viajan en un solo envío)
+        y confirma por lotes; nunca se mantiene en memoria más de un lote.
+
+        Args:
+            table (str): Nombre de la tabla destino (puede incluir el esquema).
+            rows (iterable): Collection, generador o lista de diccionarios o tuplas.
+            batch_size (int, optional): Filas por lote (un envío y un commit por lote). Por defecto, es 10000.
+            columns (list, optional): Columnas destino. Obligatorias si las filas son tuplas.
+
+        Returns:
+            dict: Resumen de la carga con las filas insertadas (rows) y los lotes (batches).
+
+        Raises:
+            ValueError: Si los parámetros no son válidos o la carga falla; los lotes anteriores quedan confirmados.
+        """
+        if batch_size <= 0:
+            raise ValueError("[DB SQL Server]: El tamaño de lote debe ser un entero positivo mayor que cero.")
+
+        report = {'rows': 0, 'batches': 0}
+
+        columns, values = self._bulk_rows(table, rows, columns)
+        if columns is None:
+            return report
+
+        statement = f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)})"
+
+        connection = None
+        try:
+            # Ejecucion de la carga por lotes.
+            connection = self.connect()
+            with closing(connection.cursor()) as cursor:
+                cursor.fast_executemany = True
+
+                for batch in values.chunk_iter(batch_size):
+                    cursor.executemany(statement, batch)
+                    self._commit(connection)
+
+                    report['rows'] += len(batch)
+                    report['batches'] += 1
+
+                # Retorna el resumen de la carga.
+                return report
+
+        except Exception as e:
+
+            # Lanzar excepcion
+            raise ValueError(f"[DB SQL Server]: Carga Masiva Fallida en la fila {report['rows']}, {e}")
+
+        finally:
+
+            # Devolver la conexion al pool.
+            self.release(connection)
+
+    def bulk_upsert(self, table, rows, keys, batch_size=10000, columns=None):
+        """
+        Método para insertar o actualizar registros de forma masiva en la base de datos SQL Server.
+
+        Cada lote se carga con fast_executemany en una tabla temporal con la estructura de la tabla
+        destino y se aplica con una sola sentencia MERGE: las filas cuyas llaves existen se actualizan
+        y las demás se insertan. Las llaves no deben repetirse dentro de un mismo lote.
+
+        Args:
+            table (str): Nombre de la tabla destino (puede incluir el esquema).
+            rows (iterable): Collection, generador o lista de diccionarios o tuplas.
+            keys (list): Columnas que identifican cada registro.
+            batch_size (int, optional): Filas por lote (un MERGE y un commit por lote). Por defecto, es 10000.
+            columns (list, optional): Columnas destino. Obligatorias si las filas son tuplas.
+
+        Returns:
+            dict: Resumen de la carga con las filas procesadas (rows), las filas afectadas por el MERGE (affected) y los lotes (batches).
+
+        Raises:
+            ValueError: Si los parámetros no son válidos o la carga falla; los lotes anteriores quedan confirmados.
+        """
+        if batch_size <= 0:
+            raise ValueError("[DB SQL Server]: El tamaño de lote debe ser un entero positivo mayor que cero.")
+
+        if isinstance(keys, str):
+            keys = [keys]
+
+        report = {'rows': 0, 'affected': 0, 'batches': 0}
+
+        columns, values = self._bulk_rows(table, rows, columns)
+        if columns is None:
+            return report
+
+        if not keys or any(key not in columns for key in keys):
+            raise ValueError("[DB SQL Server]: Las llaves del upsert deben hacer parte de las columnas de la carga.")
+
+        stage = f"#stage_{uuid.uuid4().hex[:12]}"
+        listed = ', '.join(columns)
+        updates = [column for column in columns if column not in keys]
+
+        # Tabla temporal con los tipos de la tabla destino (el UNION ALL evita copiar la propiedad IDENTITY).
+        create = f"SELECT TOP 0 {listed} INTO {stage} FROM {table} UNION ALL SELECT TOP 0 {listed} FROM {table}"
+        insert = f"INSERT INTO {stage} ({listed}) VALUES ({', '.join('?' for _ in columns)})"
+        merge = (
+            f"MERGE INTO {table} WITH (HOLDLOCK) AS target USING {stage} AS source "
+            f"ON {' AND '.join(f'target.{key} = source.{key}' for key in keys)} "
+            + (f"WHEN MATCHED THEN UPDATE SET {', '.join(f'target.{column} = source.{column}' for column in updates)} " if updates else "")
+            + f"WHEN NOT MATCHED THEN INSERT ({listed}) VALUES ({', '.join(f'source.{column}' for column in columns)});"
+        )
+
+        connection = None
+        cursor = None
+        try:
+            # Ejecucion de la carga por lotes.
+            connection = self.connect()
+            cursor = connection.cursor()
+            cursor.fast_executemany = True
+            cursor.execute(create)
+
+            for batch in values.chunk_iter(batch_size):
+                cursor.execute(f"TRUNCATE TABLE {stage}")
+                cursor.executemany(insert, batch)
+                cursor.execute(merge)
+                affected = cursor.rowcount
+                self._commit(connection)
+
+                report['rows'] += len(batch)
+                report['affected'] += affected if affected and affected > 0 else 0
+                report['batches'] += 1
+
+            # Retorna el resumen de la carga.
+            return report
+
+        except Exception as e:
+
+            # Lanzar excepcion
+            raise ValueError(f"[DB SQL Server]: Upsert Masivo Fallido en la fila {report['rows']}, {e}")
+
+        finally:
+
+            # Eliminar la tabla temporal antes de devolver la conexion al pool.
+            if cursor is not None:
+                try:
+                    if not self.in_transaction():
+                        connection.rollback()
+                    cursor.execute(f"IF OBJECT_ID('tempdb..{stage}') IS NOT NULL DROP TABLE {stage}")
+                    self._commit(connection)
+                except Exception:
+                    pass
+                finally:
+                    cursor.close()
+
+            # Devolver la conexion al pool.
+            self.release(connection)
+
+    def select(self, statement, params=None, columnar=False):
         """
         Método para ejecutar una consulta SELECT en la base de datos SQL Server y devolver los resultados como una lista de diccionarios.
 
@@ -216,6 +638,7 @@ class SQLServer:
         Args:
             statement (str): La consulta SELECT a ejecutar.
             params (tuple, optional): Parámetros para la consulta SELECT (si es necesario). Por defecto, es None.
+            columnar (bool, optional): Si es True retorna una colección columnar (encabezados únicos y valores por columna). Por defecto, es False.
 
         Returns:
             list: Una lista de diccionarios representando los resultados de la consulta SELECT.
@@ -224,27 +647,63 @@ class SQLServer:
             ValueError: Si la ejecución de la consulta SELECT falla.
         """
 
+        connection = None
         try:
             # Ejecucion Select.
             connection = self.connect()
-            cursor = connection.cursor()
-            if params:
-                cursor.execute(statement, params)
-            else:
-                cursor.execute(statement)
+            with closing(connection.cursor()) as cursor:
+                if params:
+                    cursor.execute(statement, params)
+                else:
+                    cursor.execute(statement)
+
+                # Coleccion columnar compacta en memoria.
+                if columnar:
+                    return Fetch(cursor=cursor).columnar()
 
-            # Convertir a diccionarios
-            headers = [desc[0] for desc in cursor.description]
-            rows = [dict(zip(headers, row)) for row in cursor.fetchall()]
+                # Convertir a diccionarios
+                headers = [desc[0] for desc in cursor.description]
+                rows = [dict(zip(headers, row)) for row in cursor.fetchall()]
 
-            # Retorno de valores asociados.
-            return Collection(data=rows)
+                # Retorno de valores asociados.
+                return Collection(data=rows)
 
         except Exception as e:
 
             # Lanzar excepcion
             raise ValueError(f"[DB SQL Server]: Select Fallido, {e}")
 
+        finally:
+
+            # Devolver la conexion al pool.
+            self.release(connection)
+
+    def cached(self, ttl=60, tags=None):
+        """
+            Método para resolver las consultas SELECT a través del cache de resultados.
+            Ejemplo: SQLServer().cached(ttl=60, tags='catalogos').select(sql, params)
+
+            Args:
+                ttl (int, optional): Segundos de vida de los resultados. Por defecto, es 60.
+                tags (str|list, optional): Etiqueta o etiquetas para invalidar los resultados con forget().
+
+            Returns:
+                CachedQuery: Envoltura de la conexión cuyo select() usa el cache.
+        """
+        return CachedQuery(builder=self, prefix=f"sqlserver.{self.name_connection}", ttl=ttl, tags=tags)
+
+    def forget(self, *tags):
+        """
+            Método para invalidar los resultados almacenados con las etiquetas indicadas.
+
+            Args:
+                *tags (str): Las etiquetas a invalidar.
+
+            Returns:
+                int: Cantidad de resultados eliminados del cache.
+        """
+        return QueryCache.forget(*tags)
+
     def insert(self, statement, params=None):
         """
         Método para realizar una inserción de datos en la base de datos SQL Server.
@@ -263,28 +722,34 @@ class SQLServer:
         Raises:
             ValueError: Si la inserción de datos falla.
         """
+        connection = None
         try:
             # Ejecucion inserción.
             connection = self.connect()
-            cursor = connection.cursor()
-            if params:
-                cursor.execute(statement, params)
-            else:
-                cursor.execute(statement)
-            connection.commit()
-
-            # Retorna el ultimo ID insertado si es aplicable
-            if cursor.lastrowid is not None:
-                return cursor.lastrowid
-            else:
-                # Si la inserción no generó un ID, devuelve un valor indicativo, como True
-                return True
+            with closing(connection.cursor()) as cursor:
+                if params:
+                    cursor.execute(statement, params)
+                else:
+                    cursor.execute(statement)
+                self._commit(connection)
+
+                # Retorna el ultimo ID insertado si es aplicable
+                if cursor.lastrowid is not None:
+                    return cursor.lastrowid
+                else:
+                    # Si la inserción no generó un ID, devuelve un valor indicativo, como True
+                    return True
 
         except Exception as e:
 
             # Lanzar excepcion
             raise ValueError(f"[DB SQL Server]: Insert Fallido, {e}")
 
+        finally:
+
+            # Devolver la conexion al pool.
+            self.release(connection)
+
     def update(self, statement, params=None):
         """
         Método para actualizar registros en la base de datos SQL Server.
@@ -302,24 +767,30 @@ class SQLServer:
         Raises:
             ValueError: Si la actualización de los registros falla.
         """
+        connection = None
         try:
             # Ejecucion de la actualizacion.
             connection = self.connect()
-            cursor = connection.cursor()
-            if params:
-                cursor.execute(statement, params)
-            else:
-                cursor.execute(statement)
-            connection.commit()
-
-            # Retorna true como bandera de exito.
-            return True
+            with closing(connection.cursor()) as cursor:
+                if params:
+                    cursor.execute(statement, params)
+                else:
+                    cursor.execute(statement)
+                self._commit(connection)
+
+                # Retorna true como bandera de exito.
+                return True
 
         except Exception as e:
 
             # Lanzar excepcion
             raise ValueError(f"[DB SQL Server]: Update Fallido, {e}")
 
+        finally:
+
+            # Devolver la conexion al pool.
+            self.release(connection)
+
     def delete(self, statement, params=None):
         """
         Método para eliminar un registro de la base de datos SQL Server.
@@ -337,20 +808,26 @@ class SQLServer:
         Raises:
             ValueError: Si la eliminación del registro falla.
         """
+        connection = None
         try:
             # Ejecuta la eliminación.
             connection = self.connect()
-            cursor = connection.cursor()
-            if params:
-                cursor.execute(statement, params)
-            else:
-                cursor.execute(statement)
-            connection.commit()
-
-            # Bandera de proceso Exitoso
-            return True
+            with closing(connection.cursor()) as cursor:
+                if params:
+                    cursor.execute(statement, params)
+                else:
+                    cursor.execute(statement)
+                self._commit(connection)
+
+                # Bandera de proceso Exitoso
+                return True
 
         except Exception as e:
 
             # Lanzar excepcion
-            raise ValueError(f"[DB SQL Server]: Delete Fallido, {e}")
\ No newline at end of file
+            raise ValueError(f"[DB SQL Server]: Delete Fallido, {e}")
+        finally:
+
+            # Devolver la conexion al pool.
+            self.release(connection)
+
@@ -0,0 +1,272 @@
+import os
+import time
+import pickle
+import sqlite3
+import threading
+from collections import OrderedDict
+from lib.clarity.paths import Paths
+from lib.environment.config import Config
+
+class MemoryStore:
+    """
+    Almacen de cache en memoria del proceso con expiración por TTL y desalojo LRU.
+
+    Es seguro para hilos. Cada worker tiene su propio almacen; para compartir entradas
+    entre procesos se utiliza SQLiteStore.
+    """
+
+    def __init__(self, size=1024, on_evict=None):
+        """
+        Inicializa el almacen.
+
+        Args:
+            size (int): Máximo de entradas; al superarlo se desaloja la menos usada recientemente.
+            on_evict (callable, optional): Función que recibe la llave de cada entrada desalojada por LRU o
+                descartada por expiración (se invoca fuera del bloqueo del almacen).
+        """
+        if int(size) <= 0:
+            raise ValueError("[Cache]: El tamaño del almacen debe ser un entero positivo mayor que cero.")
+
+        self.size = int(size)
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self._on_evict = on_evict
+
+    def _evicted(self, keys):
+        """Notifica las llaves desalojadas o expiradas."""
+        if self._on_evict is not None:
+            for key in keys:
+                self._on_evict(key)
+
+    def get(self, key, default=None):
+        """
+        Retorna el valor almacenado en la llave, o el valor por defecto si no existe o expiró.
+
+        Args:
+            key (str): La llave de la entrada.
+            default (any): Valor a retornar si la entrada no existe.
+
+        Returns:
+            any: El valor almacenado.
+        """
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+
+            expires, value = item
+            expired = expires is not None and expires <= time.time()
+            if expired:
+                del self._data[key]
+            else:
+                self._data.move_to_end(key)
+
+        if expired:
+            self._evicted([key])
+            return default
+
+        return value
+
+    def set(self, key, value, ttl=None):
+        """
+        Almacena un valor.
+
+        Args:
+            key (str): La llave de la entrada.
+            value (any): El valor a almacenar.
+            ttl (int, optional): Segundos de vida de la entrada (None = sin expiración).
+        """
+        expires = time.time() + ttl if ttl else None
+
+        evicted = []
+
+        with self._lock:
+            self._data[key] = (expires, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.size:
+                evicted.append(self._data.popitem(last=False)[0])
+
+        self._evicted(evicted)
+
+    def forget(self, key):
+        """
+        Elimina una entrada.
+
+        Args:
+            key (str): La llave de la entrada.
+
+        Returns:
+            bool: True si la entrada existía.
+        """
+        with self._lock:
+            return self._data.pop(key, None) is not None
+
+    def flush(self):
+        """
+        Elimina todas las entradas del almacen.
+        """
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self):
+        """Cantidad de entradas almacenadas (incluye las expiradas aún no desalojadas)"""
+        return len(self._data)
+
+class SQLiteStore:
+    """
+    Almacen de cache en un archivo SQLite, compartido por todos los procesos de la aplicación
+    (por ejemplo, los workers de gunicorn). Los valores se serializan con pickle.
+    """
+
+    def __init__(self, path, size=1024):
+        """
+        Inicializa el almacen y crea la tabla si no existe.
+
+        Args:
+            path (str): Ruta del archivo SQLite.
+            size (int): Máximo de entradas; al superarlo se desalojan las que expiran primero.
+        """
+        if int(size) <= 0:
+            raise ValueError("[Cache]: El tamaño del almacen debe ser un entero positivo mayor que cero.")
+
+        self.path = path
+        self.size = int(size)
+        self._local = threading.local()
+        self._writes = 0
+
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        connection = self._connection()
+        connection.execute("CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value BLOB NOT NULL, expires REAL)")
+        connection.execute("CREATE INDEX IF NOT EXISTS cache_expires ON cache (expires)")
+        connection.commit()
+
+    def _connection(self):
+        """Retorna la conexión SQLite del hilo actual (se abre en el primer uso)."""
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=30)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            self._local.connection = connection
+        return connection
+
+    def get(self, key, default=None):
+        """
+        Retorna el valor almacenado en la llave, o el valor por defecto si no existe o expiró.
+
+        Args:
+            key (str): La llave de la entrada.
+            default (any): Valor a retornar si la entrada no existe.
+
+        Returns:
+            any: El valor almacenado.
+        """
+        row = self._connection().execute(
+            "SELECT value FROM cache WHERE key = ? AND (expires IS NULL OR expires > ?)",
+            (key, time.time())
+        ).fetchone()
+
+        return pickle.loads(row[0]) if row is not None else default
+
+    def set(self, key, value, ttl=None):
+        """
+        Almacena un valor.
+
+        Args:
+            key (str): La llave de la entrada.
+            value (any): El valor a almacenar.
+            ttl (int, optional): Segundos de vida de la entrada (None = sin expiración).
+        """
+        expires = time.time() + ttl if ttl else None
+        connection = self._connection()
+
+        with connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires) VALUES (?, ?, ?)",
+                (key, pickle.dumps(value, pickle.HIGHEST_PROTOCOL), expires)
+            )
+
+        # Depurar periodicamente las entradas expiradas y el exceso de entradas.
+        self._writes += 1
+        if self._writes % 100 == 0:
+            self.prune()
+
+    def prune(self):
+        """
+        Elimina las entradas expiradas y, si se supera el tamaño, las que expiran primero.
+        """
+        connection = self._connection()
+        with connection:
+            connection.execute("DELETE FROM cache WHERE expires IS NOT NULL AND expires <= ?", (time.time(),))
+            connection.execute(
+                "DELETE FROM cache WHERE key IN (SELECT key FROM cache ORDER BY expires IS NULL, expires LIMIT max(0, (SELECT COUNT(*) FROM cache) - ?))",
+                (self.size,)
+            )
+
+    def forget(self, key):
+        """
+        Elimina una entrada.
+
+        Args:
+            key (str): La llave de la entrada.
+
+        Returns:
+            bool: True si la entrada existía.
+        """
+        connection = self._connection()
+        with connection:
+            return connection.execute("DELETE FROM cache WHERE key = ?", (key,)).rowcount > 0
+
+    def flush(self):
+        """
+        Elimina todas las entradas del almacen.
+        """
+        connection = self._connection()
+        with connection:
+            connection.execute("DELETE FROM cache")
+
+    def __len__(self):
+        """Cantidad de entradas almacenadas (incluye las expiradas aún no depuradas)"""
+        return self._connection().execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+
+class Cache:
+    """
+    Punto de acceso a los almacenes de cache configurados en config/cache.py.
+    Cada almacen se crea una sola vez por proceso.
+    """
+
+    _stores = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def store(driver:str = None):
+        """
+        Retorna el almacen del driver indicado o, si se omite, el del driver por defecto.
+
+        Args:
+            driver (str, optional): 'memory' o 'sqlite'.
+
+        Returns:
+            MemoryStore|SQLiteStore: El almacen de cache.
+
+        Raises:
+            ValueError: Si el driver no es soportado.
+        """
+        driver = driver or Config.cache('driver') or 'memory'
+
+        store = Cache._stores.get(driver)
+        if store is not None:
+            return store
+
+        with Cache._lock:
+            if driver not in Cache._stores:
+                size = Config.cache('size') or 1024
+                if driver == 'memory':
+                    Cache._stores[driver] = MemoryStore(size=size)
+                elif driver == 'sqlite':
+                    path = os.path.join(Paths.base(), Config.cache('path') or os.path.join("bootstrap", "cache", "cache.sqlite"))
+                    Cache._stores[driver] = SQLiteStore(path=path, size=size)
+                else:
+                    raise ValueError(f"[Cache]: El driver de cache '{driver}' no es soportado, use 'memory' o 'sqlite'.")
+
+            return Cache._stores[driver]
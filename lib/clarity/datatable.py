@@ -1,5 +1,9 @@
+import threading
 from lib.builder.oracle import Oracle
-from flask import jsonify
+from lib.cache.store import MemoryStore
+from lib.environment.config import Config
+from lib.builder.collections import LazyCollection
+from flask import jsonify, current_app, Response, stream_with_context
 
 class DataTable:
 
@@ -26,6 +30,20 @@ class DataTable:
     _order_direction = 'ASC'
     _statement = None
     _response = None
+    _windowed = False
+    _total_ttl = 60
+    _keyset = None
+    _after = None
+
+    # Cache de totales sin filtro por vista {(conexion, origen): total}, acotado por LRU y con vencimiento.
+    _totals = None
+    _totals_lock = threading.Lock()
+
+    # Columna auxiliar con el total filtrado en el modo de una sola consulta.
+    _count_column = 'DT_RECORDS_FILTERED'
+
+    # Columna auxiliar con el valor de la llave en el modo keyset.
+    _key_column = 'DT_KEYSET_LAST'
 
     def __init__(self, driver: str, connection='default', serverside=True, request=None):
         """
@@ -77,7 +95,7 @@ class DataTable:
 
         statement = f"SELECT * FROM ({self._query}) SUBQUERY FETCH FIRST 1 ROW ONLY"
         if self._db == 'oracle':
-            column_names = Oracle().query(statement).headers()
+            column_names = Oracle(self._connection).query(statement).headers()
             self.columns(*column_names)
 
     def query(self, statement):
@@ -166,18 +184,120 @@ class DataTable:
             column (int): Índice de la columna para ordenar.
             orientation (str, optional): Dirección de orden ('ASC' o 'DESC'). Defaults to 'ASC'.
         """
-        self._order_column = column
-        self._order_direction = str(orientation).upper()
+        direction = str(orientation).strip().upper()
+        if direction not in ('ASC', 'DESC'):
+            raise ValueError(f"La dirección de orden proporcionada no es válida: {orientation}")
+
+        self._order_column = int(column)
+        self._order_direction = direction
         return self
 
     def conditions(self):
-        """Genera las condiciones de búsqueda."""
+        """
+        Genera las condiciones de búsqueda con la variable de enlace :search.
+        El texto de la sentencia no depende del valor buscado, por lo que se reutiliza en el cache de sentencias.
+        """
         conditionals = []
         if self._search is not None:
             for column in self._columns:
-                conditionals.append(f"{column} LIKE '%{self._search}%'")
+                conditionals.append(f"{column} LIKE :search")
             self._conditionals = ' OR '.join(conditionals)
 
+    def _binds(self, paginate=True):
+        """
+        Retorna los valores de las variables de enlace de la búsqueda y, opcionalmente, de la paginación.
+
+        Args:
+            paginate (bool, optional): Incluye :offset y :limit. Defaults to True.
+        """
+        params = {}
+        if self._search is not None:
+            params['search'] = f"%{self._search}%"
+        if paginate:
+            params['offset'] = self._start
+            params['limit'] = self._limit
+        return params
+
+    def windowed(self, ttl: int = 60):
+        """
+        Activa el modo de una sola consulta por solicitud: la página y el total filtrado se obtienen
+        en la misma sentencia (COUNT(*) OVER()) y el total sin filtro de la vista se guarda en cache.
+
+        Args:
+            ttl (int, optional): Segundos de vigencia del total sin filtro en cache. Defaults to 60.
+        """
+        self._windowed = True
+        self._total_ttl = int(ttl)
+        return self
+
+    def keyset(self, column: str, after=None, ttl: int = 60):
+        """
+        Activa la paginación por llave (keyset / seek): cada página inicia después del último valor visto
+        de una columna única y ordenada, en lugar de saltar filas con OFFSET. El costo de la consulta no
+        crece con la profundidad de la página.
+
+        La respuesta incluye 'last' con el valor de la llave de la última fila, que el cliente debe
+        reenviar en la siguiente solicitud. El orden se aplica sobre la llave en la dirección solicitada.
+
+        Args:
+            column (str): Columna única y ordenada por la cual paginar.
+            after (any, optional): Último valor de la llave visto por el cliente. None para la primera página.
+            ttl (int, optional): Segundos de vigencia del total sin filtro en cache. Defaults to 60.
+        """
+        self._keyset = str(column).strip()
+        self._after = None if after in (None, '') else after
+        self._total_ttl = int(ttl)
+        return self
+
+    def _source(self):
+        """
+        Retorna el origen de la consulta: la vista/tabla o el query definido como subconsulta.
+        """
+        if self._query is None:
+            return self._table
+        return f"({self._query}) SUBQUERY"
+
+    def _where(self):
+        """
+        Retorna la clausula WHERE de la búsqueda o una cadena vacía si no hay búsqueda.
+        """
+        if self._search is None:
+            return ""
+        self.conditions()
+        return f"WHERE {self._conditionals}"
+
+    @staticmethod
+    def totals():
+        """
+        Retorna el almacen de los totales sin filtro (se crea una sola vez con el tamaño de config/cache.py).
+
+        Returns:
+            MemoryStore: El almacen de los totales.
+        """
+        if DataTable._totals is None:
+            with DataTable._totals_lock:
+                if DataTable._totals is None:
+                    DataTable._totals = MemoryStore(size=Config.cache('size') or 1024)
+        return DataTable._totals
+
+    def _records_total(self):
+        """
+        Retorna el total de registros sin filtro del origen, consultándolo una vez por cada periodo de vigencia.
+        """
+        key = (self._connection, self._source())
+        store = DataTable.totals()
+
+        total = store.get(key)
+        if total is not None:
+            return total
+
+        total = Oracle(self._connection).select(f"SELECT COUNT(*) AS total FROM {self._source()}").first()["TOTAL"]
+
+        if self._total_ttl > 0:
+            store.set(key, total, self._total_ttl)
+
+        return total
+
     def serverside(self):
         """
         Este metodo indica que la data que se debe retornar al Front debe tener la estructura de una Datatable
@@ -186,61 +306,28 @@ class DataTable:
 
         if self._db == 'oracle':
 
-            if self._search is None:
-
-                if self._query is None:
-
-                    statement = f"""
-                        SELECT {self._columns_string}
-                        FROM {self._table}
-                        ORDER BY {self._order_column} {self._order_direction}
-                        OFFSET {self._start} ROWS
-                        FETCH NEXT {self._limit} ROWS ONLY
-                    """
-                    statement_records_total = f"SELECT COUNT(*) AS total FROM {self._table}"
-
-                else:
-
-                    statement = f"""
-                        SELECT {self._columns_string}
-                        FROM ({self._query})
-                        ORDER BY {self._order_column} {self._order_direction}
-                        OFFSET {self._start} ROWS
-                        FETCH NEXT {self._limit} ROWS ONLY
-                    """
-                    statement_records_total = f"SELECT COUNT(*) AS total FROM ({self._query}) SUBQUERY"
-
-            else:
-
-                self.conditions()
-
-                if self._query is None:
-
-                    statement = f"""
-                        SELECT {self._columns_string}
-                        FROM {self._table}
-                        WHERE {self._conditionals}
-                        ORDER BY {self._order_column} {self._order_direction}
-                        OFFSET {self._start} ROWS
-                        FETCH NEXT {self._limit} ROWS ONLY
-                    """
-                    statement_records_total = f"SELECT COUNT(*) AS total FROM {self._table} WHERE {self._conditionals}"
-
-                else:
-
-                    statement = f"""
-                        SELECT {self._columns_string}
-                        FROM ({self._query})
-                        WHERE {self._conditionals}
-                        ORDER BY {self._order_column} {self._order_direction}
-                        OFFSET {self._start} ROWS
-                        FETCH NEXT {self._limit} ROWS ONLY
-                    """
-                    statement_records_total = f"SELECT COUNT(*) AS total FROM ({self._query}) SUBQUERY WHERE {self._conditionals}"
+            source = self._source()
+            where = self._where()
+
+            if self._keyset is not None:
+                return self._serverside_keyset(source, where)
+
+            if self._windowed:
+                return self._serverside_windowed(source, where)
+
+            statement = f"""
+                SELECT {self._columns_string}
+                FROM {source}
+                {where}
+                ORDER BY {self._order_column} {self._order_direction}
+                OFFSET :offset ROWS
+                FETCH NEXT :limit ROWS ONLY
+            """
+            statement_records_total = f"SELECT COUNT(*) AS total FROM {source} {where}"
 
             draw = self._draw
-            records_total = Oracle().select(statement_records_total).first()
-            data = Oracle().select(statement).get()
+            records_total = Oracle(self._connection).select(statement_records_total, self._binds(paginate=False)).first()
+            data = Oracle(self._connection).select(statement, self._binds()).get()
 
             self._response = {
                 'draw': draw,
@@ -251,31 +338,115 @@ class DataTable:
 
             return self
 
-    def clientside(self):
+    def _serverside_windowed(self, source, where):
         """
-        Este metodo indica que la data que se debe retornar al Front debe tener la estructura de una Datatable
-        En modelo ClientSide es decir que se retornará toda la data sin paginacion.
+        Obtiene la página y el total filtrado en una sola consulta; el total sin filtro sale del cache.
         """
 
-        if self._db == 'oracle':
+        statement = f"""
+            SELECT {self._columns_string}, COUNT(*) OVER() AS {self._count_column}
+            FROM {source}
+            {where}
+            ORDER BY {self._order_column} {self._order_direction}
+            OFFSET :offset ROWS
+            FETCH NEXT :limit ROWS ONLY
+        """
+        data = Oracle(self._connection).select(statement, self._binds()).get()
+
+        # Retirar la columna auxiliar de cada fila.
+        records_filtered = 0
+        for row in data:
+            records_filtered = row.pop(self._count_column)
+
+        # Pagina fuera de rango: el total filtrado requiere su propio conteo.
+        if not data and self._start > 0:
+            records_filtered = Oracle(self._connection).select(f"SELECT COUNT(*) AS total FROM {source} {where}", self._binds(paginate=False)).first()["TOTAL"]
+
+        self._response = {
+            'draw': self._draw,
+            'recordsTotal': self._records_total() if where else records_filtered,
+            'recordsFiltered': records_filtered,
+            'data': data
+        }
+
+        return self
+
+    def _serverside_keyset(self, source, where):
+        """
+        Obtiene la página siguiente al último valor de la llave visto, sin OFFSET.
+        """
+
+        conditionals = [f"({self._conditionals})"] if where else []
+        params = self._binds(paginate=False)
+
+        if self._after is not None:
+            operator = '<' if self._order_direction == 'DESC' else '>'
+            conditionals.append(f"{self._keyset} {operator} :after")
+            params['after'] = self._after
+
+        params['limit'] = self._limit
+        where_keyset = f"WHERE {' AND '.join(conditionals)}" if conditionals else ""
+
+        statement = f"""
+            SELECT {self._columns_string}, {self._keyset} AS {self._key_column}
+            FROM {source}
+            {where_keyset}
+            ORDER BY {self._keyset} {self._order_direction}
+            FETCH FIRST :limit ROWS ONLY
+        """
+        data = Oracle(self._connection).select(statement, params).get()
+
+        # Retirar la columna auxiliar y conservar la ultima llave.
+        last = self._after
+        for row in data:
+            last = row.pop(self._key_column)
+
+        # Totales: el total sin filtro sale del cache.
+        records_total = self._records_total()
+        if where:
+            records_filtered = Oracle(self._connection).select(f"SELECT COUNT(*) AS total FROM {source} {where}", self._binds(paginate=False)).first()["TOTAL"]
+        else:
+            records_filtered = records_total
 
-            if self._query is None:
+        self._response = {
+            'draw': self._draw,
+            'recordsTotal': records_total,
+            'recordsFiltered': records_filtered,
+            'data': data,
+            'last': last
+        }
 
-                statement = f"""
-                    SELECT {self._columns_string}
-                    FROM {self._table}
-                    ORDER BY {self._order_column} {self._order_direction}
-                """
+        return self
+
+    def _clientside_statement(self):
+        """
+        Construye la consulta completa (sin paginación) de la vista o query definido.
+        """
+
+        if self._query is None:
+
+            return f"""
+                SELECT {self._columns_string}
+                FROM {self._table}
+                ORDER BY {self._order_column} {self._order_direction}
+            """
 
-            else:
+        return f"""
+            SELECT {self._columns_string}
+            FROM ({self._query})
+            ORDER BY {self._order_column} {self._order_direction}
+        """
+
+    def clientside(self):
+        """
+        Este metodo indica que la data que se debe retornar al Front debe tener la estructura de una Datatable
+        En modelo ClientSide es decir que se retornará toda la data sin paginacion.
+        """
 
-                statement = f"""
-                    SELECT {self._columns_string}
-                    FROM ({self._query})
-                    ORDER BY {self._order_column} {self._order_direction}
-                """
+        if self._db == 'oracle':
 
-            data = Oracle().select(statement).get()
+            statement = self._clientside_statement()
+            data = Oracle(self._connection).select(statement).get()
 
             self._response = {
                 'data': data
@@ -284,6 +455,32 @@ class DataTable:
         return self
 
 
+    def stream(self, batch_size:int = 1000):
+        """
+        Retorna toda la data (modelo ClientSide) como una respuesta JSON por partes.
+
+        Las filas se leen del cursor por lotes y se serializan a medida que se envían,
+        por lo que la memoria del servidor se mantiene constante sin importar el tamaño de la vista.
+
+        Args:
+            batch_size (int, optional): Filas por lote leído y enviado al cliente. Defaults to 1000.
+
+        Returns:
+            Response: Respuesta de Flask con el cuerpo {"data": [...]} enviado por partes.
+        """
+        rows = Oracle(self._connection).query(self._clientside_statement(), arraysize=batch_size).iter_dicts(batch_size=batch_size)
+
+        def generate():
+            dumps = current_app.json.dumps
+            yield '{"data":['
+            separator = ''
+            for block in LazyCollection(rows).chunk_iter(batch_size):
+                yield separator + ','.join(dumps(row) for row in block)
+                separator = ','
+            yield ']}'
+
+        return Response(stream_with_context(generate()), mimetype='application/json')
+
     def get(self):
         """
         Ejecuta la consulta y retorna los resultados en formato JSON.
@@ -0,0 +1,215 @@
+import os
+import sys
+import json
+import threading
+import importlib.util
+import importlib.machinery
+from importlib.abc import MetaPathFinder
+
+class ModuleIndex(MetaPathFinder):
+    """
+    Índice precompilado de los módulos de la solución.
+
+    Reemplaza el registro de cada carpeta de la solución en sys.path: los módulos, paquetes y
+    paquetes de espacio de nombres (carpetas sin __init__.py) se indexan una sola vez por su
+    nombre simple en bootstrap/cache/modules.json y un buscador de sys.meta_path los resuelve
+    con una sola consulta al diccionario. Los nombres se resuelven como si cada carpeta estuviera
+    en sys.path: un módulo o paquete tiene prioridad sobre un espacio de nombres, y las carpetas
+    sin __init__.py con el mismo nombre se combinan en un solo espacio de nombres.
+
+    El buscador se ubica al final de sys.meta_path, por lo que las importaciones normales
+    (biblioteca estándar, dependencias y la ruta base) tienen prioridad sobre el índice.
+
+    modules.json se usa tal cual mientras exista: cargarlo no recorre las carpetas y un nombre que
+    no está en el índice se descarta sin volver a recorrerlas (las importaciones opcionales que
+    fallan no cuestan nada). El índice se regenera con 'artisan cache:clear', en cada arranque de
+    desarrollo del HttpKernel y cuando una ruta indexada ya no existe. Un módulo nuevo en
+    producción requiere 'artisan cache:clear' (o un despliegue que limpie bootstrap/cache).
+    """
+
+    # Indice instalado en el proceso.
+    _instance = None
+
+    # Version del formato de modules.json.
+    _version = 3
+
+    def __init__(self, basepath, folders):
+        """
+        Inicializa el índice.
+
+        Args:
+            basepath (str): La ruta base del proyecto.
+            folders (list): Las carpetas de la solución que se indexan.
+        """
+        self.basepath = os.path.abspath(basepath)
+        self.folders = list(folders)
+        self.path = os.path.join(self.basepath, "bootstrap", "cache", "modules.json")
+        self.modules = {}
+        self._lock = threading.RLock()
+
+    @staticmethod
+    def install(basepath, folders):
+        """
+        Registra la ruta base en sys.path e instala el buscador del índice en sys.meta_path.
+
+        Args:
+            basepath (str): La ruta base del proyecto.
+            folders (list): Las carpetas de la solución que se indexan.
+
+        Returns:
+            ModuleIndex: El índice instalado.
+        """
+        basepath = os.path.abspath(basepath)
+        if basepath not in sys.path:
+            sys.path.append(basepath)
+
+        index = ModuleIndex(basepath, folders)
+        index.load()
+
+        sys.meta_path[:] = [finder for finder in sys.meta_path if not isinstance(finder, ModuleIndex)]
+        sys.meta_path.append(index)
+        ModuleIndex._instance = index
+
+        return index
+
+    @staticmethod
+    def rebuild():
+        """
+        Regenera el índice instalado en el proceso (si existe).
+        """
+        if ModuleIndex._instance is not None:
+            ModuleIndex._instance.build()
+
+    def load(self):
+        """
+        Carga el índice desde bootstrap/cache/modules.json, generándolo solo si no existe o es inválido.
+        """
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+            current = data["version"] == ModuleIndex._version and isinstance(data["modules"], dict)
+            if current:
+                self.modules = data["modules"]
+        except (OSError, ValueError, KeyError, TypeError):
+            current = False
+
+        if not current:
+            self.build()
+
+    def walk(self):
+        """
+        Recorre las carpetas de la solución omitiendo el bytecode y las carpetas ocultas.
+
+        Returns:
+            generator: Tuplas (carpeta, subcarpetas, archivos).
+        """
+        for folder in self.folders:
+            for root, dirs, files in os.walk(os.path.join(self.basepath, folder)):
+                dirs[:] = sorted(name for name in dirs if name != '__pycache__' and not name.startswith('.'))
+                yield root, dirs, files
+
+    def build(self):
+        """
+        Recorre las carpetas de la solución e indexa cada módulo y paquete por su nombre simple.
+        Ante nombres repetidos se conserva el primero encontrado, igual que el orden de sys.path;
+        las carpetas sin __init__.py se indexan como espacios de nombres si ningún módulo o paquete
+        usa su nombre.
+        """
+        modules = {}
+        namespaces = {}
+
+        for root, dirs, files in self.walk():
+            for name in dirs:
+                init = os.path.join(root, name, '__init__.py')
+                if os.path.isfile(init):
+                    modules.setdefault(name, [os.path.relpath(init, self.basepath), "package"])
+                else:
+                    namespaces.setdefault(name, []).append(os.path.relpath(os.path.join(root, name), self.basepath))
+
+            for name in sorted(files):
+                if name.endswith('.py') and name != '__init__.py':
+                    modules.setdefault(name[:-3], [os.path.relpath(os.path.join(root, name), self.basepath), "module"])
+
+        # Los espacios de nombres solo se usan si ningun modulo o paquete tiene el mismo nombre
+        for name, locations in namespaces.items():
+            modules.setdefault(name, [locations, "namespace"])
+
+        with self._lock:
+            self.modules = modules
+
+        # Escritura atomica del indice
+        try:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            temporary = f"{self.path}.{os.getpid()}.tmp"
+            with open(temporary, 'w') as f:
+                json.dump({"version": ModuleIndex._version, "modules": modules}, f)
+            os.replace(temporary, self.path)
+        except OSError:
+            pass
+
+    def find_spec(self, fullname, path=None, target=None):
+        """
+        Resuelve un módulo de nivel superior a partir del índice.
+
+        Un nombre que no está en el índice se descarta sin recorrer las carpetas. Si la ruta
+        indexada ya no existe, el índice se regenera una vez y el nombre se vuelve a resolver.
+
+        Args:
+            fullname (str): El nombre del módulo.
+            path (list, optional): Rutas del paquete padre (solo se resuelven módulos de nivel superior).
+            target (module, optional): Módulo a recargar.
+
+        Returns:
+            ModuleSpec: La especificación del módulo, o None si no está en el índice.
+        """
+        if path is not None or '.' in fullname:
+            return None
+
+        entry = self.modules.get(fullname)
+        if entry is None:
+            return None
+
+        spec = self.spec(fullname, entry)
+        if spec is not None:
+            return spec
+
+        # La ruta indexada ya no existe: el indice esta desactualizado
+        with self._lock:
+            if self.modules.get(fullname) is entry:
+                self.build()
+            entry = self.modules.get(fullname)
+
+        return self.spec(fullname, entry) if entry is not None else None
+
+    def spec(self, fullname, entry):
+        """
+        Construye la especificación de una entrada del índice.
+
+        Args:
+            fullname (str): El nombre del módulo.
+            entry (list): La entrada del índice ([ubicación, tipo]).
+
+        Returns:
+            ModuleSpec: La especificación del módulo, o None si su ruta ya no existe.
+        """
+        location, kind = entry
+
+        # Espacio de nombres: las carpetas sin __init__.py que aun existen
+        if kind == "namespace":
+            locations = [os.path.join(self.basepath, folder) for folder in location]
+            locations = [folder for folder in locations if os.path.isdir(folder)]
+            if not locations:
+                return None
+            spec = importlib.machinery.ModuleSpec(fullname, None, is_package=True)
+            spec.submodule_search_locations = locations
+            return spec
+
+        location = os.path.join(self.basepath, location)
+        if not os.path.isfile(location):
+            return None
+
+        return importlib.util.spec_from_file_location(
+            fullname,
+            location,
+            submodule_search_locations=[os.path.dirname(location)] if kind == "package" else None
+        )
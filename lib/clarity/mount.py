@@ -7,6 +7,9 @@ class Mount:
     Clase para montar middleware y controladores en la aplicación Flask.
     """
 
+    # Clases ya resueltas: {(modulo, clase): clase}.
+    _resolved = {}
+
     @staticmethod
     def command(instance):
 
@@ -42,37 +45,55 @@ class Mount:
         Console.write("=============================================================")
 
     @staticmethod
-    def middleware(next, flask_request, data_controller):
+    def resolve(next):
         """
-        Método estático para montar middleware en la aplicación Flask.
+        Importa el módulo y obtiene la clase indicada una sola vez; los siguientes llamados usan el cache.
 
         Args:
-            next (dict): Un diccionario que contiene los datos del middleware, incluyendo la ruta, la clase y el método.
-            flask_request: La solicitud Flask actual.
-            data_controller: Los datos del controlador asociado al middleware.
+            next (dict): Un diccionario con la ruta del módulo (path) y el nombre de la clase (classname).
 
         Returns:
-            Método: El método del middleware a ser llamado.
+            type: La clase resuelta.
+        """
+        key = (next["path"], next["classname"])
+        new_class = Mount._resolved.get(key)
+
+        if new_class is None:
+            module = __import__(next["path"], fromlist=[next["classname"]])
+            new_class = getattr(module, next["classname"])
+            Mount._resolved[key] = new_class
+
+        return new_class
+
+    @staticmethod
+    def dispatcher(next, flask_request):
         """
+        Crea la función de vista de un controlador.
+
+        La clase y el método se resuelven una sola vez al montar la ruta; en cada solicitud se crea
+        una instancia nueva del controlador, por lo que ninguna solicitud comparte estado con otra.
 
-       # Extraer datos
-        path = next["path"]
-        classname = next["classname"]
+        Args:
+            next (dict): Un diccionario que contiene los datos del controlador, incluyendo la ruta, la clase y el método.
+            flask_request: La solicitud Flask actual.
+
+        Returns:
+            function: La función de vista que atiende cada solicitud.
+        """
+        new_class = Mount.resolve(next)
         method = next["method"]
+        validate = lambda instance : Validate(flask_request).required(instance.required()).messages(instance.messages()).check()
 
-        # Importar el módulo que contiene la clase del middleware
-        module = __import__(path, fromlist=[classname])
-        new_class = getattr(module, classname)
+        def dispatch(**kwargs):
 
-        # Obtener una instancia del middleware
-        middleware_instance = new_class()
+            # Instancia propia de la solicitud.
+            controller_instance = new_class()
+            controller_instance.request = flask_request
+            controller_instance.validate = validate
 
-        # Agregar Propiedades dinamicas
-        middleware_instance.request = flask_request
-        middleware_instance.next = data_controller
+            return getattr(controller_instance, method)(**kwargs)
 
-        # Obtener el método del middleware por nombre
-        return getattr(middleware_instance, method)
+        return dispatch
 
     @staticmethod
     def controller(next, flask_request, arguments=None):
@@ -80,22 +101,27 @@ class Mount:
         Método estático para montar controladores en la aplicación Flask.
 
         Args:
-            next (dict): Un diccionario que contiene los datos del controlador, incluyendo la ruta, la clase y el método.
+            next (dict|Next): Un diccionario con los datos del controlador (ruta, clase y método) o el siguiente eslabón del pipeline.
             flask_request: La solicitud Flask actual.
             arguments (dict): Argumentos adicionales para el método del controlador (opcional).
 
         Returns:
-            Método: El método del controlador a ser llamado.
+            any: La respuesta del controlador o, si arguments es None, la función de vista del controlador.
         """
 
+        # Dentro de un pipeline, next es el siguiente eslabón de la cadena.
+        if callable(next):
+            return next(**(arguments or {}))
+
+        # Sin argumentos se monta la función de vista (una instancia por solicitud).
+        if arguments is None:
+            return Mount.dispatcher(next=next, flask_request=flask_request)
+
         # Extraer datos
-        path = next["path"]
-        classname = next["classname"]
         method = next["method"]
 
-        # Importar el módulo que contiene la clase del controller
-        module = __import__(path, fromlist=[classname])
-        new_class = getattr(module, classname)
+        # Obtener la clase del controller (resuelta una sola vez)
+        new_class = Mount.resolve(next)
 
         # Obtener una instancia del controller
         controller_instance = new_class()
@@ -105,9 +131,7 @@ class Mount:
         controller_instance.validate = lambda instance : Validate(flask_request).required(instance.required()).messages(instance.messages()).check()
 
         # Llamar al método del controlador con argumentos si están presentes, de lo contrario, sin argumentos
-        if arguments is not None and len(arguments) > 0:
+        if len(arguments) > 0:
             return getattr(controller_instance, method)(**arguments)
-        elif arguments is not None and len(arguments) == 0:
-            return getattr(controller_instance, method)()
-        elif arguments is None:
-            return getattr(controller_instance, method)
\ No newline at end of file
+        else:
+            return getattr(controller_instance, method)()
\ No newline at end of file
@@ -0,0 +1,91 @@
+import time
+from contextlib import contextmanager
+
+class Profiler:
+    """
+    Perfilador liviano de las fases de arranque del marco.
+
+    Las fases se marcan con `with Profiler.phase('nombre'):` y pueden anidarse; si el perfilador
+    no está activo el bloque no mide nada. Los tiempos de las fases con el mismo recorrido
+    (por ejemplo cada validación de Router.set) se acumulan.
+    """
+
+    _enabled = False
+
+    # Recorrido de la fase actual y tiempos acumulados por recorrido: {('boot', 'routes'): [segundos, llamadas]}.
+    _stack = []
+    _phases = {}
+
+    @staticmethod
+    def enable():
+        """
+        Activa el perfilador y descarta las mediciones anteriores.
+        """
+        Profiler._enabled = True
+        Profiler._stack = []
+        Profiler._phases = {}
+
+    @staticmethod
+    def disable():
+        """
+        Desactiva el perfilador conservando las mediciones.
+        """
+        Profiler._enabled = False
+
+    @staticmethod
+    @contextmanager
+    def phase(name:str):
+        """
+        Mide el tiempo del bloque como una fase del arranque.
+
+        Args:
+            name (str): El nombre de la fase.
+        """
+        if not Profiler._enabled:
+            yield
+            return
+
+        Profiler._stack.append(name)
+        path = tuple(Profiler._stack)
+        measure = Profiler._phases.setdefault(path, [0.0, 0])
+        start = time.perf_counter()
+
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            Profiler._stack.pop()
+            measure[0] += elapsed
+            measure[1] += 1
+
+    @staticmethod
+    def phases():
+        """
+        Retorna las fases medidas en el orden en que iniciaron.
+
+        Returns:
+            list: Diccionarios con el recorrido (path), el tiempo total en segundos (seconds) y las llamadas (calls).
+        """
+        return [
+            {'path': path, 'seconds': seconds, 'calls': calls}
+            for path, (seconds, calls) in Profiler._phases.items()
+        ]
+
+    @staticmethod
+    def folded():
+        """
+        Retorna las fases en formato de pilas plegadas (compatible con flamegraph.pl y speedscope).
+        El valor de cada pila es su tiempo propio en microsegundos (sin el de sus fases hijas).
+
+        Returns:
+            list: Las líneas 'fase;subfase microsegundos'.
+        """
+        lines = []
+        for path, (seconds, calls) in Profiler._phases.items():
+            children = sum(
+                child_seconds for child, (child_seconds, _) in Profiler._phases.items()
+                if len(child) == len(path) + 1 and child[:len(path)] == path
+            )
+            own = max(round((seconds - children) * 1000000), 0)
+            lines.append(f"{';'.join(path)} {own}")
+        return lines
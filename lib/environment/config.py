@@ -1,16 +1,35 @@
-import json
 import os
+import sys
+import glob
+import json
+import threading
+import importlib
+from types import MappingProxyType
 from lib.clarity.paths import Paths
-from config.database import connections
-from config.endpoints import uris
-from config.mail import mail
-from config.cors import cors
-from config.app import app
+from lib.environment.env import Env
 
 class Config:
 
     _instance = None
-    _json = None
+
+    # Instantanea inmutable de la configuracion y su indice plano de llaves.
+    _snapshot = None
+    _index = None
+    _lock = threading.RLock()
+
+    # Marca de valor inexistente.
+    _missing = object()
+
+    # Secciones de la configuracion: (seccion, modulo, variable).
+    _sources = (
+        ("app", "config.app", "app"),
+        ("cors", "config.cors", "cors"),
+        ("database", "config.database", "connections"),
+        ("endpoints", "config.endpoints", "uris"),
+        ("mail", "config.mail", "mail"),
+        ("cache", "config.cache", "cache"),
+        ("view", "config.view", "view")
+    )
 
     def __new__(cls, *args, **kwargs):
         """
@@ -39,25 +58,27 @@ class Config:
     def mount(self):
         """
             Monta un archivo de configuración de variables de entorno en formato JSON si no existe en 'self.path'.
+            El archivo se escribe de forma atómica para que otros procesos nunca lean un archivo incompleto.
         """
         if not os.path.exists(self.path):
 
             globalConfigData = json.dumps([{
-                "app": app,
-                "cors": cors,
-                "database": connections,
-                "endpoints": uris,
-                "mail": mail
+                section: getattr(importlib.import_module(module), variable)
+                for section, module, variable in self._sources
             }])
 
-            with open(self.path, 'w') as f:
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            temporary = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(temporary, 'w') as f:
                 f.write(globalConfigData)
+            os.replace(temporary, self.path)
 
         return True
 
     def destroy(self):
         """
             Elimina el archivo de configuración JSON si existe en la ruta 'self.path'.
+            La instantánea en memoria del proceso solo se refresca con Config.reload().
 
             Retorna:
                 True si el archivo se eliminó correctamente, False si el archivo no existe.
@@ -69,23 +90,103 @@ class Config:
         else:
             return False
 
+    def stale(self):
+        """
+            Indica si el archivo de configuración JSON debe regenerarse: no existe o es anterior
+            a alguno de los archivos de la carpeta config o al archivo .env.
+
+            Retorna:
+                True si el archivo no existe o está desactualizado.
+        """
+        if not os.path.exists(self.path):
+            return True
+
+        compiled = os.path.getmtime(self.path)
+        sources = [Paths.base(".env")] + glob.glob(os.path.join(Paths.config(), "*.py"))
+
+        return any(os.path.exists(source) and os.path.getmtime(source) > compiled for source in sources)
+
     def read(self):
         """
-            Lee y carga el contenido del archivo de configuración JSON en la ruta 'self.path'.
+            Retorna la instantánea inmutable de la configuración.
 
-            Si el archivo no existe, se crea uno nuevo mediante el método 'mount()'.
+            La primera llamada del proceso monta (si es necesario) y lee el archivo de configuración JSON;
+            las siguientes no acceden al sistema de archivos.
 
             Retorna:
-                Un diccionario con los datos cargados desde el archivo JSON.
+                Un diccionario de solo lectura con todas las secciones de la configuración.
+        """
+        if Config._snapshot is None:
+            with Config._lock:
+                if Config._snapshot is None:
+                    self.mount()
+                    with open(self.path, 'r') as f:
+                        contenido = f.read()
+                    snapshot = Config._freeze(json.loads(contenido)[0])
+                    index = {}
+                    Config._flatten(snapshot, "", index)
+                    Config._index = index
+                    Config._snapshot = snapshot
+
+        return Config._snapshot
+
+    @staticmethod
+    def reload():
         """
-        self.mount()
+            Vuelve a construir la configuración a partir del ENV y de los archivos de la carpeta config.
+            Es la única forma de refrescar la instantánea en memoria del proceso.
 
-        if self._json is None:
-            with open(self.path, 'r') as f:
-                contenido = f.read()
-                self._json = json.loads(contenido)
+            El archivo .env se vuelve a leer reemplazando los valores ya cargados en os.environ;
+            las variables eliminadas del archivo conservan su valor anterior hasta reiniciar el proceso.
 
-        return self._json
+            Retorna:
+                El diccionario de solo lectura con la nueva configuración.
+        """
+        with Config._lock:
+            Config().destroy()
+            Env.init(override=True)
+
+            for _, module, _ in Config._sources:
+                if module in sys.modules:
+                    importlib.reload(sys.modules[module])
+
+            Config._snapshot = None
+            Config._index = None
+
+            return Config().read()
+
+    @staticmethod
+    def _freeze(value):
+        """
+            Convierte recursivamente diccionarios y listas en estructuras de solo lectura.
+        """
+        if isinstance(value, dict):
+            return MappingProxyType({key: Config._freeze(item) for key, item in value.items()})
+        if isinstance(value, list):
+            return tuple(Config._freeze(item) for item in value)
+        return value
+
+    @staticmethod
+    def _thaw(value):
+        """
+            Convierte recursivamente las estructuras de solo lectura en diccionarios y listas.
+        """
+        if isinstance(value, MappingProxyType):
+            return {key: Config._thaw(item) for key, item in value.items()}
+        if isinstance(value, tuple):
+            return [Config._thaw(item) for item in value]
+        return value
+
+    @staticmethod
+    def _flatten(value, prefix, index):
+        """
+            Registra en el índice plano cada ruta de llaves separada por puntos ('database.oracle.default').
+        """
+        if prefix:
+            index[prefix] = value
+        if isinstance(value, MappingProxyType):
+            for key, item in value.items():
+                Config._flatten(item, f"{prefix}.{key}" if prefix else str(key), index)
 
     def section(self, section:str, value:str):
         """
@@ -98,21 +199,48 @@ class Config:
             Retorna:
                 El valor correspondiente a la clave especificada dentro de la sección, o None si no se encuentra.
         """
-        appData = self.read()[0][section]
+        return Config.get(section if value is None else f"{section}.{value}")
 
-        if value is not None:
-            indexes = value.split('.')
-            realData = appData
-            try:
-                for index in indexes:
-                    realData = realData[index]
-            except (TypeError, KeyError):
-                realData = None
-        else:
-            realData = appData
+    @staticmethod
+    def get(key:str, default=None):
+        """
+            Obtiene un valor de la configuración a partir de su ruta completa de llaves ('app.debug').
 
-        return realData
+            Args:
+                key (str): La ruta del valor separada por puntos.
+                default (any, opcional): El valor a retornar si la ruta no existe.
 
+            Retorna:
+                El valor de solo lectura correspondiente a la ruta (use Config.plain() para obtener
+                diccionarios y listas serializables), o el valor por defecto.
+        """
+        index = Config._index
+        if index is None:
+            Config().read()
+            index = Config._index
+
+        return index.get(key, default)
+
+    @staticmethod
+    def plain(key:str = None, default=None):
+        """
+            Obtiene una copia modificable de un valor de la configuración.
+
+            Los valores de Config.get() y de los accesores de sección son de solo lectura
+            (MappingProxyType y tuplas) y no pueden serializarse con json.dumps; este método
+            retorna el mismo valor como diccionarios y listas.
+
+            Args:
+                key (str, opcional): La ruta del valor separada por puntos; si se omite, toda la configuración.
+                default (any, opcional): El valor a retornar si la ruta no existe.
+
+            Retorna:
+                Una copia con diccionarios y listas del valor, o el valor por defecto.
+        """
+        value = Config().read() if key is None else Config.get(key, Config._missing)
+        if value is Config._missing:
+            return default
+        return Config._thaw(value)
 
     @staticmethod
     def app(value:str = None):
@@ -126,10 +254,7 @@ class Config:
             Retorna:
                 El valor correspondiente a la clave especificada dentro de la sección 'app', o la sección completa si value es None.
         """
-        return Config().section(
-            section="app",
-            value=value
-        )
+        return Config.get("app" if value is None else f"app.{value}")
 
     @staticmethod
     def cors(value:str = None):
@@ -143,10 +268,7 @@ class Config:
             Retorna:
                 El valor correspondiente a la clave especificada dentro de la sección 'cors', o la sección completa si value es None.
         """
-        return Config().section(
-            section="cors",
-            value=value
-        )
+        return Config.get("cors" if value is None else f"cors.{value}")
 
     @staticmethod
     def database(value:str = None):
@@ -160,10 +282,7 @@ class Config:
             Retorna:
                 El valor correspondiente a la clave especificada dentro de la sección 'database', o la sección completa si value es None.
         """
-        return Config().section(
-            section="database",
-            value=value
-        )
+        return Config.get("database" if value is None else f"database.{value}")
 
     @staticmethod
     def mail(value:str = None):
@@ -177,10 +296,7 @@ class Config:
             Retorna:
                 El valor correspondiente a la clave especificada dentro de la sección 'mail', o la sección completa si value es None.
         """
-        return Config().section(
-            section="mail",
-            value=value
-        )
+        return Config.get("mail" if value is None else f"mail.{value}")
 
     @staticmethod
     def endpoints(value:str = None):
@@ -194,7 +310,32 @@ class Config:
             Retorna:
                 El valor correspondiente a la clave especificada dentro de la sección 'endpoints', o la sección completa si value es None.
         """
-        return Config().section(
-            section="endpoints",
-            value=value
-        )
\ No newline at end of file
+        return Config.get("endpoints" if value is None else f"endpoints.{value}")
+
+    @staticmethod
+    def cache(value:str = None):
+        """
+            Obtiene un valor específico de la sección 'cache' del archivo de configuración JSON.
+
+            Args:
+                value (str, opcional): La clave o ruta del valor que se desea obtener dentro de la sección.
+                    Si se omite, devuelve toda la sección 'cache'.
+
+            Retorna:
+                El valor correspondiente a la clave especificada dentro de la sección 'cache', o la sección completa si value es None.
+        """
+        return Config.get("cache" if value is None else f"cache.{value}")
+
+    @staticmethod
+    def view(value:str = None):
+        """
+            Obtiene un valor específico de la sección 'view' del archivo de configuración JSON.
+
+            Args:
+                value (str, opcional): La clave o ruta del valor que se desea obtener dentro de la sección.
+                    Si se omite, devuelve toda la sección 'view'.
+
+            Retorna:
+                El valor correspondiente a la clave especificada dentro de la sección 'view', o la sección completa si value es None.
+        """
+        return Config.get("view" if value is None else f"view.{value}")
\ No newline at end of file
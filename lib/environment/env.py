@@ -1,5 +1,6 @@
 from dotenv import load_dotenv
 import os
+from lib.clarity.paths import Paths
 
 class Env:
 
@@ -21,13 +22,16 @@ class Env:
         return cls._instance
 
     @staticmethod
-    def load_env():
+    def load_env(override=False):
         """
         Método para cargar el ENV.
+
+        Args:
+            override (bool, optional): Si es True los valores del archivo .env reemplazan los que ya
+                existen en os.environ (se usa al recargar). Por defecto, False.
         """
-        if not hasattr(Env._instance, '_loaded') or not Env._instance._loaded:
-            env_path = os.path.join(os.path.dirname(__file__), '../../.env')
-            load_dotenv(env_path)
+        if override or not hasattr(Env._instance, '_loaded') or not Env._instance._loaded:
+            load_dotenv(Paths.base('.env'), override=override)
             Env._instance._loaded = True
 
     @staticmethod
@@ -56,9 +60,15 @@ class Env:
         Env._instance = None
 
     @staticmethod
-    def init():
+    def init(override=False):
         """
         Método para reiniciar el Entorno.
+
+        Args:
+            override (bool, optional): Si es True vuelve a leer el archivo .env reemplazando los valores
+                ya cargados en os.environ. Las variables eliminadas del archivo conservan su valor anterior.
         """
         Env._instance = None
         Env()
+        if override:
+            Env.load_env(override=True)
@@ -0,0 +1,147 @@
+import time
+import hashlib
+from flask import make_response, current_app
+from werkzeug.http import http_date
+from lib.cache.store import Cache
+from lib.clarity.mount import Mount
+from lib.environment.config import Config
+
+class ResponseCache:
+    """
+    Middleware que almacena en cache las respuestas exitosas (200) de las solicitudes GET y HEAD.
+
+    La llave se forma con el verbo, la URI, los parámetros de consulta, las cabeceras configuradas y
+    siempre con las credenciales de la solicitud (cabecera Authorization y cookie de sesión), por lo que
+    la respuesta de un usuario nunca se entrega a otro. No se almacenan respuestas con Set-Cookie ni
+    marcadas con Cache-Control private o no-store.
+    Cada respuesta se entrega con ETag y Last-Modified, y las solicitudes condicionales
+    (If-None-Match / If-Modified-Since) reciben 304 sin volver a ejecutar el controlador.
+
+    Para ajustar la configuración de una ruta se hereda la clase:
+
+        class CatalogCache(ResponseCache):
+            ttl = 300
+            headers = ['Accept-Language']
+
+        Route().middleware(TokenMiddleware, CatalogCache).group(...)
+    """
+
+    # Segundos de vida de las entradas (None = config/cache.py).
+    ttl = None
+
+    # Cabeceras de la solicitud que forman parte de la llave (None = config/cache.py).
+    headers = None
+
+    # Almacen a utilizar: 'memory' o 'sqlite' (None = config/cache.py).
+    store = None
+
+    # Cabeceras de la respuesta que no se almacenan.
+    _excluded = ('Content-Length', 'ETag', 'Last-Modified', 'Date')
+
+    def handle(self, **kwargs):
+        """
+        Retorna la respuesta almacenada o ejecuta el controlador y almacena su respuesta.
+
+        Args:
+            kwargs: Argumentos adicionales de la solicitud.
+
+        Returns:
+            Response: La respuesta de la solicitud (200 o 304).
+        """
+        if self.request.method not in ('GET', 'HEAD'):
+            return self.forward(**kwargs)
+
+        store = Cache.store(self.store)
+        key = self.key()
+        entry = store.get(key)
+
+        if entry is None:
+            response = make_response(self.forward(**kwargs))
+
+            # Solo se almacenan respuestas completas, exitosas, publicas y sin cookies.
+            if not self.cacheable(response):
+                return response
+
+            body = response.get_data()
+            entry = {
+                'body': body,
+                'headers': [(name, value) for name, value in response.headers.items() if name not in self._excluded],
+                'etag': hashlib.sha1(body).hexdigest(),
+                'modified': int(time.time())
+            }
+            store.set(key, entry, self.ttl if self.ttl is not None else Config.cache('ttl'))
+
+        return self.respond(entry)
+
+    def forward(self, **kwargs):
+        """
+        Continúa la cadena hacia el controlador.
+
+        Args:
+            kwargs: Argumentos adicionales de la solicitud.
+
+        Returns:
+            any: La respuesta del controlador.
+        """
+        return Mount.controller(
+            next=self.next,
+            flask_request=self.request,
+            arguments=kwargs
+        )
+
+    def cacheable(self, response):
+        """
+        Indica si la respuesta del controlador puede almacenarse.
+
+        Args:
+            response (Response): La respuesta del controlador.
+
+        Returns:
+            bool: True si la respuesta es 200, completa, sin Set-Cookie y no es private ni no-store.
+        """
+        if response.status_code != 200 or response.is_streamed:
+            return False
+
+        if 'Set-Cookie' in response.headers:
+            return False
+
+        return not (response.cache_control.no_store or response.cache_control.private)
+
+    def key(self):
+        """
+        Construye la llave de la solicitud actual.
+
+        Returns:
+            str: La llave de cache (sha1 del verbo, la URI, los parámetros, las cabeceras y las credenciales).
+        """
+        headers = self.headers if self.headers is not None else (Config.cache('headers') or [])
+        session = current_app.config.get('SESSION_COOKIE_NAME') or 'session'
+
+        parts = [
+            'GET',
+            self.request.path,
+            '&'.join(f"{name}={value}" for name, value in sorted(self.request.args.items(multi=True))),
+            '&'.join(f"{name}={self.request.headers.get(name, '')}" for name in headers),
+
+            # Credenciales de la solicitud
+            self.request.headers.get('Authorization', ''),
+            self.request.cookies.get(session, '')
+        ]
+
+        return 'response:' + hashlib.sha1('|'.join(parts).encode('utf-8')).hexdigest()
+
+    def respond(self, entry):
+        """
+        Construye la respuesta a partir de una entrada del cache, respondiendo 304 si el cliente ya la tiene.
+
+        Args:
+            entry (dict): La entrada almacenada.
+
+        Returns:
+            Response: La respuesta completa o 304 Not Modified.
+        """
+        response = make_response(entry['body'], 200, entry['headers'])
+        response.set_etag(entry['etag'])
+        response.headers['Last-Modified'] = http_date(entry['modified'])
+
+        return response.make_conditional(self.request)
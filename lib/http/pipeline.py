@@ -0,0 +1,114 @@
+from lib.clarity.mount import Mount
+
+class Context:
+    """
+    Estado de una solicitud a lo largo del pipeline de middlewares.
+
+    Cada solicitud recibe su propio contexto, de modo que los middlewares pueden compartir
+    datos entre sí (context.data) sin guardarlos como atributos de una instancia compartida.
+    """
+
+    def __init__(self, flask_request, arguments=None):
+        """
+        Inicializa el contexto de la solicitud.
+
+        Args:
+            flask_request: La solicitud Flask actual.
+            arguments (dict): Argumentos de la ruta (opcional).
+        """
+        self.request = flask_request
+        self.arguments = arguments or {}
+        self.data = {}
+
+class Next:
+    """
+    Eslabón siguiente del pipeline. Se asigna a cada middleware como `self.next`.
+
+    Llamarlo continúa la cadena con el siguiente middleware o, al final, con el controlador.
+    """
+
+    def __init__(self, pipeline, index, context):
+        """
+        Inicializa el eslabón siguiente.
+
+        Args:
+            pipeline (Pipeline): El pipeline compilado de la ruta.
+            index (int): Posición del siguiente middleware en la cadena.
+            context (Context): El contexto de la solicitud.
+        """
+        self.pipeline = pipeline
+        self.index = index
+        self.context = context
+
+    def __call__(self, **kwargs):
+        """
+        Continúa la cadena de la solicitud.
+
+        Args:
+            kwargs: Argumentos de la ruta; si se omiten se usan los del contexto.
+
+        Returns:
+            any: La respuesta del resto de la cadena.
+        """
+        arguments = kwargs if kwargs else self.context.arguments
+        return self.pipeline.handle(self.index, self.context, arguments)
+
+class Pipeline:
+    """
+    Cadena compilada de middlewares y controlador de una ruta.
+
+    Las clases se resuelven una sola vez al montar la ruta. En cada solicitud se crea una
+    instancia nueva de cada middleware y del controlador, y el estado viaja en un Context,
+    por lo que el pipeline puede atender solicitudes concurrentes sin condiciones de carrera.
+    """
+
+    def __init__(self, controller, middlewares=None, flask_request=None):
+        """
+        Compila el pipeline de la ruta.
+
+        Args:
+            controller (dict): Los datos del controlador (path, classname, method).
+            middlewares (list): Los datos de cada middleware (path, classname, method), en orden de ejecución.
+            flask_request: La solicitud Flask actual.
+        """
+        self.flask_request = flask_request
+        self._controller = Mount.dispatcher(next=controller, flask_request=flask_request)
+        self._stages = tuple((Mount.resolve(middleware), middleware["method"]) for middleware in (middlewares or []))
+
+    def __call__(self, **kwargs):
+        """
+        Atiende una solicitud; es la función de vista registrada en Flask.
+
+        Args:
+            kwargs: Argumentos de la ruta.
+
+        Returns:
+            any: La respuesta del primer middleware de la cadena.
+        """
+        context = Context(self.flask_request, kwargs)
+        return self.handle(0, context, kwargs)
+
+    def handle(self, index, context, arguments):
+        """
+        Ejecuta el middleware de la posición indicada o, al final de la cadena, el controlador.
+
+        Args:
+            index (int): Posición del middleware a ejecutar.
+            context (Context): El contexto de la solicitud.
+            arguments (dict): Argumentos de la ruta.
+
+        Returns:
+            any: La respuesta del middleware o del controlador.
+        """
+        if index >= len(self._stages):
+            return self._controller(**arguments)
+
+        new_class, method = self._stages[index]
+
+        # Instancia del middleware propia de la solicitud.
+        middleware_instance = new_class()
+        middleware_instance.request = context.request
+        middleware_instance.context = context
+        middleware_instance.next = Next(self, index + 1, context)
+
+        return getattr(middleware_instance, method)(**arguments)
@@ -5,6 +5,8 @@ import importlib
 from flask import request
 from lib.clarity.paths import Paths
 from lib.clarity.mount import Mount
+from lib.clarity.profiler import Profiler
+from lib.http.pipeline import Pipeline
 
 class Route:
     """
@@ -47,16 +49,47 @@ class Route:
         """
         self._base = base
 
-    def middleware(self, instance):
+    def middleware(self, *instances):
         """
-        Determina que la ruta debe pasar previamente por un middleware antes de llegar al controlador.
+        Determina que la ruta debe pasar previamente por uno o varios middlewares antes de llegar al controlador.
+        Los middlewares se ejecutan en el orden indicado.
 
         Args:
-            instance: El middleware opcional que se aplicará a las rutas definidas con esta instancia de Route.
+            *instances: Los middlewares que se aplicarán a las rutas definidas con esta instancia de Route,
+                como argumentos o en una sola lista: middleware(A, B) o middleware([A, B]).
         """
-        self._middleware = instance
+        if len(instances) == 1 and isinstance(instances[0], (list, tuple)):
+            instances = instances[0]
+
+        self._middleware = Route.middlewares(instances)
         return self
 
+    @staticmethod
+    def middlewares(instances):
+        """
+        Convierte una o varias clases de middleware en la lista de datos que se almacena en la ruta.
+
+        Args:
+            instances: Una clase de middleware o una lista/tupla de clases (puede ser None).
+
+        Returns:
+            list: Los datos (file, class, method) de cada middleware, en orden de ejecución.
+        """
+        if instances is None:
+            return []
+
+        if not isinstance(instances, (list, tuple)):
+            instances = [instances]
+
+        return [
+            {
+                "file": inspect.getmodule(instance).__name__,
+                "class": instance.__name__,
+                "method": 'handle'
+            }
+            for instance in instances
+        ]
+
     def prefix(self, prefix):
         """
         Determina que la ruta debe pasar previamente por un middleware antes de llegar al controlador.
@@ -76,11 +109,9 @@ class Route:
         """
         for route in args:
 
-            if self._middleware is not None:
-                # Agrega información del middleware a las rutas si está presente
-                route["middleware_file"] = inspect.getmodule(self._middleware).__name__
-                route["middleware_class"] = self._middleware.__name__
-                route["middleware_method"] = 'handle'
+            if self._middleware:
+                # Agrega los middlewares del grupo antes de los propios de la ruta
+                route["middlewares"] = self._middleware + route.get("middlewares", [])
 
             if self._prefix is not None:
                 # Agrega un prefijo a las URIs de las rutas si está presente
@@ -97,12 +128,13 @@ class Route:
             Router().set(route)
 
     @staticmethod
-    def post(url:str, controller:dict):
+    def post(url:str, controller:dict, middleware=None):
         """
             Define una ruta POST en el manejador de rutas.
             Args:
                 ruta (str): La ruta de la solicitud POST.
                 controller (dict): Un diccionario que contiene el controlador para la ruta POST, con la estructura (clase, método).
+                middleware: Un middleware o una lista de middlewares propios de la ruta (opcional).
             Returns:
                 dict: Un diccionario que describe la ruta POST, incluyendo el verbo HTTP, la URI, el módulo, la clase y el método controlador asociado.
         """
@@ -116,15 +148,19 @@ class Route:
             "method": method
         }
 
+        if middleware is not None:
+            data["middlewares"] = Route.middlewares(middleware)
+
         return data
 
     @staticmethod
-    def get(url:str, controller:dict):
+    def get(url:str, controller:dict, middleware=None):
         """
             Define una ruta GET en el manejador de rutas.
             Args:
                 ruta (str): La ruta de la solicitud GET.
                 controller (dict): Un diccionario que contiene el controlador para la ruta GET, con la estructura (clase, método).
+                middleware: Un middleware o una lista de middlewares propios de la ruta (opcional).
             Returns:
                 dict: Un diccionario que describe la ruta GET, incluyendo el verbo HTTP, la URI, el módulo, la clase y el método controlador asociado.
         """
@@ -138,6 +174,9 @@ class Route:
             "method": method
         }
 
+        if middleware is not None:
+            data["middlewares"] = Route.middlewares(middleware)
+
         return data
 
 class Router:
@@ -161,6 +200,8 @@ class Router:
 
         if not cls._instance:
             cls._instance = super(Router, cls).__new__(cls)
+            cls._instance._routes = []
+            cls._instance._keys = set()
         return cls._instance
 
     def __init__(self):
@@ -172,8 +213,11 @@ class Router:
 
     def clear(self):
         """
-            Borra el archivo de ruta si existe.
+            Vacía el registro de rutas en memoria y borra el archivo de rutas si existe.
         """
+        self._routes = []
+        self._keys = set()
+
         if os.path.exists(self.path):
             os.remove(self.path)
 
@@ -208,31 +252,29 @@ class Router:
             raise ValueError(f"No se encontró el metodo '{method}' dentro de la clase '{classname}' en el archivo '{path}'")
 
 
-    def uniqueUri(self, currentData, newData):
+    def uniqueUri(self, newData):
         """
-            Verifica si una nueva ruta tiene una URI única dentro de las rutas existentes.
+            Verifica si una nueva ruta tiene una URI única dentro de las rutas registradas.
             Args:
-                currentData (list): La lista de datos de rutas existentes.
                 newData (dict): Los datos de la nueva ruta que se está agregando.
             Returns:
-                bool: True si la URI de la nueva ruta es única, False de lo contrario.
+                bool: True si la URI de la nueva ruta es única.
             Raises:
                 ValueError: Si se intenta agregar una ruta con la misma URI y el mismo verbo que una ruta existente.
         """
-        for route in currentData:
-
-            verb = route["verb"]
-            uri = route["uri"]
+        verb = newData["verb"]
+        uri = newData["uri"]
 
-            if newData["verb"] == verb and newData["uri"] == uri:
-                self.clear()
-                raise ValueError(f"No pueden existir dos rutas con el mismo verbo y la misma uri, [{verb}] - [{uri}]")
+        if (verb, uri) in self._keys:
+            self.clear()
+            raise ValueError(f"No pueden existir dos rutas con el mismo verbo y la misma uri, [{verb}] - [{uri}]")
 
         return True
 
     def set(self, data):
         """
-            Agrega una nueva ruta al archivo de rutas.
+            Agrega una nueva ruta al registro de rutas en memoria.
+            El archivo de rutas se escribe una sola vez con compile().
             Args:
                 data (dict): Un diccionario que contiene los datos de la nueva ruta, incluyendo el módulo, la clase y el método.
             Raises:
@@ -242,33 +284,68 @@ class Router:
         file = data["file"]
         classname = data["class"]
         method = data["method"]
-        middleware_file = data["middleware_file"] if 'middleware_file' in data else None
-        middleware_classname= data["middleware_class"] if 'middleware_class' in data else None
-        middleware_method= data["middleware_method"] if 'middleware_method' in data else None
 
-        # Validar que existan las clases y los metodos tanto del Controlador como del Middleware.
-        self.validate(path=file, classname=classname, method=method)
+        # Validar que existan las clases y los metodos tanto del Controlador como de los Middlewares.
+        with Profiler.phase('router.validate'):
 
-        if middleware_file is not None:
-            self.validate(path=middleware_file, classname=middleware_classname, method=middleware_method)
+            self.validate(path=file, classname=classname, method=method)
 
-        # Extraer Contenido Actual
-        contenido = []
-        if os.path.exists(self.path):
-            with open(self.path, 'r') as f:
-                contenido = f.read()
-            contenido = json.loads(contenido)
+            for middleware in Router.middlewares(data):
+                self.validate(path=middleware["file"], classname=middleware["class"], method=middleware["method"])
 
         # Validar que no exista esta ruta y este vervbo en uso
         self.uniqueUri(
-            currentData=contenido,
             newData=data
         )
 
         # Agregar Nuevo contenido
-        contenido.append(data)
-        with open(self.path, 'w') as f:
-            f.write(json.dumps(contenido))
+        self._routes.append(data)
+        self._keys.add((data["verb"], data["uri"]))
+
+    @staticmethod
+    def middlewares(data):
+        """
+            Retorna los middlewares de una ruta en orden de ejecución.
+            Admite también el formato anterior de un solo middleware (middleware_file, middleware_class, middleware_method).
+            Args:
+                data (dict): Los datos de la ruta.
+            Returns:
+                list: Los datos (file, class, method) de cada middleware.
+        """
+        if data.get("middlewares"):
+            return data["middlewares"]
+
+        if data.get("middleware_file") is not None:
+            return [{
+                "file": data["middleware_file"],
+                "class": data["middleware_class"],
+                "method": data["middleware_method"]
+            }]
+
+        return []
+
+    def compile(self):
+        """
+            Escribe en un solo paso el archivo de rutas con todas las rutas registradas en memoria.
+            El archivo se reemplaza de forma atómica, por lo que varios workers pueden arrancar a la vez.
+        """
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        temporary = f"{self.path}.{os.getpid()}.tmp"
+        with open(temporary, 'w') as f:
+            f.write(json.dumps(self._routes))
+        os.replace(temporary, self.path)
+
+    def all(self):
+        """
+            Retorna las rutas registradas en memoria o, si no hay ninguna, las del archivo de rutas compilado.
+            Returns:
+                list: Los datos de todas las rutas.
+        """
+        if not self._routes and os.path.exists(self.path):
+            with open(self.path, 'r') as f:
+                return json.load(f)
+
+        return self._routes
 
 class BluePrint:
     """
@@ -285,24 +362,18 @@ class BluePrint:
         """
         self.app = app
         self.logger = logger
-        self.path = Router().path
 
     def routes(self):
         """
         Configura las rutas en la aplicación Flask.
 
-        Lee los datos de las rutas desde el archivo de rutas y las registra en la aplicación Flask.
+        Lee los datos de las rutas registradas y las registra en la aplicación Flask.
 
         Returns:
             La instancia de la aplicación Flask después de registrar todas las rutas.
         """
-        # Inicializa una lista para almacenar los datos de las rutas
-        routes_data = []
-        # Verifica si existe el archivo de rutas
-        if os.path.exists(self.path):
-            # Lee los datos de las rutas desde el archivo de rutas
-            with open(self.path, 'r') as f:
-                routes_data = json.load(f)
+        # Obtiene los datos de las rutas registradas
+        routes_data = Router().all()
 
         # Itera sobre los datos de las rutas
         for i, route_data in enumerate(routes_data):
@@ -320,17 +391,21 @@ class BluePrint:
                 "method" : route_data["method"]
             }
 
-            if 'middleware_file' in route_data and route_data["middleware_file"] is not None:
-                # Si hay un middleware, extrae sus datos
-                next_middleware = {
-                    "path" : route_data["middleware_file"],
-                    "classname" : route_data["middleware_class"],
-                    "method" : route_data["middleware_method"],
+            # Data Middlewares
+            next_middlewares = [
+                {
+                    "path" : middleware["file"],
+                    "classname" : middleware["class"],
+                    "method" : middleware["method"]
                 }
-                # Llama al middleware y obtiene el método a llamar
-                method_to_call = Mount.middleware(
-                    next=next_middleware,
-                    data_controller=next_controller,
+                for middleware in Router.middlewares(route_data)
+            ]
+
+            if next_middlewares:
+                # Si hay middlewares, compila la cadena middlewares -> controlador
+                method_to_call = Pipeline(
+                    controller=next_controller,
+                    middlewares=next_middlewares,
                     flask_request=request
                 )
             else:
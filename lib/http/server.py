@@ -0,0 +1,337 @@
+import os
+import sys
+import time
+import signal
+import socket
+import threading
+import traceback
+from werkzeug.serving import make_server, WSGIRequestHandler
+from lib.clarity.console import Console
+from lib.clarity.logger import Logger
+
+class PreforkServer:
+    """
+    Servidor WSGI de producción con múltiples procesos (pre-fork).
+
+    El proceso maestro abre el socket de escucha y recibe la aplicación ya cargada (rutas,
+    configuración y templates); cada worker se crea con os.fork() y comparte esa memoria
+    copy-on-write. Cada worker atiende las conexiones del socket compartido con hilos y
+    mantiene vivas las conexiones HTTP/1.1 durante 'keep_alive' segundos.
+
+    Al iniciar, cada worker descarta el estado heredado que no puede compartirse entre procesos
+    (pools de conexiones, pools de hilos y almacenes de cache) y lo crea de nuevo al usarlo.
+    Si los workers terminan al poco tiempo de iniciar, se reponen con una espera creciente y el
+    servidor se detiene tras 'max_failures' fallos seguidos.
+
+    Los workers atienden las solicitudes con el servidor de desarrollo de werkzeug (make_server):
+    no limita el tamaño ni el tiempo de las solicitudes y no está endurecido como gunicorn o
+    uWSGI, por lo que debe publicarse detrás de un proxy inverso (nginx, IIS) que los aplique.
+
+    Señales del proceso maestro:
+        SIGHUP: vuelve a leer el archivo .env y la configuración (Config.reload()) y reemplaza los
+            workers de forma ordenada; los nuevos workers usan los nuevos valores.
+            El código, las rutas y los valores que la aplicación leyó al arrancar no se recargan:
+            para aplicarlos se debe reiniciar el servidor.
+        SIGTERM / SIGINT: detiene los workers esperando las solicitudes en curso.
+    """
+
+    # Segundos que se espera a un worker antes de forzar su terminación.
+    graceful_timeout = 30
+
+    # Segundos que un worker debe permanecer activo para no contarse como un fallo al iniciar.
+    min_uptime = 2
+
+    # Espera inicial y maxima (segundos) antes de reponer workers que fallaron al iniciar.
+    backoff = 0.5
+    backoff_max = 10
+
+    # Fallos seguidos al iniciar tras los cuales se detiene el servidor.
+    max_failures = 5
+
+    # Estado heredado del maestro que cada worker descarta: (modulo, clase, {atributo: valor inicial}).
+    # Solo se reinician los modulos ya cargados; las conexiones heredadas no se cierran porque
+    # sus sockets pertenecen al maestro.
+    inherited = (
+        ('lib.builder.oracle', 'Oracle', {'_instances': dict, '_lock': threading.Lock}),
+        ('lib.builder.sqlserver', 'SQLServer', {'_instances': dict, '_lock': threading.Lock}),
+        ('lib.builder.aio', 'AsyncBuilder', {'_executors': dict, '_lock': threading.Lock}),
+        ('lib.builder.cache', 'QueryCache', {'_store': lambda: None, '_tags': dict, '_keys': dict, '_flights': dict, '_lock': threading.RLock}),
+        ('lib.cache.store', 'Cache', {'_stores': dict, '_lock': threading.Lock}),
+        ('lib.clarity.datatable', 'DataTable', {'_totals': lambda: None, '_totals_lock': threading.Lock})
+    )
+
+    def __init__(self, app, host='127.0.0.1', port=5000, workers=None, keep_alive=5, backlog=2048):
+        """
+        Inicializa el servidor.
+
+        Args:
+            app (Flask): La aplicación WSGI precargada.
+            host (str): Dirección de escucha.
+            port (int): Puerto de escucha.
+            workers (int, optional): Cantidad de procesos; por defecto la cantidad de CPUs.
+            keep_alive (int): Segundos que una conexión inactiva se mantiene abierta (0 la desactiva).
+            backlog (int): Tamaño de la cola de conexiones pendientes del socket.
+
+        Raises:
+            ValueError: Si la cantidad de workers, el keep-alive o el backlog no son válidos.
+        """
+        self.app = app
+        self.host = host
+        self.port = int(port)
+        self.workers = int(workers or os.cpu_count() or 1)
+        self.keep_alive = int(keep_alive)
+        self.backlog = int(backlog)
+
+        if self.workers < 1:
+            raise ValueError("[Server]: La cantidad de workers debe ser un entero positivo mayor que cero.")
+        if self.keep_alive < 0:
+            raise ValueError("[Server]: El keep-alive debe ser un entero mayor o igual a cero.")
+        if self.backlog < 1:
+            raise ValueError("[Server]: El backlog debe ser un entero positivo mayor que cero.")
+
+        self.socket = None
+        self._children = {}
+        self._stopping = False
+        self._reload = False
+
+        # Fallos seguidos al iniciar y momento a partir del cual se pueden reponer workers.
+        self._failures = 0
+        self._resume = 0
+
+    @staticmethod
+    def supported():
+        """
+        Indica si la plataforma permite crear workers con os.fork().
+
+        Returns:
+            bool: True si os.fork() está disponible.
+        """
+        return hasattr(os, 'fork')
+
+    def handler(self):
+        """
+        Crea el manejador de solicitudes con el keep-alive configurado.
+
+        Returns:
+            type: Subclase de WSGIRequestHandler.
+        """
+        keep_alive = self.keep_alive
+
+        class Handler(WSGIRequestHandler):
+
+            # HTTP/1.1 mantiene la conexion abierta; HTTP/1.0 la cierra tras cada respuesta.
+            protocol_version = "HTTP/1.1" if keep_alive > 0 else "HTTP/1.0"
+
+            # Tiempo maximo de inactividad del socket del cliente.
+            timeout = keep_alive if keep_alive > 0 else None
+
+            def log_request(self, code='-', size='-'):
+                pass
+
+        return Handler
+
+    def listen(self):
+        """
+        Abre el socket de escucha compartido por los workers.
+        """
+        family = socket.AF_INET6 if ':' in self.host else socket.AF_INET
+        self.socket = socket.create_server((self.host, self.port), family=family, backlog=self.backlog)
+        self.socket.set_inheritable(True)
+        self.port = self.socket.getsockname()[1]
+
+    def run(self):
+        """
+        Inicia el proceso maestro: abre el socket, crea los workers y los supervisa hasta recibir SIGTERM o SIGINT.
+
+        Raises:
+            RuntimeError: Si los workers fallan al iniciar 'max_failures' veces seguidas.
+        """
+        self.listen()
+
+        signal.signal(signal.SIGTERM, self._signal_stop)
+        signal.signal(signal.SIGINT, self._signal_stop)
+        signal.signal(signal.SIGHUP, self._signal_reload)
+
+        Console.info(f" * Servidor de producción en http://{self.host}:{self.port} (maestro {os.getpid()}, {self.workers} workers)")
+
+        try:
+            for _ in range(self.workers):
+                self.spawn()
+
+            while not self._stopping:
+
+                # Recarga ordenada de los workers
+                if self._reload:
+                    self._reload = False
+                    self.reload()
+
+                self.reap()
+
+                # Detener el servidor si los workers no logran iniciar
+                if self._failures >= self.max_failures:
+                    raise RuntimeError(f"[Server]: Los workers fallaron al iniciar {self._failures} veces seguidas, se detiene el servidor.")
+
+                # Reponer workers terminados inesperadamente (con espera tras fallos al iniciar)
+                while not self._stopping and len(self._children) < self.workers and time.monotonic() >= self._resume:
+                    self.spawn()
+
+                # Los workers que superan min_uptime reinician el conteo de fallos
+                if self._failures and len(self._children) == self.workers and all(
+                    time.monotonic() - started >= self.min_uptime for started in self._children.values()
+                ):
+                    self._failures = 0
+
+                time.sleep(0.2)
+        finally:
+            self.stop(list(self._children))
+            self.socket.close()
+            Console.info(" * Servidor de producción detenido")
+
+    def spawn(self):
+        """
+        Crea un worker con os.fork().
+
+        Returns:
+            int: El PID del worker creado.
+        """
+        pid = os.fork()
+
+        if pid == 0:
+            code = 0
+            try:
+                self.reset()
+                self.work()
+            except BaseException:
+                code = 1
+
+                # Registrar el error antes de terminar el worker
+                error = traceback.format_exc()
+                Console.danger(f" * El worker {os.getpid()} terminó por un error:\n{error}")
+                Logger().error(message=f"Worker {os.getpid()}: {error}")
+            finally:
+                os._exit(code)
+
+        self._children[pid] = time.monotonic()
+        return pid
+
+    @classmethod
+    def reset(cls):
+        """
+        Descarta en el worker el estado heredado del maestro que no puede compartirse entre procesos
+        (ver 'inherited'); cada pool o almacen se crea de nuevo la primera vez que el worker lo usa.
+        """
+        for module, classname, attributes in cls.inherited:
+            if module in sys.modules:
+                owner = getattr(sys.modules[module], classname)
+                for attribute, initial in attributes.items():
+                    setattr(owner, attribute, initial())
+
+    def work(self):
+        """
+        Ciclo del worker: atiende las conexiones del socket compartido hasta recibir SIGTERM.
+        """
+        # El maestro coordina SIGINT y SIGHUP
+        signal.signal(signal.SIGINT, signal.SIG_IGN)
+        signal.signal(signal.SIGHUP, signal.SIG_IGN)
+
+        server = make_server(
+            self.host,
+            self.port,
+            self.app,
+            threaded=True,
+            request_handler=self.handler(),
+            fd=self.socket.fileno()
+        )
+
+        # Al detenerse se esperan los hilos con solicitudes en curso
+        server.daemon_threads = False
+
+        def shutdown(signum, frame):
+            threading.Thread(target=server.shutdown, daemon=True).start()
+
+        signal.signal(signal.SIGTERM, shutdown)
+
+        try:
+            server.serve_forever()
+        finally:
+            server.server_close()
+
+    def reap(self):
+        """
+        Retira de la supervisión los workers que terminaron y cuenta los que fallaron al iniciar.
+        """
+        failed = False
+
+        for pid in list(self._children):
+            try:
+                finished, _ = os.waitpid(pid, os.WNOHANG)
+            except ChildProcessError:
+                finished = pid
+            if finished:
+                started = self._children.pop(pid, None)
+                if started is not None and time.monotonic() - started < self.min_uptime:
+                    failed = True
+
+        # Espera creciente antes de reponer los workers
+        if failed and not self._stopping:
+            self._failures += 1
+            delay = min(self.backoff * 2 ** (self._failures - 1), self.backoff_max)
+            self._resume = time.monotonic() + delay
+            Console.warning(f" * Los workers terminaron al iniciar ({self._failures}/{self.max_failures}), se reponen en {delay:.1f} s")
+
+    def reload(self):
+        """
+        Recarga la configuración y reemplaza los workers: primero se crean los nuevos y luego
+        se detienen los anteriores, que terminan sus solicitudes en curso. Los nuevos workers
+        crean sus pools con la nueva configuración; el código de la aplicación no se recarga.
+        """
+        from lib.environment.config import Config
+
+        Console.info(" * Recargando la configuración y los workers")
+        Config.reload()
+
+        old = list(self._children)
+        for _ in range(self.workers):
+            self.spawn()
+        self.stop(old)
+
+    def stop(self, pids):
+        """
+        Detiene los workers indicados de forma ordenada y fuerza los que superen graceful_timeout.
+
+        Args:
+            pids (list): Los PID de los workers a detener.
+        """
+        for pid in pids:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+        deadline = time.monotonic() + self.graceful_timeout
+        pending = set(pids)
+
+        while pending and time.monotonic() < deadline:
+            for pid in list(pending):
+                try:
+                    finished, _ = os.waitpid(pid, os.WNOHANG)
+                except ChildProcessError:
+                    finished = pid
+                if finished:
+                    pending.discard(pid)
+                    self._children.pop(pid, None)
+            time.sleep(0.05)
+
+        for pid in pending:
+            try:
+                os.kill(pid, signal.SIGKILL)
+                os.waitpid(pid, 0)
+            except (ProcessLookupError, ChildProcessError):
+                pass
+            self._children.pop(pid, None)
+
+    def _signal_stop(self, signum, frame):
+        self._stopping = True
+
+    def _signal_reload(self, signum, frame):
+        self._reload = True
@@ -5,7 +5,10 @@ from lib.environment.env import Env
 from lib.clarity.cache import ControlCache
 from lib.clarity.paths import Paths
 from lib.clarity.logger import Logger
-from lib.http.router import BluePrint
+from lib.clarity.profiler import Profiler
+from lib.clarity.modules import ModuleIndex
+from lib.http.router import BluePrint, Router
+from lib.builder.pool import ConnectionPool
 from lib.environment.config import Config
 from lib.clarity.console import Console
 from lib.http.response import JsonResponse
@@ -77,7 +80,7 @@ class HttpKernel:
             cls._instance = super().__new__(cls)
         return cls._instance
 
-    def __init__(self, bytecode=True, debug=None, logger=None):
+    def __init__(self, bytecode=True, debug=None, logger=None, production=None):
         """
         Inicializa una instancia de la clase HttpKernel.
 
@@ -85,26 +88,50 @@ class HttpKernel:
             bytecode (bool): Indica si se emplea el bytecode.
             debug (bool): Indica si se emplea el modo debug.
             logger (bool): Indica si se emplea el logger.
+            production (bool): Indica si se emplea el arranque de producción; por defecto se activa si APP_ENVIRONMENT es 'production'.
         """
 
-        # Vaciar Cache
-        ControlCache.clear()
-        Config().destroy()
-
         # Cargar el ENV
-        Env.init()
+        with Profiler.phase('env'):
+            Env.init()
+
+        # Definir el modo de arranque
+        self.production = HttpKernel.is_production() if production is None else production
+
+        with Profiler.phase('config'):
+
+            if self.production:
+
+                # Conservar el bytecode y regenerar la configuracion solo si esta desactualizada
+                if Config().stale():
+                    Config().destroy()
 
-        # crear Cache de Configuracion.
-        Config().mount()
+            else:
+
+                # Vaciar Cache
+                with Profiler.phase('bytecode.clear'):
+                    ControlCache.clear()
+                Config().destroy()
+
+                # Regenerar el indice de modulos
+                ModuleIndex.rebuild()
+
+            # crear Cache de Configuracion.
+            Config().mount()
+            Config().read()
 
         # Iniciar app de flask
-        self.app = LaraFlask(__name__)
+        with Profiler.phase('flask'):
+            self.app = LaraFlask(__name__)
 
         # Definir carpeta de sesoion
         self.app.config['SESSION_FILE_DIR'] = Paths.session()
 
-        # Definir si se emplea bytecode
-        sys.dont_write_bytecode = bytecode
+        # Devolver al pool las conexiones reservadas por cada solicitud
+        self.app.teardown_appcontext(ConnectionPool.teardown)
+
+        # Definir si se emplea bytecode (en produccion siempre se conserva)
+        sys.dont_write_bytecode = False if self.production else bytecode
 
         # Definir si se emplea debug a la app
         self.debug = Config.app("debug") if debug is None else debug
@@ -113,17 +140,23 @@ class HttpKernel:
         self.logger = Config.app("logger") if logger is None else logger
 
         # Aplicar configuracion de CORS App
-        CORS(
-            app=self.app,
-            methods=Config.cors('allowed_methods'),
-            origins=Config.cors('allowed_origins'),
-            allow_headers=Config.cors('allowed_headers'),
-            expose_headers=Config.cors('exposed_headers'),
-            max_age=Config.cors('max_age')
-        )
+        with Profiler.phase('cors'):
+            CORS(
+                app=self.app,
+                methods=Config.cors('allowed_methods'),
+                origins=Config.cors('allowed_origins'),
+                allow_headers=Config.cors('allowed_headers'),
+                expose_headers=Config.cors('exposed_headers'),
+                max_age=Config.cors('max_age')
+            )
 
         # Ejecutar la creacion de las Rutas
-        importlib.import_module('routes.api')
+        with Profiler.phase('routes'):
+            importlib.import_module('routes.api')
+
+        # Compilar el archivo de rutas
+        with Profiler.phase('routes.compile'):
+            Router().compile()
 
         # Marce de Log
         if self.logger:
@@ -135,6 +168,19 @@ class HttpKernel:
                 message=f"Inicio de Ejecución. {starTimestamp}"
             )
 
+    @staticmethod
+    def is_production():
+        """
+        Indica si el entorno de la aplicación (APP_ENVIRONMENT) es de producción.
+
+        En producción el arranque conserva el bytecode y el cache de configuración,
+        que solo se regeneran con 'artisan cache:clear' o si la configuración cambia.
+
+        Returns:
+            bool: True si la aplicación se ejecuta en producción.
+        """
+        return str(Env.get("APP_ENVIRONMENT", "")).strip().lower() in ('production', 'prod')
+
     def blueprint(self):
         """
         Monta las rutas definidas para el sistema en la subinstancia de Flask.
@@ -143,7 +189,8 @@ class HttpKernel:
             Retorna La instancia de la aplicación Flask.
         """
 
-        app = BluePrint(app=self.app, logger=self.logger).routes()
+        with Profiler.phase('blueprint'):
+            app = BluePrint(app=self.app, logger=self.logger).routes()
         return app
 
 class Bootstrap:
@@ -19,6 +19,10 @@ class CliKernel:
         parser.add_argument('--no-reload', action='store_false', help='Habilitar modo en subprocesos')
         parser.add_argument('--host', help='Direccion sobre la cual se ejecutará', default='127.0.0.1')
         parser.add_argument('--port', help='Puerto de Salida', default='5000')
+        parser.add_argument('--production', action='store_true', help='Servidor de produccion con multiples procesos')
+        parser.add_argument('--workers', type=int, default=None, help='Cantidad de procesos del servidor de produccion (por defecto la cantidad de CPUs)')
+        parser.add_argument('--keep-alive', type=int, default=5, help='Segundos que se mantiene abierta una conexion inactiva')
+        parser.add_argument('--backlog', type=int, default=2048, help='Cantidad maxima de conexiones pendientes')
         parser.add_argument('--path', help='Ubicacion del archivo')
         parser.add_argument('--classname', help='Nombre de la clase a ejecutar')
         parser.add_argument('--params', default=None, help='Diccionario para pasar al constructor del commando')
@@ -35,7 +39,11 @@ class CliKernel:
                 debug=self._cli_args.no_debug,
                 use_reloader=self._cli_args.no_reload,
                 host=self._cli_args.host,
-                port=self._cli_args.port
+                port=self._cli_args.port,
+                production=self._cli_args.production,
+                workers=self._cli_args.workers,
+                keep_alive=self._cli_args.keep_alive,
+                backlog=self._cli_args.backlog
             )
 
         elif command == 'schedule':
@@ -61,3 +69,23 @@ class CliKernel:
                 params=None,
                 custom=False
             )
+
+        elif command == 'view:cache':
+
+            # Precompila Los Templates De Las Vistas.
+            ExecuteCommand().handler(
+                path='lib.kernel.commands.view',
+                classname='ViewCacheCommand',
+                params=None,
+                custom=False
+            )
+
+        elif command == 'boot:profile':
+
+            # Perfila El Arranque Del Marco.
+            ExecuteCommand().handler(
+                path='lib.kernel.commands.profile',
+                classname='BootProfileCommand',
+                params=None,
+                custom=False
+            )
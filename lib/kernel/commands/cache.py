@@ -1,8 +1,10 @@
 import importlib
 from app.console.kernel import Kernel
 from lib.clarity.cache import ControlCache
+from lib.clarity.modules import ModuleIndex
 from lib.environment.config import Config
-from lib.environment.env import Env
+from lib.http.router import Router
+from lib.view.engine import View
 from lib.win64.tasks import WindowsScheduler
 
 class RegenerateCacheCommand:
@@ -17,18 +19,21 @@ class RegenerateCacheCommand:
         Manejador del comando
         """
 
-        # Vaciar Cache
-        Config().destroy()
-
-        # Cargar el ENV
-        Env.init()
-
-        # Crear Nuevamente El Cache de Configuracion.
-        Config().mount()
+        # Regenerar El Cache de Configuracion (ENV y carpeta config).
+        Config.reload()
 
         # Ejecutar la creacion de las Rutas
         importlib.import_module('routes.api')
 
+        # Compilar el archivo de rutas
+        Router().compile()
+
         # Eliminar Recursivamente Bytecode
         ControlCache.clear()
 
+        # Eliminar Los Templates Compilados
+        View.clear()
+
+        # Regenerar El Indice De Modulos
+        ModuleIndex.rebuild()
+
@@ -0,0 +1,146 @@
+import os
+import re
+import sys
+import datetime
+import subprocess
+from lib.clarity.console import Console
+from lib.clarity.paths import Paths
+from lib.clarity.profiler import Profiler
+
+class BootProfileCommand:
+
+    """
+    Comando para perfilar el arranque del marco (HttpKernel).
+
+    Reporta el tiempo de cada fase del arranque, el tiempo de importación de cada módulo
+    (python -X importtime) y genera un archivo de pilas plegadas en storage/profile,
+    compatible con flamegraph.pl y speedscope.
+    """
+
+    # Codigo que arranca el marco en el subproceso de importacion.
+    _boot = "from lib.kernel.app import HttpKernel; HttpKernel().blueprint()"
+
+    def handle(self):
+
+        """
+        Manejador del comando
+        """
+
+        # Perfilar las fases del arranque en este proceso
+        phases = self.phases()
+
+        # Perfilar la importacion de modulos en un proceso limpio
+        try:
+            imports = self.imports()
+        except RuntimeError as error:
+            Console.danger(str(error))
+            return
+
+        # Reporte de fases
+        Console.write("=============================================================")
+        Console.info("Boot phases")
+        Console.write("=============================================================")
+        for phase in phases:
+            name = "  " * (len(phase['path']) - 1) + phase['path'][-1]
+            calls = f" ({phase['calls']} calls)" if phase['calls'] > 1 else ""
+            Console.write(f"{name:<40} {phase['seconds'] * 1000:>10.2f} ms{calls}")
+
+        # Reporte de importaciones
+        Console.write("=============================================================")
+        Console.info("Slowest imports (cumulative)")
+        Console.write("=============================================================")
+        for module in sorted(imports, key=lambda item: item['cumulative'], reverse=True)[:25]:
+            Console.write(f"{module['module']:<40} {module['cumulative'] / 1000:>10.2f} ms  (self {module['self'] / 1000:.2f} ms)")
+
+        # Archivo para flamegraph
+        path = self.write(Profiler.folded(), imports)
+        Console.success(f"Flamegraph: {path}")
+
+    def phases(self):
+
+        """
+        Arranca el HttpKernel con el perfilador activo.
+
+        Returns:
+            list: Las fases medidas.
+        """
+        from lib.kernel.app import HttpKernel
+
+        Profiler.enable()
+        try:
+            with Profiler.phase('boot'):
+                HttpKernel().blueprint()
+        finally:
+            Profiler.disable()
+
+        return Profiler.phases()
+
+    def imports(self):
+
+        """
+        Arranca el marco en un subproceso con 'python -X importtime' y procesa su reporte.
+
+        Returns:
+            list: Diccionarios con el módulo, su profundidad, el tiempo propio y el acumulado (microsegundos).
+
+        Raises:
+            RuntimeError: Si el arranque falla en el subproceso (el reporte estaría incompleto).
+        """
+        env = dict(os.environ)
+        env['PYTHONPATH'] = os.pathsep.join(filter(None, [os.path.abspath(Paths.base()), env.get('PYTHONPATH')]))
+
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', self._boot],
+            cwd=Paths.base(),
+            env=env,
+            capture_output=True,
+            text=True
+        )
+
+        # Un arranque fallido deja un reporte parcial: se informa el error en su lugar
+        if result.returncode != 0:
+            output = "\n".join(line for line in result.stderr.splitlines() if not line.startswith('import time:'))
+            raise RuntimeError(f"[Profile]: El arranque falló en el subproceso (código {result.returncode}):\n{output.strip()}")
+
+        imports = []
+        for line in result.stderr.splitlines():
+            match = re.match(r'import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)', line)
+            if match:
+                imports.append({
+                    'module': match.group(4),
+                    'depth': (len(match.group(3)) - 1) // 2,
+                    'self': int(match.group(1)),
+                    'cumulative': int(match.group(2))
+                })
+
+        return imports
+
+    def write(self, phases, imports):
+
+        """
+        Escribe el archivo de pilas plegadas con las fases y las importaciones.
+
+        Args:
+            phases (list): Las líneas plegadas de las fases.
+            imports (list): Las importaciones procesadas.
+
+        Returns:
+            str: La ruta del archivo generado.
+        """
+        lines = [f"phases;{line}" for line in phases]
+
+        # -X importtime reporta cada modulo despues de sus dependencias; se reconstruyen las pilas de abajo hacia arriba.
+        stack = []
+        for module in reversed(imports):
+            del stack[module['depth']:]
+            stack.append(module['module'])
+            lines.append(f"imports;{';'.join(stack)} {module['self']}")
+
+        folder = Paths.storage('profile')
+        os.makedirs(folder, exist_ok=True)
+
+        path = os.path.join(folder, f"boot-{datetime.datetime.now().strftime('%Y%m%d-%H%M%S')}.folded")
+        with open(path, 'w') as f:
+            f.write("\n".join(lines) + "\n")
+
+        return os.path.normpath(path)
@@ -1,5 +1,6 @@
 import os
 import time
+from lib.clarity.console import Console
 
 class ServeCommand:
 
@@ -7,11 +8,14 @@ class ServeCommand:
     Comando para inicializar el servidor de desarrollo.
     """
 
-    def handler(self, debug, use_reloader, host, port):
+    def handler(self, debug, use_reloader, host, port, production=False, workers=None, keep_alive=5, backlog=2048):
 
         """
         Manejador del comando
         """
+        if production:
+            return self.production(host, port, workers, keep_alive, backlog)
+
         self.elegant_loading()
         self.clear_console()
 
@@ -24,6 +28,47 @@ class ServeCommand:
             threaded=True
         )
 
+    def production(self, host, port, workers, keep_alive, backlog):
+
+        """
+        Inicia el servidor de producción con múltiples procesos (pre-fork).
+        La aplicación se carga antes de crear los workers para compartir rutas, configuración y templates.
+
+        APP_ENVIRONMENT se define como 'production' solo si no está definido en el sistema ni en el
+        archivo .env; un valor distinto se respeta y se advierte en la consola.
+        """
+        from lib.environment.env import Env
+        from lib.http.server import PreforkServer
+
+        # El entorno definido por el sistema o el .env tiene prioridad
+        environment = str(Env.get('APP_ENVIRONMENT', '')).strip()
+        if not environment:
+            os.environ['APP_ENVIRONMENT'] = 'production'
+        elif environment.lower() not in ('production', 'prod'):
+            Console.warning(f" * APP_ENVIRONMENT='{environment}': el servidor de producción se inicia con el arranque de ese entorno.")
+
+        from bootstrap.app import laraflask
+
+        if not PreforkServer.supported():
+            Console.warning(" * os.fork() no está disponible en esta plataforma, se usa el servidor con hilos.")
+            laraflask.run(
+                debug=False,
+                use_reloader=False,
+                host=host,
+                port=port,
+                threaded=True
+            )
+            return
+
+        PreforkServer(
+            app=laraflask,
+            host=host,
+            port=port,
+            workers=workers,
+            keep_alive=keep_alive,
+            backlog=backlog
+        ).run()
+
     def clear_console(self):
 
         """Función para limpiar la consola según el sistema operativo."""
@@ -0,0 +1,34 @@
+from lib.clarity.console import Console
+from lib.environment.config import Config
+from lib.view.engine import View
+
+class ViewCacheCommand:
+
+    """
+    Comando para precompilar todos los templates HTML del Sistema.
+
+    El bytecode solo se conserva si 'bytecode_cache' está activo en config/view.py; de lo
+    contrario los templates se compilan en la memoria de cada proceso y el comando no los precompila.
+    """
+
+    def handle(self):
+
+        """
+        Manejador del comando
+        """
+
+        # Descartar el bytecode anterior
+        View.clear()
+
+        # Sin cache de bytecode no hay nada que conservar en disco
+        if not Config.view('bytecode_cache'):
+            Console.warning("El cache de bytecode de las vistas está desactivado (VIEW_BYTECODE_CACHE), no se precompilaron templates.")
+            return
+
+        # Compilar Nuevamente Los Templates
+        templates = View.compile()
+
+        # Informar los templates compilados
+        for template in templates:
+            Console.info(f"Compilado: {template}")
+        Console.success(f"Templates compilados: {len(templates)}")
@@ -1,22 +1,93 @@
-from jinja2 import Environment, FileSystemLoader, select_autoescape
+import os
+import threading
+from flask import Response, stream_with_context
+from jinja2 import Environment, FileSystemLoader, FileSystemBytecodeCache, select_autoescape
 from lib.clarity.paths import Paths
+from lib.environment.config import Config
 
 class View:
     """
     Esta clase permite ejecutar acciones con vistas HTML utilizando Jinja2.
     """
 
+    # Entorno de Jinja2 compartido por todo el proceso.
+    _environment = None
+    _lock = threading.Lock()
+
+    @staticmethod
+    def environment():
+        """
+        Retorna el entorno de Jinja2 del proceso, creándolo una sola vez.
+
+        Los templates compilados se conservan en memoria (cache acotado por 'cache_size') y solo
+        se vuelven a leer del disco si cambian cuando la aplicación está en modo debug.
+        Opcionalmente el bytecode se guarda en disco para que otros procesos no deban recompilarlos.
+
+        Returns:
+            Environment: El entorno de Jinja2.
+        """
+        if View._environment is None:
+
+            with View._lock:
+
+                if View._environment is None:
+
+                    bytecode_cache = None
+                    if Config.view('bytecode_cache'):
+                        compiled = View.compiled()
+                        os.makedirs(compiled, exist_ok=True)
+                        bytecode_cache = FileSystemBytecodeCache(directory=compiled)
+
+                    View._environment = Environment(
+                        loader=FileSystemLoader(Paths.views()),
+                        autoescape=select_autoescape(['html', 'xml']),
+                        cache_size=Config.view('cache_size') or 400,
+                        auto_reload=bool(Config.app('debug')),
+                        bytecode_cache=bytecode_cache
+                    )
+
+        return View._environment
+
+    @staticmethod
+    def compiled():
+        """
+        Retorna la carpeta donde se guarda el bytecode de los templates.
+        """
+        return os.path.join(Paths.base(), Config.view('compiled') or os.path.join("bootstrap", "cache", "views"))
+
+    @staticmethod
+    def compile():
+        """
+        Precompila todos los templates HTML de la carpeta de vistas.
+
+        Returns:
+            list: Los nombres de los templates compilados.
+        """
+        env = View.environment()
+        templates = env.list_templates(extensions=['html'])
+
+        for template in templates:
+            env.get_template(template)
+
+        return templates
+
+    @staticmethod
+    def clear():
+        """
+        Descarta el entorno del proceso y el bytecode guardado en disco.
+        """
+        with View._lock:
+            View._environment = None
+
+        if os.path.isdir(View.compiled()):
+            FileSystemBytecodeCache(directory=View.compiled()).clear()
+
     @staticmethod
     def make(template:str, vars=None):
         """
         Crea una instancia de ViewActions para renderizar un template HTML.
         """
-        env = Environment(
-            loader=FileSystemLoader(Paths.views()),
-            autoescape=select_autoescape(['html', 'xml'])
-        )
-
-        template_obj = env.get_template(f"{template}.html")
+        template_obj = View.environment().get_template(f"{template}.html")
         return ViewActions(template_obj, vars)
 
 class ViewActions:
@@ -35,8 +106,29 @@ class ViewActions:
         """
         return self.template_obj.render(**self.vars)
 
+    def stream(self, buffer:int = 5, mimetype:str = 'text/html'):
+        """
+        Renderiza el template HTML por partes y lo retorna como una respuesta en streaming.
+
+        El navegador recibe el HTML a medida que se genera, sin mantener la página completa
+        en memoria; útil para reportes que recorren miles de filas.
+
+        Args:
+            buffer (int): Cantidad de fragmentos que se agrupan antes de enviarlos (0 = enviar cada fragmento).
+            mimetype (str): Tipo de contenido de la respuesta.
+
+        Returns:
+            Response: La respuesta de Flask en streaming.
+        """
+        stream = self.template_obj.stream(**self.vars)
+
+        if buffer and buffer > 1:
+            stream.enable_buffering(size=buffer)
+
+        return Response(stream_with_context(stream), mimetype=mimetype)
+
     def html(self):
         """
         Retorna el contenido HTML del template.
         """
-        return self.template_obj.template_source
\ No newline at end of file
+        return self.template_obj.template_source
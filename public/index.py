@@ -27,7 +27,8 @@ paths = [
 #--------------------------------------------------------------------------
 #
 # En esta seccion registraremos los archivos de nuestra solicion en el
-# BasePath de este proyecto.
+# BasePath de este proyecto. Los modulos de las carpetas se resuelven con
+# un indice precompilado (bootstrap/cache/modules.json).
 #
 #--------------------------------------------------------------------------
 basepath = os.path.join(os.path.abspath(os.path.dirname(__file__)), '../')
@@ -35,10 +36,12 @@ basepath = os.path.join(os.path.abspath(os.path.dirname(__file__)), '../')
 if basepath not in sys.path:
     sys.path.append(basepath)
 
-for folder in paths:
-    for root, dirs, files in os.walk(os.path.join(basepath, folder)):
-        if root not in sys.path:
-            sys.path.append(root)
+from lib.clarity.modules import ModuleIndex
+
+ModuleIndex.install(
+    basepath=basepath,
+    folders=paths
+)
 
 #--------------------------------------------------------------------------
 # Obtener Instancia de la Aplicacion
@@ -0,0 +1,263 @@
+import sys
+import types
+import copy
+import threading
+import unittest
+from collections import deque
+
+class FakeCursor:
+    """
+    Cursor de prueba: registra cada sentencia en la base de datos falsa y entrega los
+    resultados programados con FakeDatabase.result().
+    """
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.database = connection.database
+        self.arraysize = 100
+        self.prefetchrows = 2
+        self.description = None
+        self.rowcount = -1
+        self.lastrowid = None
+        self.fast_executemany = False
+        self.closed = False
+        self._rows = deque()
+        self._errors = []
+        self.database.cursors.append(self)
+
+    def execute(self, statement, params=None):
+        self.database.executed.append({
+            'statement': statement,
+            'params': params,
+            'arraysize': self.arraysize,
+            'prefetchrows': self.prefetchrows,
+            'connection': self.connection
+        })
+        headers, rows = self.database.results.popleft() if self.database.results else (['RESULT'], [])
+        self.description = [(header,) for header in headers]
+        self._rows = deque(rows)
+        self.rowcount = len(rows)
+        return self
+
+    def executemany(self, statement, params, **kwargs):
+        params = list(params)
+        self.database.batches.append({
+            'statement': statement,
+            'params': params,
+            'options': kwargs,
+            'fast_executemany': self.fast_executemany,
+            'connection': self.connection
+        })
+        self._errors = self.database.batch_errors.popleft() if self.database.batch_errors else []
+        self.rowcount = len(params)
+
+    def fetchall(self):
+        rows, self._rows = list(self._rows), deque()
+        return rows
+
+    def fetchmany(self, size=None):
+        size = size or self.arraysize
+        return [self._rows.popleft() for _ in range(min(size, len(self._rows)))]
+
+    def fetchone(self):
+        return self._rows.popleft() if self._rows else None
+
+    def getbatcherrors(self):
+        return self._errors
+
+    def setinputsizes(self, *args, **kwargs):
+        self.database.input_sizes.append(args)
+
+    def close(self):
+        self.closed = True
+
+class FakeConnection:
+    """
+    Conexión de prueba con conteo de commits y rollbacks.
+    """
+
+    def __init__(self, database):
+        self.database = database
+        self.commits = 0
+        self.rollbacks = 0
+        self.closed = False
+        self.autocommit = False
+        database.connections.append(self)
+
+    def cursor(self):
+        if self.database.fail_cursor:
+            raise self.database.module.Error("cursor failure")
+        return FakeCursor(self)
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+    def close(self):
+        self.closed = True
+
+class FakeSessionPool:
+    """
+    Pool de sesiones de prueba con la interfaz de cx_Oracle.SessionPool.
+    """
+
+    def __init__(self, database, **kwargs):
+        self.database = database
+        self.options = kwargs
+        self.busy = 0
+        self.closed = False
+        database.pools.append(self)
+
+    def acquire(self):
+        self.busy += 1
+        return FakeConnection(self.database)
+
+    def release(self, connection):
+        self.busy -= 1
+
+    def close(self, force=False):
+        self.closed = True
+
+class FakeDatabase:
+    """
+    Estado compartido de los drivers falsos: sentencias ejecutadas y resultados programados.
+    """
+
+    def __init__(self, module):
+        self.module = module
+        self.reset()
+
+    def reset(self):
+        self.executed = []
+        self.batches = []
+        self.input_sizes = []
+        self.results = deque()
+        self.batch_errors = deque()
+        self.connections = []
+        self.cursors = []
+        self.pools = []
+        self.fail_cursor = False
+
+    def result(self, headers, rows):
+        """Programa el resultado de la siguiente sentencia ejecutada."""
+        self.results.append((list(headers), list(rows)))
+
+def _driver(name):
+    """
+    Crea un módulo con la interfaz mínima de cx_Oracle o pyodbc respaldado por una FakeDatabase.
+    """
+    module = types.ModuleType(name)
+    module.Error = type('Error', (Exception,), {})
+    module.DatabaseError = module.Error
+    module.database = FakeDatabase(module)
+    module.STRING = 'STRING'
+    module.CLOB = 'CLOB'
+    module.SPOOL_ATTRVAL_TIMEDWAIT = 3
+    module.SessionPool = lambda **kwargs: FakeSessionPool(module.database, **kwargs)
+    module.connect = lambda *args, **kwargs: FakeConnection(module.database)
+    return module
+
+# Drivers falsos de las pruebas (se registran solo si el driver real no está instalado).
+cx_Oracle = _driver('cx_Oracle')
+pyodbc = _driver('pyodbc')
+
+for _module in (cx_Oracle, pyodbc):
+    try:
+        __import__(_module.__name__)
+    except ImportError:
+        sys.modules[_module.__name__] = _module
+
+from lib.environment.config import Config
+
+# Configuracion base de las pruebas (sin archivos ni variables de entorno).
+SETTINGS = {
+    'app': {'debug': False, 'name': 'LaraFlask'},
+    'cors': {},
+    'database': {
+        'oracle': {
+            'default': {
+                'username': 'user', 'password': 'secret', 'host': 'localhost', 'service': 'XE',
+                'pool': {'min': 1, 'max': 4, 'increment': 1, 'timeout': 1, 'ping_interval': 0, 'statement_cache': 20}
+            }
+        },
+        'sqlserver': {
+            'default': {
+                'username': 'user', 'password': 'secret', 'host': 'localhost', 'database': 'test', 'port': 1433,
+                'pool': {'max': 2, 'timeout': 0.2, 'idle_timeout': 300, 'max_lifetime': 1800, 'validation': 'SELECT 1', 'ping_interval': 0}
+            }
+        }
+    },
+    'endpoints': {},
+    'mail': {},
+    'cache': {'driver': 'memory', 'ttl': 60, 'size': 64, 'path': 'bootstrap/cache/cache.sqlite', 'headers': ['Accept', 'Accept-Language']},
+    'view': {'cache_size': 50, 'bytecode_cache': False, 'compiled': 'bootstrap/cache/views'}
+}
+
+def configure(**sections):
+    """
+    Reemplaza la instantánea de Config por SETTINGS con las secciones indicadas combinadas.
+
+    Args:
+        **sections: Secciones a combinar (por ejemplo cache={'size': 2}).
+    """
+    settings = copy.deepcopy(SETTINGS)
+    for section, values in sections.items():
+        settings.setdefault(section, {}).update(values)
+
+    snapshot = Config._freeze(settings)
+    index = {}
+    Config._flatten(snapshot, "", index)
+    Config._index = index
+    Config._snapshot = snapshot
+
+def restore():
+    """
+    Descarta la instantánea de Config de las pruebas.
+    """
+    Config._snapshot = None
+    Config._index = None
+
+class DatabaseTestCase(unittest.TestCase):
+    """
+    Caso base de las pruebas de los builders: Config en memoria, drivers falsos y
+    singletons de Oracle y SQLServer limpios en cada prueba.
+    """
+
+    def setUp(self):
+        from unittest import mock
+        from lib.builder import oracle, sqlserver
+        from lib.builder.oracle import Oracle
+        from lib.builder.sqlserver import SQLServer
+
+        configure()
+        cx_Oracle.database.reset()
+        pyodbc.database.reset()
+
+        patches = [
+            mock.patch.object(oracle, 'cx_Oracle', cx_Oracle),
+            mock.patch.object(sqlserver, 'pyodbc', pyodbc),
+            mock.patch.object(Oracle, '_instances', {}),
+            mock.patch.object(SQLServer, '_instances', {})
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+        self.addCleanup(restore)
+
+    def thread(self, target, *args):
+        """Ejecuta la función en un hilo y espera su resultado."""
+        result = {}
+
+        def run():
+            try:
+                result['value'] = target(*args)
+            except Exception as e:
+                result['error'] = e
+
+        worker = threading.Thread(target=run)
+        worker.start()
+        worker.join(10)
+        return result
@@ -0,0 +1,77 @@
+import asyncio
+import threading
+import unittest
+import warnings
+from unittest import mock
+from tests.helpers import DatabaseTestCase, cx_Oracle, pyodbc
+from lib.builder.aio import AsyncBuilder, AsyncOracle, AsyncSQLServer
+from lib.builder.oracle import Oracle
+
+class TestAsyncBuilder(DatabaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        patch = mock.patch.object(AsyncBuilder, '_executors', {})
+        patch.start()
+        self.addCleanup(patch.stop)
+        self.addCleanup(lambda: [executor.shutdown() for executor in AsyncBuilder._executors.values()])
+
+    def test_builder_without_size_cannot_be_created(self):
+        class AsyncDatabase(AsyncBuilder):
+            _builder = Oracle
+
+        with self.assertRaises(TypeError):
+            AsyncDatabase()
+
+    def test_executor_is_bounded_by_the_pool_size(self):
+        self.assertEqual(AsyncOracle().executor()._max_workers, 4)
+        self.assertEqual(AsyncSQLServer().executor()._max_workers, 2)
+        self.assertIs(AsyncOracle().executor(), AsyncOracle().executor())
+
+    def test_queries_run_in_parallel_outside_the_calling_thread(self):
+        barrier = threading.Barrier(2, timeout=5)
+        threads = []
+        select = Oracle.select
+
+        def parallel(builder, statement, params=None, columnar=False):
+            threads.append(threading.current_thread().name)
+            barrier.wait()
+            return select(builder, statement, params, columnar=columnar)
+
+        cx_Oracle.database.result(['A'], [(1,)])
+        cx_Oracle.database.result(['A'], [(1,)])
+
+        with mock.patch.object(Oracle, 'select', parallel):
+            db = AsyncOracle()
+            first, second = db.run(db.select("SELECT A FROM T"), db.select("SELECT A FROM T"))
+
+        self.assertEqual([first.first(), second.first()], [{'A': 1}, {'A': 1}])
+        self.assertTrue(all(name.startswith('oracle.default') for name in threads))
+
+    def test_gather_keeps_the_order_of_the_queries(self):
+        pyodbc.database.result(['A'], [(1,)])
+
+        async def view():
+            db = AsyncSQLServer()
+            return await db.gather(db.select("SELECT A"), db.execute("UPDATE T SET A = 1"))
+
+        selected, executed = asyncio.run(view())
+
+        self.assertEqual(selected.first(), {'A': 1})
+        self.assertTrue(executed)
+
+    def test_run_inside_a_running_loop_raises_and_closes_the_queries(self):
+        async def view():
+            db = AsyncOracle()
+            return db.run(db.select("SELECT 1 FROM DUAL"))
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('error', RuntimeWarning)
+            with self.assertRaises(RuntimeError) as error:
+                asyncio.run(view())
+
+        self.assertIn("AsyncBuilder.gather", str(error.exception))
+        self.assertEqual(cx_Oracle.database.executed, [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import sys
+import unittest
+from array import array
+from tests.helpers import DatabaseTestCase, cx_Oracle
+from lib.builder.collections import Collection, ColumnarCollection
+from lib.builder.oracle import Oracle
+
+class TestColumnarCollection(unittest.TestCase):
+
+    def setUp(self):
+        self.rows = [(1, 1.5, 'a'), (2, 2.5, 'b'), (3, None, 'c')]
+        self.collection = ColumnarCollection(headers=['ID', 'PRICE', 'NAME'], rows=iter(self.rows))
+
+    def test_numeric_columns_are_packed_in_arrays(self):
+        ids, prices, names = self.collection.columns
+
+        self.assertIsInstance(ids, array)
+        self.assertEqual(ids.typecode, 'q')
+        self.assertIsInstance(prices, tuple)
+        self.assertEqual(names, ('a', 'b', 'c'))
+
+    def test_same_interface_as_collection(self):
+        expected = Collection(data=[dict(zip(['ID', 'PRICE', 'NAME'], row)) for row in self.rows])
+
+        self.assertEqual(self.collection.get(), expected.get())
+        self.assertEqual(self.collection.first(), expected.first())
+        self.assertEqual(self.collection.last(), expected.last())
+        self.assertEqual(self.collection.chunk(2), expected.chunk(2))
+        self.assertEqual(len(self.collection), 3)
+        self.assertEqual(self.collection.row(1), {'ID': 2, 'PRICE': 2.5, 'NAME': 'b'})
+
+    def test_empty_collection(self):
+        empty = ColumnarCollection(headers=['ID'])
+
+        self.assertIsNone(empty.first())
+        self.assertIsNone(empty.last())
+        self.assertEqual(empty.get(), [])
+
+    def test_large_integers_fall_back_to_tuples(self):
+        collection = ColumnarCollection(headers=['BIG'], rows=[(2 ** 70,), (1,)])
+
+        self.assertIsInstance(collection.columns[0], tuple)
+
+    def test_uses_less_memory_than_dictionaries(self):
+        rows = [(i, float(i), 'x') for i in range(5000)]
+        columnar = ColumnarCollection(headers=['ID', 'VALUE', 'NAME'], rows=rows)
+        dicts = [dict(zip(['ID', 'VALUE', 'NAME'], row)) for row in rows]
+
+        columnar_size = sum(sys.getsizeof(column) for column in columnar.columns)
+        dict_size = sum(sys.getsizeof(row) for row in dicts)
+        self.assertLess(columnar_size * 4, dict_size)
+
+class TestColumnarSelect(DatabaseTestCase):
+
+    def test_select_returns_a_columnar_collection(self):
+        cx_Oracle.database.result(['ID', 'NAME'], [(1, 'a'), (2, 'b')])
+
+        result = Oracle().select("SELECT ID, NAME FROM T", columnar=True)
+
+        self.assertIsInstance(result, ColumnarCollection)
+        self.assertEqual(result.get(), [{'ID': 1, 'NAME': 'a'}, {'ID': 2, 'NAME': 'b'}])
+        self.assertEqual(cx_Oracle.database.pools[0].busy, 0)
+
+if __name__ == '__main__':
+    unittest.main()
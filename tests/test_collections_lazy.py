@@ -0,0 +1,72 @@
+import unittest
+from lib.builder.collections import Collection, ColumnarCollection, LazyCollection
+
+class TestLazyOperators(unittest.TestCase):
+
+    def setUp(self):
+        self.collection = Collection(data=[
+            {'id': 1, 'team': 'a', 'score': 10},
+            {'id': 2, 'team': 'b', 'score': None},
+            {'id': 3, 'team': 'a', 'score': 30}
+        ])
+
+    def test_map_and_filter_are_deferred(self):
+        calls = []
+        mapped = self.collection.map(lambda item: calls.append(item['id']) or item['id'] * 2)
+
+        self.assertIsInstance(mapped, LazyCollection)
+        self.assertEqual(calls, [])
+        self.assertEqual(mapped.filter(lambda value: value > 2).get(), [4, 6])
+        self.assertEqual(calls, [1, 2, 3])
+
+    def test_chunk_iter_yields_blocks_on_demand(self):
+        source = iter(range(7))
+        blocks = LazyCollection(source).chunk_iter(3)
+
+        self.assertEqual(next(blocks), [0, 1, 2])
+        self.assertEqual(next(source), 3)
+        self.assertEqual(list(blocks), [[4, 5, 6]])
+
+    def test_chunk_iter_rejects_invalid_sizes(self):
+        with self.assertRaises(ValueError):
+            list(self.collection.chunk_iter(0))
+
+    def test_key_by_index_is_built_once(self):
+        first = self.collection.key_by('id')
+
+        self.assertIs(self.collection.key_by('id'), first)
+        self.assertEqual(first[3]['score'], 30)
+
+    def test_group_by(self):
+        groups = self.collection.group_by('team')
+
+        self.assertEqual([item['id'] for item in groups['a']], [1, 3])
+        self.assertEqual(len(groups['b']), 1)
+
+    def test_sort_by_places_none_last(self):
+        ordered = self.collection.sort_by('score', reverse=True)
+
+        self.assertEqual([item['id'] for item in ordered], [3, 1, 2])
+
+    def test_aggregates_ignore_none(self):
+        self.assertEqual(self.collection.sum('score'), 40)
+        self.assertEqual(self.collection.avg('score'), 20)
+        self.assertEqual(self.collection.min('score'), 10)
+        self.assertEqual(self.collection.max(lambda item: item['id']), 3)
+        self.assertEqual(self.collection.pluck('team').get(), ['a', 'b', 'a'])
+
+    def test_lazy_collection_can_be_iterated_again_from_a_callable(self):
+        lazy = LazyCollection(lambda: iter([1, 2, 3]))
+
+        self.assertEqual(lazy.get(), [1, 2, 3])
+        self.assertEqual(lazy.last(), 3)
+        self.assertEqual(lazy.collect().get(), [1, 2, 3])
+
+    def test_columnar_aggregates_read_the_column_directly(self):
+        collection = ColumnarCollection(headers=['ID', 'SCORE'], rows=[(1, 5), (2, 7)])
+
+        self.assertEqual(collection.sum('SCORE'), 12)
+        self.assertEqual(collection.pluck('ID').get(), [1, 2])
+
+if __name__ == '__main__':
+    unittest.main()
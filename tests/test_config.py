@@ -0,0 +1,123 @@
+import os
+import sys
+import json
+import shutil
+import tempfile
+import importlib
+import unittest
+from unittest import mock
+from lib.clarity.paths import Paths
+from lib.environment.config import Config
+from lib.environment.env import Env
+
+class ConfigTestCase(unittest.TestCase):
+    """
+    Caso base de las pruebas de Config: carpeta base temporal con un módulo de configuración propio.
+    """
+
+    module = 'laraflask_test_settings'
+
+    def setUp(self):
+        self.base = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.base, True)
+
+        sys.path.insert(0, self.base)
+        self.addCleanup(sys.path.remove, self.base)
+        self.addCleanup(sys.modules.pop, self.module, None)
+
+        patches = [
+            mock.patch.object(Paths, 'base', staticmethod(lambda file=None: self.base if file is None else os.path.join(self.base, file))),
+            mock.patch.object(Config, '_instance', None),
+            mock.patch.object(Config, '_snapshot', None),
+            mock.patch.object(Config, '_index', None),
+            mock.patch.object(Config, '_sources', (("app", self.module, "app"), ("cache", self.module, "cache"))),
+            mock.patch.object(Env, '_instance', None)
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+        self.path = os.path.join(self.base, 'bootstrap', 'cache', 'config.json')
+        self.settings(debug=False)
+
+    def settings(self, debug):
+        """Escribe el módulo de configuración de las pruebas."""
+        with open(os.path.join(self.base, f"{self.module}.py"), 'w') as file:
+            file.write("from lib.environment.env import Env\n")
+            file.write(f"app = {{'debug': {debug}, 'name': Env.get('LFX_APP_NAME', 'LaraFlask'), 'hosts': ['a', 'b']}}\n")
+            file.write("cache = {'ttl': 60}\n")
+        importlib.invalidate_caches()
+        shutil.rmtree(os.path.join(self.base, '__pycache__'), True)
+
+class TestConfigSnapshot(ConfigTestCase):
+
+    def test_first_read_mounts_the_json_file(self):
+        self.assertFalse(Config.app('debug'))
+        self.assertTrue(os.path.exists(self.path))
+
+        with open(self.path) as file:
+            self.assertEqual(json.load(file)[0]['cache'], {'ttl': 60})
+
+        self.assertEqual([name for name in os.listdir(os.path.dirname(self.path)) if name.endswith('.tmp')], [])
+
+    def test_snapshot_is_read_once(self):
+        Config.app()
+
+        with mock.patch('builtins.open', side_effect=AssertionError("read from disk")):
+            self.assertEqual(Config.app('name'), 'LaraFlask')
+            self.assertEqual(Config.cache('ttl'), 60)
+
+    def test_snapshot_is_read_only(self):
+        app = Config.app()
+
+        with self.assertRaises(TypeError):
+            app['debug'] = True
+
+        self.assertEqual(Config.app('hosts'), ('a', 'b'))
+
+    def test_get_resolves_full_paths_with_default(self):
+        self.assertEqual(Config.get('app.name'), 'LaraFlask')
+        self.assertEqual(Config().section('cache', 'ttl'), 60)
+        self.assertIsNone(Config.get('app.missing'))
+        self.assertEqual(Config.get('app.missing', 'x'), 'x')
+
+    def test_changes_are_applied_only_by_reload(self):
+        self.assertFalse(Config.app('debug'))
+
+        self.settings(debug=True)
+        Config().destroy()
+        self.assertFalse(Config.app('debug'))
+
+        Config.reload()
+        self.assertTrue(Config.app('debug'))
+
+    def test_reload_reads_the_changed_env_file(self):
+        self.addCleanup(os.environ.pop, 'LFX_APP_NAME', None)
+        self.env("LFX_APP_NAME=first\n")
+        self.assertEqual(Config.app('name'), 'first')
+
+        self.env("LFX_APP_NAME=second\n")
+        self.assertEqual(Config.app('name'), 'first')
+
+        Config.reload()
+        self.assertEqual(Config.app('name'), 'second')
+
+    def test_plain_returns_serialisable_copies(self):
+        with self.assertRaises(TypeError):
+            json.dumps(Config.app())
+
+        app = Config.plain('app')
+        app['debug'] = True
+
+        self.assertEqual(json.loads(json.dumps(app))['hosts'], ['a', 'b'])
+        self.assertFalse(Config.app('debug'))
+        self.assertEqual(Config.plain()['cache'], {'ttl': 60})
+        self.assertEqual(Config.plain('app.missing', {}), {})
+
+    def env(self, content):
+        """Escribe el archivo .env de las pruebas."""
+        with open(os.path.join(self.base, '.env'), 'w') as file:
+            file.write(content)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,42 @@
+import unittest
+from flask import Flask
+from tests.helpers import DatabaseTestCase, cx_Oracle
+from lib.clarity.datatable import DataTable
+
+class TestDataTableBinds(DatabaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.app = Flask(__name__)
+
+    def run_table(self, search, start=0):
+        cx_Oracle.database.result(['TOTAL'], [(1,)])
+        cx_Oracle.database.result(['ID', 'NAME'], [(1, 'a')])
+        request = {'draw': 1, 'start': start, 'length': 10, 'search': search, 'order_column': 1, 'order_dir': 'desc'}
+
+        with self.app.app_context():
+            return DataTable(driver='oracle', request=request).view('clients').columns('ID', 'NAME').get().get_json()
+
+    def test_search_and_paging_travel_as_bind_variables(self):
+        self.run_table("o'neil", start=20)
+
+        count, page = cx_Oracle.database.executed
+        self.assertNotIn("o'neil", page['statement'])
+        self.assertIn('ID LIKE :search OR NAME LIKE :search', page['statement'])
+        self.assertEqual(page['params'], {'search': "%o'neil%", 'offset': 20, 'limit': 10})
+        self.assertEqual(count['params'], {'search': "%o'neil%"})
+
+    def test_statement_text_does_not_depend_on_the_values(self):
+        self.run_table('first', start=0)
+        self.run_table('second', start=10)
+
+        statements = [executed['statement'] for executed in cx_Oracle.database.executed]
+        self.assertEqual(statements[0], statements[2])
+        self.assertEqual(statements[1], statements[3])
+
+    def test_order_direction_is_validated(self):
+        with self.assertRaises(ValueError):
+            DataTable(driver='oracle', serverside=False).order(1, 'ASC; DROP TABLE T')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import unittest
+from unittest import mock
+from flask import Flask
+from tests.helpers import DatabaseTestCase, cx_Oracle
+from lib.clarity.datatable import DataTable
+
+class TestDataTableKeyset(DatabaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.app = Flask(__name__)
+        patch = mock.patch.object(DataTable, '_totals', None)
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    def table(self, after=None, direction='asc', search=None):
+        request = {'draw': 3, 'start': 0, 'length': 2, 'search': search, 'order_column': 0, 'order_dir': direction}
+        return DataTable(driver='oracle', request=request).view('orders').columns('ID', 'TOTAL_VALUE').keyset('ID', after=after)
+
+    def test_first_page_has_no_seek_condition(self):
+        cx_Oracle.database.result(['ID', 'TOTAL_VALUE', 'DT_KEYSET_LAST'], [(1, 10, 1), (2, 20, 2)])
+        cx_Oracle.database.result(['TOTAL'], [(9,)])
+
+        with self.app.app_context():
+            response = self.table().get().get_json()
+
+        page = cx_Oracle.database.executed[0]
+        self.assertNotIn('OFFSET', page['statement'])
+        self.assertNotIn(':after', page['statement'])
+        self.assertEqual(page['params'], {'limit': 2})
+        self.assertEqual(response['last'], 2)
+        self.assertEqual(response['data'], [{'ID': 1, 'TOTAL_VALUE': 10}, {'ID': 2, 'TOTAL_VALUE': 20}])
+        self.assertEqual(response['recordsTotal'], 9)
+
+    def test_next_page_seeks_after_the_last_key(self):
+        cx_Oracle.database.result(['ID', 'TOTAL_VALUE', 'DT_KEYSET_LAST'], [(3, 30, 3)])
+        cx_Oracle.database.result(['TOTAL'], [(9,)])
+
+        with self.app.app_context():
+            response = self.table(after=2).get().get_json()
+
+        page = cx_Oracle.database.executed[0]
+        self.assertIn('ID > :after', page['statement'])
+        self.assertEqual(page['params']['after'], 2)
+        self.assertEqual(response['last'], 3)
+
+    def test_descending_order_seeks_backwards(self):
+        cx_Oracle.database.result(['ID', 'TOTAL_VALUE', 'DT_KEYSET_LAST'], [])
+        cx_Oracle.database.result(['TOTAL'], [(9,)])
+
+        with self.app.app_context():
+            response = self.table(after=5, direction='desc').get().get_json()
+
+        self.assertIn('ID < :after', cx_Oracle.database.executed[0]['statement'])
+        self.assertEqual(response['last'], 5)
+
+    def test_search_is_combined_with_the_seek_condition(self):
+        cx_Oracle.database.result(['ID', 'TOTAL_VALUE', 'DT_KEYSET_LAST'], [(4, 40, 4)])
+        cx_Oracle.database.result(['TOTAL'], [(9,)])
+        cx_Oracle.database.result(['TOTAL'], [(1,)])
+
+        with self.app.app_context():
+            response = self.table(after=3, search='4').get().get_json()
+
+        self.assertIn('(ID LIKE :search OR TOTAL_VALUE LIKE :search) AND ID > :after', cx_Oracle.database.executed[0]['statement'])
+        self.assertEqual(response['recordsFiltered'], 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,69 @@
+import json
+import unittest
+from flask import Flask
+from tests.helpers import DatabaseTestCase, SETTINGS, configure, cx_Oracle
+from lib.builder.oracle import Oracle
+from lib.clarity.datatable import DataTable
+
+class TestDataTableStream(DatabaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.app = Flask(__name__)
+
+    def table(self):
+        return DataTable(driver='oracle', serverside=False).view('clients').columns('ID', 'NAME')
+
+    def test_stream_sends_every_row_as_json(self):
+        cx_Oracle.database.result(['ID', 'NAME'], [(i, f"client {i}") for i in range(7)])
+
+        with self.app.test_request_context():
+            response = self.table().stream(batch_size=3)
+            body = ''.join(response.response)
+
+        self.assertEqual(response.mimetype, 'application/json')
+        self.assertEqual(json.loads(body)['data'][6], {'ID': 6, 'NAME': 'client 6'})
+        self.assertEqual(len(json.loads(body)['data']), 7)
+        self.assertEqual(cx_Oracle.database.executed[0]['arraysize'], 3)
+        self.assertEqual(cx_Oracle.database.pools[0].busy, 0)
+
+    def test_stream_of_an_empty_view(self):
+        cx_Oracle.database.result(['ID', 'NAME'], [])
+
+        with self.app.test_request_context():
+            body = ''.join(self.table().stream().response)
+
+        self.assertEqual(json.loads(body), {'data': []})
+
+    def test_unsupported_driver_is_rejected_on_creation(self):
+        with self.assertRaises(ValueError):
+            DataTable(driver='sqlsrv', serverside=False)
+
+class TestDataTableConnection(DatabaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        oracle = dict(SETTINGS['database']['oracle'])
+        oracle['reports'] = dict(oracle['default'], service='REPORTS')
+        configure(database=dict(SETTINGS['database'], oracle=oracle))
+
+    def table(self):
+        return DataTable(driver='oracle', connection='reports', serverside=False)
+
+    def test_clientside_uses_the_configured_connection(self):
+        cx_Oracle.database.result(['ID'], [(1,)])
+
+        self.table().view('clients').columns('ID').clientside()
+
+        self.assertEqual(list(Oracle._instances), ['reports'])
+
+    def test_column_discovery_uses_the_configured_connection(self):
+        cx_Oracle.database.result(['ID', 'NAME'], [(1, 'a')])
+
+        table = self.table().query("SELECT ID, NAME FROM CLIENTS")
+
+        self.assertEqual(list(Oracle._instances), ['reports'])
+        self.assertEqual(table._columns, ('ID', 'NAME'))
+
+if __name__ == '__main__':
+    unittest.main()
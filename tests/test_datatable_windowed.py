@@ -0,0 +1,68 @@
+import unittest
+from unittest import mock
+from flask import Flask
+from tests.helpers import DatabaseTestCase, configure, cx_Oracle
+from lib.clarity.datatable import DataTable
+
+class TestDataTableWindowed(DatabaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.app = Flask(__name__)
+        patch = mock.patch.object(DataTable, '_totals', None)
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    def table(self, search=None, start=0):
+        request = {'draw': 1, 'start': start, 'length': 2, 'search': search, 'order_column': 0, 'order_dir': 'asc'}
+        return DataTable(driver='oracle', request=request).view('clients').columns('ID', 'NAME').windowed(ttl=60)
+
+    def test_page_and_filtered_total_come_from_one_statement(self):
+        cx_Oracle.database.result(['ID', 'NAME', 'DT_RECORDS_FILTERED'], [(1, 'a', 5), (2, 'b', 5)])
+
+        with self.app.app_context():
+            response = self.table().get().get_json()
+
+        self.assertEqual(len(cx_Oracle.database.executed), 1)
+        self.assertIn('COUNT(*) OVER()', cx_Oracle.database.executed[0]['statement'])
+        self.assertEqual(response['recordsFiltered'], 5)
+        self.assertEqual(response['recordsTotal'], 5)
+        self.assertEqual(response['data'], [{'ID': 1, 'NAME': 'a'}, {'ID': 2, 'NAME': 'b'}])
+
+    def test_unfiltered_total_is_cached_between_requests(self):
+        cx_Oracle.database.result(['ID', 'NAME', 'DT_RECORDS_FILTERED'], [(1, 'a', 1)])
+        cx_Oracle.database.result(['TOTAL'], [(40,)])
+        cx_Oracle.database.result(['ID', 'NAME', 'DT_RECORDS_FILTERED'], [(1, 'a', 1)])
+
+        with self.app.app_context():
+            first = self.table(search='a').get().get_json()
+            second = self.table(search='a').get().get_json()
+
+        self.assertEqual(len(cx_Oracle.database.executed), 3)
+        self.assertEqual(first['recordsTotal'], 40)
+        self.assertEqual(second['recordsTotal'], 40)
+        self.assertEqual(second['recordsFiltered'], 1)
+
+    def test_totals_cache_is_bounded(self):
+        configure(cache={'size': 2})
+
+        with self.app.app_context():
+            for view in ('a', 'b', 'c', 'd'):
+                cx_Oracle.database.result(['ID', 'NAME', 'DT_RECORDS_FILTERED'], [(1, 'a', 1)])
+                cx_Oracle.database.result(['TOTAL'], [(10,)])
+                self.table(search='x').view(view).get()
+
+        self.assertEqual(len(DataTable.totals()), 2)
+
+    def test_page_past_the_end_counts_separately(self):
+        cx_Oracle.database.result(['ID', 'NAME', 'DT_RECORDS_FILTERED'], [])
+        cx_Oracle.database.result(['TOTAL'], [(3,)])
+
+        with self.app.app_context():
+            response = self.table(start=10).get().get_json()
+
+        self.assertEqual(response['recordsFiltered'], 3)
+        self.assertEqual(response['data'], [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+from tests.helpers import DatabaseTestCase, cx_Oracle
+from lib.builder.oracle import Oracle
+
+class TestFetchStream(DatabaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        cx_Oracle.database.result(['ID', 'NAME'], [(i, f"name {i}") for i in range(25)])
+
+    def test_arraysize_and_prefetch_are_set_before_execute(self):
+        Oracle().query("SELECT ID, NAME FROM T", arraysize=10).rows()
+
+        executed = cx_Oracle.database.executed[0]
+        self.assertEqual(executed['arraysize'], 10)
+        self.assertEqual(executed['prefetchrows'], 11)
+
+    def test_stream_reads_in_batches_and_releases_the_session(self):
+        fetch = Oracle().query("SELECT ID, NAME FROM T", arraysize=10)
+        cursor = fetch.cursor
+        calls = []
+        fetchmany = cursor.fetchmany
+        cursor.fetchmany = lambda size=None: calls.append(size) or fetchmany(size)
+
+        rows = list(fetch.stream(batch_size=10))
+
+        self.assertEqual(len(rows), 25)
+        self.assertEqual(calls, [10, 10, 10, 10])
+        self.assertTrue(cursor.closed)
+        self.assertEqual(cx_Oracle.database.pools[0].busy, 0)
+
+    def test_abandoned_stream_releases_the_session(self):
+        stream = Oracle().query("SELECT ID, NAME FROM T").stream(batch_size=5)
+        next(stream)
+        stream.close()
+
+        self.assertEqual(cx_Oracle.database.pools[0].busy, 0)
+
+    def test_iter_dicts_indexes_by_column(self):
+        rows = Oracle().query("SELECT ID, NAME FROM T").iter_dicts(batch_size=7)
+
+        self.assertEqual(next(rows), {'ID': 0, 'NAME': 'name 0'})
+        self.assertEqual(len(list(rows)), 24)
+
+    def test_invalid_batch_size_raises(self):
+        with self.assertRaises(ValueError):
+            next(Oracle().query("SELECT ID, NAME FROM T").stream(batch_size=0))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+import os
+import sys
+import json
+import shutil
+import tempfile
+import importlib
+import unittest
+from unittest import mock
+from lib.clarity.modules import ModuleIndex
+
+class TestModuleIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.base = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.base, True)
+        self.addCleanup(self.unload)
+
+        self.file('src/lfx_services/reports.py', "NAME = 'reports'\n")
+        self.file('src/domain/lfx_helper.py', "NAME = 'helper'\n")
+        self.file('storage/lfx_services/exports.py', "NAME = 'exports'\n")
+        self.file('src/lfx_package/__init__.py', "NAME = 'package'\n")
+        self.file('storage/jobs/lfx_package/tasks.py', "NAME = 'tasks'\n")
+
+    def file(self, name, source=""):
+        path = os.path.join(self.base, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as file:
+            file.write(source)
+        importlib.invalidate_caches()
+
+    def index(self):
+        index = ModuleIndex(self.base, ['src', 'storage'])
+        index.load()
+        sys.meta_path.append(index)
+        self.addCleanup(sys.meta_path.remove, index)
+        return index
+
+    def unload(self):
+        for name in [name for name in sys.modules if name.startswith('lfx_')]:
+            del sys.modules[name]
+
+    def test_bare_modules_resolve_from_any_folder(self):
+        self.index()
+
+        self.assertEqual(importlib.import_module('lfx_helper').NAME, 'helper')
+
+    def test_folders_without_init_resolve_as_namespace_packages(self):
+        self.index()
+
+        from lfx_services.reports import NAME as reports
+        from lfx_services.exports import NAME as exports
+
+        self.assertEqual((reports, exports), ('reports', 'exports'))
+        self.assertEqual(sorted(sys.modules['lfx_services'].__path__), [
+            os.path.join(self.base, 'src', 'lfx_services'),
+            os.path.join(self.base, 'storage', 'lfx_services')
+        ])
+
+    def test_regular_package_takes_priority_over_a_namespace(self):
+        self.index()
+
+        self.assertEqual(importlib.import_module('lfx_package').NAME, 'package')
+
+    def test_load_trusts_an_existing_index(self):
+        self.index()
+        self.file('src/domain/lfx_added.py', "NAME = 'added'\n")
+
+        index = ModuleIndex(self.base, ['src', 'storage'])
+        with mock.patch.object(index, 'walk') as walk:
+            index.load()
+
+        walk.assert_not_called()
+        self.assertIn('lfx_helper', index.modules)
+        self.assertNotIn('lfx_added', index.modules)
+
+    def test_load_rebuilds_an_index_with_another_format(self):
+        path = os.path.join(self.base, 'bootstrap', 'cache', 'modules.json')
+        os.makedirs(os.path.dirname(path))
+        with open(path, 'w') as file:
+            json.dump({'modules': {'lfx_helper': ['src/domain/lfx_helper.py', False]}}, file)
+
+        index = ModuleIndex(self.base, ['src', 'storage'])
+        index.load()
+
+        self.assertEqual(index.modules['lfx_helper'], [os.path.join('src', 'domain', 'lfx_helper.py'), 'module'])
+
+    def test_missing_module_does_not_walk_the_folders(self):
+        index = self.index()
+
+        with mock.patch.object(index, 'walk') as walk:
+            for _ in range(3):
+                with self.assertRaises(ImportError):
+                    importlib.import_module('lfx_missing')
+
+        walk.assert_not_called()
+
+    def test_deleted_indexed_path_rebuilds_the_index(self):
+        index = self.index()
+
+        shutil.rmtree(os.path.join(self.base, 'src', 'lfx_package'))
+        self.file('storage/lfx_package/__init__.py', "NAME = 'moved'\n")
+
+        with mock.patch.object(index, 'walk', wraps=index.walk) as walk:
+            self.assertEqual(importlib.import_module('lfx_package').NAME, 'moved')
+
+        self.assertTrue(walk.called)
+        self.assertEqual(index.modules['lfx_package'], [os.path.join('storage', 'lfx_package', '__init__.py'), 'package'])
+
+        with open(index.path) as file:
+            self.assertEqual(json.load(file)['modules']['lfx_package'][0], os.path.join('storage', 'lfx_package', '__init__.py'))
+
+if __name__ == '__main__':
+    unittest.main()
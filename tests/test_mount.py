@@ -0,0 +1,51 @@
+import unittest
+from unittest import mock
+from flask import Flask, request
+from lib.clarity.mount import Mount
+
+class CounterController:
+
+    instances = 0
+
+    def __init__(self):
+        CounterController.instances += 1
+        self.calls = 0
+
+    def count(self, id=None):
+        self.calls += 1
+        return f"{id}:{self.calls}"
+
+class TestMount(unittest.TestCase):
+
+    def setUp(self):
+        CounterController.instances = 0
+        self.next = {"path": __name__, "classname": "CounterController", "method": "count"}
+
+    def test_each_request_gets_a_new_controller(self):
+        app = Flask(__name__)
+        app.add_url_rule("/count/<id>", view_func=Mount.controller(next=self.next, flask_request=request))
+        client = app.test_client()
+
+        self.assertEqual(client.get("/count/a").get_data(as_text=True), "a:1")
+        self.assertEqual(client.get("/count/b").get_data(as_text=True), "b:1")
+        self.assertEqual(CounterController.instances, 2)
+
+    def test_classes_are_resolved_once(self):
+        Mount._resolved.pop((__name__, "CounterController"), None)
+
+        with mock.patch("builtins.__import__", wraps=__import__) as imported:
+            Mount.resolve(self.next)
+            Mount.resolve(self.next)
+
+        self.assertEqual([call.args[0] for call in imported.call_args_list].count(__name__), 1)
+        self.assertIs(Mount.resolve(self.next), CounterController)
+
+    def test_controller_with_arguments_runs_the_method(self):
+        self.assertEqual(Mount.controller(next=self.next, flask_request=None, arguments={"id": 3}), "3:1")
+        self.assertEqual(Mount.controller(next=self.next, flask_request=None, arguments={}), "None:1")
+
+    def test_callable_next_continues_the_chain(self):
+        self.assertEqual(Mount.controller(next=lambda **kwargs: kwargs, flask_request=None, arguments={"id": 1}), {"id": 1})
+
+if __name__ == '__main__':
+    unittest.main()
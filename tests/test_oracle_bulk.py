@@ -0,0 +1,69 @@
+import types
+import unittest
+from tests.helpers import DatabaseTestCase, cx_Oracle
+from lib.builder.oracle import Oracle
+from lib.builder.collections import LazyCollection
+
+class TestOracleBulkInsert(DatabaseTestCase):
+
+    def test_rows_are_sent_and_committed_in_batches(self):
+        rows = ({'ID': i, 'NAME': f"name {i}"} for i in range(25))
+
+        report = Oracle().bulk_insert('APP.USERS', rows, batch_size=10)
+
+        batches = cx_Oracle.database.batches
+        self.assertEqual(report, {'rows': 25, 'inserted': 25, 'batches': 3, 'errors': []})
+        self.assertEqual([len(batch['params']) for batch in batches], [10, 10, 5])
+        self.assertEqual(batches[0]['statement'], "INSERT INTO APP.USERS (ID, NAME) VALUES (:1, :2)")
+        self.assertEqual(batches[0]['params'][1], (1, 'name 1'))
+        self.assertEqual(batches[0]['options'], {'batcherrors': True})
+        self.assertEqual(cx_Oracle.database.connections[0].commits, 3)
+        self.assertEqual(cx_Oracle.database.pools[0].busy, 0)
+
+    def test_tuples_require_columns(self):
+        with self.assertRaises(ValueError):
+            Oracle().bulk_insert('USERS', [(1, 'a')])
+
+        report = Oracle().bulk_insert('USERS', LazyCollection([(1, 'a'), (2, 'b')]), columns=['ID', 'NAME'])
+        self.assertEqual(report['inserted'], 2)
+
+    def test_row_errors_are_reported_with_their_global_position(self):
+        error = lambda offset: types.SimpleNamespace(offset=offset, message="ORA-00001: unique constraint")
+        cx_Oracle.database.batch_errors.extend([[], [error(1)]])
+
+        report = Oracle().bulk_insert('USERS', [{'ID': i} for i in range(4)], batch_size=2)
+
+        self.assertEqual(report['inserted'], 3)
+        self.assertEqual(report['errors'], [{'row': 3, 'message': "ORA-00001: unique constraint"}])
+
+    def test_input_sizes_are_set_on_every_batch(self):
+        rows = [{'ID': i, 'BODY': 'x'} for i in range(3)]
+
+        Oracle().bulk_insert('NOTES', rows, batch_size=2, input_sizes={'BODY': cx_Oracle.CLOB})
+
+        self.assertEqual(cx_Oracle.database.input_sizes, [(None, 'CLOB'), (None, 'CLOB')])
+
+    def test_invalid_identifiers_are_rejected_before_connecting(self):
+        for table, columns in [('USERS; DROP TABLE X', ['ID']), ('USERS', ['ID) VALUES (1']), ('A.B.C', ['ID'])]:
+            with self.assertRaises(ValueError):
+                Oracle().bulk_insert(table, [(1,)], columns=columns)
+
+        self.assertEqual(cx_Oracle.database.connections, [])
+
+    def test_empty_rows_and_invalid_batch_size(self):
+        self.assertEqual(Oracle().bulk_insert('USERS', []), {'rows': 0, 'inserted': 0, 'batches': 0, 'errors': []})
+
+        with self.assertRaises(ValueError):
+            Oracle().bulk_insert('USERS', [{'ID': 1}], batch_size=0)
+
+    def test_failed_load_reports_the_row_and_returns_the_session(self):
+        cx_Oracle.database.fail_cursor = True
+
+        with self.assertRaises(ValueError) as error:
+            Oracle().bulk_insert('USERS', [{'ID': 1}])
+
+        self.assertIn("Carga Masiva Fallida en la fila 0", str(error.exception))
+        self.assertEqual(cx_Oracle.database.pools[0].busy, 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import threading
+import unittest
+from tests.helpers import DatabaseTestCase, cx_Oracle
+from lib.builder.oracle import Oracle
+
+class TestOraclePool(DatabaseTestCase):
+
+    def test_pool_is_created_once_with_the_connection_settings(self):
+        pools = []
+        barrier = threading.Barrier(8)
+
+        def build():
+            barrier.wait()
+            pools.append(Oracle().pool())
+
+        threads = [threading.Thread(target=build) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(cx_Oracle.database.pools), 1)
+        self.assertTrue(all(pool is pools[0] for pool in pools))
+
+        options = pools[0].options
+        self.assertEqual(options['max'], 4)
+        self.assertEqual(options['wait_timeout'], 1000)
+        self.assertEqual(options['stmtcachesize'], 20)
+        self.assertTrue(options['threaded'])
+        self.assertEqual(options['getmode'], cx_Oracle.SPOOL_ATTRVAL_TIMEDWAIT)
+
+    def test_every_statement_returns_its_session(self):
+        database = Oracle()
+        database.select("SELECT 1 FROM DUAL")
+        database.execute("UPDATE T SET A = 1")
+        database.insert("INSERT INTO T VALUES (1)")
+
+        pool = cx_Oracle.database.pools[0]
+        self.assertEqual(pool.busy, 0)
+        self.assertEqual(len(cx_Oracle.database.connections), 3)
+
+    def test_failed_statement_returns_its_session(self):
+        cx_Oracle.database.fail_cursor = True
+
+        with self.assertRaises(ValueError):
+            Oracle().select("SELECT 1 FROM DUAL")
+
+        self.assertEqual(cx_Oracle.database.pools[0].busy, 0)
+
+    def test_instances_are_shared_per_connection_name(self):
+        self.assertIs(Oracle(), Oracle('default'))
+
+    def test_close_discards_the_pool_and_the_instance(self):
+        database = Oracle()
+        pool = database.pool()
+        database.close()
+
+        self.assertTrue(pool.closed)
+        self.assertIsNot(Oracle(), database)
+
+    def test_missing_connection_raises(self):
+        with self.assertRaises(RuntimeError):
+            Oracle('missing')
+
+if __name__ == '__main__':
+    unittest.main()
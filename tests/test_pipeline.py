@@ -0,0 +1,89 @@
+import unittest
+from flask import Flask
+from lib.http.router import Route, Router, BluePrint
+from lib.http.response import JsonResponse
+from lib.clarity.mount import Mount
+from tests.test_router import RouterTestCase
+
+trace = []
+
+class FirstMiddleware:
+
+    def handle(self, **kwargs):
+        trace.append(('first', self))
+        self.context.data['user'] = self.request.headers.get('X-User')
+        return self.next(**kwargs)
+
+class SecondMiddleware:
+
+    def handle(self, **kwargs):
+        trace.append(('second', self))
+        if self.context.data['user'] is None:
+            return JsonResponse.unauthorized(message="Sin usuario")
+        return Mount.controller(next=self.next, flask_request=self.request, arguments=kwargs)
+
+class ProfileController:
+
+    def show(self, id):
+        trace.append(('controller', id))
+        return f"profile {id} for {self.request.headers.get('X-User')}"
+
+class TestPipeline(RouterTestCase):
+
+    def setUp(self):
+        super().setUp()
+        trace.clear()
+
+    def client(self):
+        return BluePrint(Flask(__name__), logger=None).routes().test_client()
+
+    def test_middlewares_run_in_order_before_the_controller(self):
+        Route().middleware(FirstMiddleware, SecondMiddleware).group(
+            Route.get("profile/<id>", [ProfileController, 'show'])
+        )
+
+        response = self.client().get("/profile/5", headers={'X-User': 'ana'})
+
+        self.assertEqual(response.get_data(as_text=True), "profile 5 for ana")
+        self.assertEqual([step[0] for step in trace], ['first', 'second', 'controller'])
+
+    def test_a_middleware_can_stop_the_chain(self):
+        Route().middleware(FirstMiddleware, SecondMiddleware).group(
+            Route.get("profile/<id>", [ProfileController, 'show'])
+        )
+
+        self.assertEqual(self.client().get("/profile/5").status_code, 401)
+        self.assertNotIn('controller', [step[0] for step in trace])
+
+    def test_each_request_gets_new_middleware_instances(self):
+        Route().middleware(FirstMiddleware).group(
+            Route.get("profile/<id>", [ProfileController, 'show'])
+        )
+        client = self.client()
+        client.get("/profile/1", headers={'X-User': 'a'})
+        client.get("/profile/2", headers={'X-User': 'b'})
+
+        first, second = [step[1] for step in trace if step[0] == 'first']
+        self.assertIsNot(first, second)
+
+    def test_group_middlewares_run_before_route_middlewares(self):
+        Route().middleware(FirstMiddleware).group(
+            Route.get("profile/<id>", [ProfileController, 'show'], middleware=SecondMiddleware)
+        )
+
+        self.assertEqual([m["class"] for m in Router.middlewares(Router().all()[0])], ['FirstMiddleware', 'SecondMiddleware'])
+
+    def test_middlewares_can_be_given_as_a_list(self):
+        Route().middleware([FirstMiddleware, SecondMiddleware]).group(
+            Route.get("profile/<id>", [ProfileController, 'show'])
+        )
+
+        self.assertEqual([m["class"] for m in Router.middlewares(Router().all()[0])], ['FirstMiddleware', 'SecondMiddleware'])
+
+    def test_legacy_single_middleware_keys_are_supported(self):
+        route = {"middleware_file": __name__, "middleware_class": "FirstMiddleware", "middleware_method": "handle"}
+
+        self.assertEqual(Router.middlewares(route), [{"file": __name__, "class": "FirstMiddleware", "method": "handle"}])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+import os
+import sys
+import time
+import unittest
+from unittest import mock
+from tests.helpers import configure, restore
+from tests.test_config import ConfigTestCase
+from lib.environment.config import Config
+from lib.kernel import app as kernel
+from lib.kernel.app import HttpKernel
+
+class TestConfigStale(ConfigTestCase):
+
+    def setUp(self):
+        super().setUp()
+        os.makedirs(os.path.join(self.base, 'config'))
+        self.source = os.path.join(self.base, 'config', 'app.py')
+        self.touch(self.source, -60)
+
+    def touch(self, path, offset):
+        if not os.path.exists(path):
+            open(path, 'w').close()
+        moment = time.time() + offset
+        os.utime(path, (moment, moment))
+
+    def test_missing_file_is_stale(self):
+        self.assertTrue(Config().stale())
+
+    def test_file_newer_than_the_sources_is_fresh(self):
+        Config().mount()
+        self.touch(self.path, 0)
+
+        self.assertFalse(Config().stale())
+
+    def test_changed_config_module_or_env_makes_it_stale(self):
+        Config().mount()
+        self.touch(self.path, -30)
+
+        self.touch(self.source, 0)
+        self.assertTrue(Config().stale())
+
+        self.touch(self.source, -60)
+        self.touch(os.path.join(self.base, '.env'), 0)
+        self.assertTrue(Config().stale())
+
+class TestHttpKernelBoot(unittest.TestCase):
+
+    def setUp(self):
+        configure()
+        self.addCleanup(restore)
+
+        self.config = mock.MagicMock()
+        self.config.return_value.stale.return_value = False
+
+        patches = {
+            'Config': mock.patch.object(kernel, 'Config', self.config),
+            'ControlCache': mock.patch.object(kernel, 'ControlCache'),
+            'ModuleIndex': mock.patch.object(kernel, 'ModuleIndex'),
+            'Router': mock.patch.object(kernel, 'Router'),
+            'CORS': mock.patch.object(kernel, 'CORS'),
+            'importlib': mock.patch.object(kernel, 'importlib'),
+            'Env': mock.patch.object(kernel.Env, 'init')
+        }
+        self.mocks = {}
+        for name, patch in patches.items():
+            self.mocks[name] = patch.start()
+            self.addCleanup(patch.stop)
+
+        for patch in (mock.patch.object(HttpKernel, '_instance', None), mock.patch.object(sys, 'dont_write_bytecode', sys.dont_write_bytecode)):
+            patch.start()
+            self.addCleanup(patch.stop)
+
+        self.config.app.return_value = False
+
+    def test_production_keeps_bytecode_and_a_fresh_config(self):
+        HttpKernel(bytecode=True, production=True)
+
+        self.mocks['ControlCache'].clear.assert_not_called()
+        self.mocks['ModuleIndex'].rebuild.assert_not_called()
+        self.config.return_value.destroy.assert_not_called()
+        self.config.return_value.mount.assert_called_once_with()
+        self.assertFalse(sys.dont_write_bytecode)
+
+    def test_production_rebuilds_a_stale_config(self):
+        self.config.return_value.stale.return_value = True
+
+        HttpKernel(production=True)
+
+        self.config.return_value.destroy.assert_called_once_with()
+
+    def test_development_clears_every_cache(self):
+        HttpKernel(bytecode=True, production=False)
+
+        self.mocks['ControlCache'].clear.assert_called_once_with()
+        self.mocks['ModuleIndex'].rebuild.assert_called_once_with()
+        self.config.return_value.destroy.assert_called_once_with()
+        self.config.return_value.stale.assert_not_called()
+        self.assertTrue(sys.dont_write_bytecode)
+
+    def test_environment_selects_the_boot_mode(self):
+        for value, expected in [('production', True), (' PROD ', True), ('local', False), (None, False)]:
+            with mock.patch.dict(os.environ, {} if value is None else {'APP_ENVIRONMENT': value}, clear=False):
+                if value is None:
+                    os.environ.pop('APP_ENVIRONMENT', None)
+                with mock.patch.object(kernel.Env, 'load_env'):
+                    self.assertEqual(HttpKernel.is_production(), expected, value)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,163 @@
+import os
+import shutil
+import tempfile
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+from lib.clarity.paths import Paths
+from lib.clarity.profiler import Profiler
+from lib.kernel.commands.profile import BootProfileCommand
+
+class ProfilerTestCase(unittest.TestCase):
+
+    def setUp(self):
+        patches = [
+            mock.patch.object(Profiler, '_enabled', False),
+            mock.patch.object(Profiler, '_stack', []),
+            mock.patch.object(Profiler, '_phases', {})
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+class TestProfiler(ProfilerTestCase):
+
+    def test_disabled_profiler_measures_nothing(self):
+        with Profiler.phase('boot'):
+            pass
+
+        self.assertEqual(Profiler.phases(), [])
+
+    def test_nested_phases_are_recorded_by_path_and_accumulated(self):
+        Profiler.enable()
+
+        with Profiler.phase('boot'):
+            with Profiler.phase('routes'):
+                for _ in range(3):
+                    with Profiler.phase('validate'):
+                        pass
+            with Profiler.phase('flask'):
+                pass
+
+        Profiler.disable()
+
+        phases = Profiler.phases()
+        self.assertEqual([phase['path'] for phase in phases], [
+            ('boot',), ('boot', 'routes'), ('boot', 'routes', 'validate'), ('boot', 'flask')
+        ])
+        self.assertEqual(phases[2]['calls'], 3)
+        self.assertTrue(all(phase['seconds'] >= 0 for phase in phases))
+
+    def test_failed_phase_is_recorded_and_unwound(self):
+        Profiler.enable()
+
+        with self.assertRaises(RuntimeError):
+            with Profiler.phase('boot'):
+                raise RuntimeError("boom")
+
+        self.assertEqual(Profiler._stack, [])
+        self.assertEqual(Profiler.phases()[0]['calls'], 1)
+
+    def test_enable_discards_previous_measures(self):
+        Profiler.enable()
+        with Profiler.phase('boot'):
+            pass
+
+        Profiler.enable()
+
+        self.assertEqual(Profiler.phases(), [])
+
+    def test_folded_reports_self_time_in_microseconds(self):
+        Profiler._phases.update({
+            ('boot',): [0.5, 1],
+            ('boot', 'routes'): [0.2, 1],
+            ('boot', 'routes', 'validate'): [0.05, 4],
+            ('boot', 'flask'): [0.1, 1]
+        })
+
+        self.assertEqual(Profiler.folded(), [
+            "boot 200000",
+            "boot;routes 150000",
+            "boot;routes;validate 50000",
+            "boot;flask 100000"
+        ])
+
+class TestBootProfileCommand(ProfilerTestCase):
+
+    # Reporte de 'python -X importtime': cada modulo aparece despues de sus dependencias.
+    report = "\n".join([
+        "import time: self [us] | cumulative | imported package",
+        "import time:       100 |        100 |     jinja2.utils",
+        "import time:       300 |        400 |   jinja2",
+        "import time:       500 |        900 | flask",
+        "import time:        50 |         50 | lib.kernel.app"
+    ])
+
+    def setUp(self):
+        super().setUp()
+        self.base = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.base, True)
+
+        patch = mock.patch.object(Paths, 'storage', staticmethod(lambda file=None: os.path.join(self.base, file or '')))
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    def test_imports_parse_the_importtime_report(self):
+        with mock.patch('lib.kernel.commands.profile.subprocess.run', return_value=SimpleNamespace(returncode=0, stderr=self.report)) as run:
+            imports = BootProfileCommand().imports()
+
+        self.assertIn('importtime', run.call_args.args[0])
+        self.assertEqual(imports, [
+            {'module': 'jinja2.utils', 'depth': 2, 'self': 100, 'cumulative': 100},
+            {'module': 'jinja2', 'depth': 1, 'self': 300, 'cumulative': 400},
+            {'module': 'flask', 'depth': 0, 'self': 500, 'cumulative': 900},
+            {'module': 'lib.kernel.app', 'depth': 0, 'self': 50, 'cumulative': 50}
+        ])
+
+    def test_write_rebuilds_the_import_stacks(self):
+        with mock.patch('lib.kernel.commands.profile.subprocess.run', return_value=SimpleNamespace(returncode=0, stderr=self.report)):
+            imports = BootProfileCommand().imports()
+
+        path = BootProfileCommand().write(["boot 10", "boot;routes 5"], imports)
+
+        with open(path) as file:
+            lines = file.read().splitlines()
+
+        self.assertTrue(path.startswith(os.path.join(self.base, 'profile')))
+        self.assertEqual(lines, [
+            "phases;boot 10",
+            "phases;boot;routes 5",
+            "imports;lib.kernel.app 50",
+            "imports;flask 500",
+            "imports;flask;jinja2 300",
+            "imports;flask;jinja2;jinja2.utils 100"
+        ])
+
+    def test_failed_boot_reports_the_error_instead_of_the_imports(self):
+        failed = SimpleNamespace(returncode=1, stderr="\n".join([
+            "import time:       500 |        900 | flask",
+            "Traceback (most recent call last):",
+            "ModuleNotFoundError: No module named 'cx_Oracle'"
+        ]))
+
+        with mock.patch('lib.kernel.commands.profile.subprocess.run', return_value=failed):
+            with self.assertRaises(RuntimeError) as error:
+                BootProfileCommand().imports()
+
+        self.assertIn("No module named 'cx_Oracle'", str(error.exception))
+        self.assertNotIn("import time", str(error.exception))
+
+    def test_handle_writes_no_flamegraph_when_the_boot_fails(self):
+        command = BootProfileCommand()
+
+        with mock.patch.object(command, 'phases', return_value=[]), \
+             mock.patch.object(command, 'imports', side_effect=RuntimeError("[Profile]: boom")), \
+             mock.patch('lib.kernel.commands.profile.Console') as console:
+            command.handle()
+
+        console.danger.assert_called_once_with("[Profile]: boom")
+        console.success.assert_not_called()
+        self.assertFalse(os.path.exists(os.path.join(self.base, 'profile')))
+
+if __name__ == '__main__':
+    unittest.main()
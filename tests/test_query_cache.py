@@ -0,0 +1,144 @@
+import time
+import threading
+import unittest
+from unittest import mock
+from tests.helpers import configure, restore
+from lib.builder.cache import QueryCache
+from lib.cache.store import MemoryStore
+
+class TestQueryCache(unittest.TestCase):
+
+    def setUp(self):
+        configure(cache={'size': 2})
+        self.addCleanup(restore)
+
+        patches = [
+            mock.patch.object(QueryCache, '_store', None),
+            mock.patch.object(QueryCache, '_tags', {}),
+            mock.patch.object(QueryCache, '_keys', {}),
+            mock.patch.object(QueryCache, '_generations', {}),
+            mock.patch.object(QueryCache, '_generation', 0),
+            mock.patch.object(QueryCache, '_flights', {})
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def test_result_is_reused_until_its_tag_is_forgotten(self):
+        calls = []
+        load = lambda: calls.append(1) or len(calls)
+
+        self.assertEqual(QueryCache.remember('a', 60, ['users'], load), 1)
+        self.assertEqual(QueryCache.remember('a', 60, ['users'], load), 1)
+        self.assertEqual(QueryCache.forget('users'), 1)
+        self.assertEqual(QueryCache.remember('a', 60, ['users'], load), 2)
+
+    def test_concurrent_identical_queries_run_once(self):
+        release = threading.Event()
+        calls = []
+
+        def load():
+            calls.append(1)
+            release.wait(5)
+            return 'rows'
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(QueryCache.remember('a', 60, [], load))) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.05)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(calls, [1])
+        self.assertEqual(results, ['rows'] * 5)
+
+    def test_lru_eviction_prunes_the_tag_index(self):
+        QueryCache.remember('a', 60, ['users'], lambda: 1)
+        QueryCache.remember('b', 60, ['users'], lambda: 2)
+        QueryCache.remember('c', 60, ['orders'], lambda: 3)
+
+        self.assertEqual(QueryCache._tags, {'users': {'b'}, 'orders': {'c'}})
+        self.assertNotIn('a', QueryCache._keys)
+
+        QueryCache.remember('d', 60, ['orders'], lambda: 4)
+
+        self.assertEqual(QueryCache._tags, {'orders': {'c', 'd'}})
+
+    def test_expired_entries_are_pruned_from_the_tag_index(self):
+        QueryCache.remember('a', 0.01, ['users'], lambda: 1)
+        time.sleep(0.02)
+
+        self.assertEqual(QueryCache.remember('a', 60, [], lambda: 2), 2)
+        self.assertEqual(QueryCache._tags, {})
+        self.assertEqual(QueryCache._keys, {})
+
+    def test_result_started_before_forget_is_not_stored(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def load():
+            started.set()
+            release.wait(5)
+            return 'stale'
+
+        result = []
+        leader = threading.Thread(target=lambda: result.append(QueryCache.remember('a', 60, ['users'], load)))
+        leader.start()
+        started.wait(5)
+
+        QueryCache.forget('users')
+
+        # Una solicitud posterior no espera a la consulta invalidada.
+        self.assertEqual(QueryCache.remember('a', 60, ['users'], lambda: 'fresh'), 'fresh')
+
+        release.set()
+        leader.join()
+
+        self.assertEqual(result, ['stale'])
+        self.assertEqual(QueryCache.remember('a', 60, ['users'], lambda: 'other'), 'fresh')
+
+    def test_result_started_before_flush_is_not_stored(self):
+        started = threading.Event()
+        release = threading.Event()
+
+        def load():
+            started.set()
+            release.wait(5)
+            return 'stale'
+
+        leader = threading.Thread(target=lambda: QueryCache.remember('a', 60, [], load))
+        leader.start()
+        started.wait(5)
+        QueryCache.flush()
+        release.set()
+        leader.join()
+
+        self.assertEqual(QueryCache.remember('a', 60, [], lambda: 'fresh'), 'fresh')
+
+    def test_errors_are_shared_and_not_stored(self):
+        def fail():
+            raise RuntimeError("down")
+
+        with self.assertRaises(RuntimeError):
+            QueryCache.remember('a', 60, ['users'], fail)
+
+        self.assertEqual(QueryCache._flights, {})
+        self.assertEqual(QueryCache._tags, {})
+
+class TestMemoryStoreEviction(unittest.TestCase):
+
+    def test_on_evict_receives_lru_and_expired_keys(self):
+        evicted = []
+        store = MemoryStore(size=1, on_evict=evicted.append)
+
+        store.set('a', 1, 60)
+        store.set('b', 2, 0.01)
+        time.sleep(0.02)
+
+        self.assertIsNone(store.get('b'))
+        self.assertEqual(evicted, ['a', 'b'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,141 @@
+import unittest
+from unittest import mock
+from flask import Flask, make_response
+from lib.cache.store import Cache
+from lib.http.cache import ResponseCache
+from lib.http.router import Route, BluePrint
+from lib.http.response import JsonResponse
+from tests.helpers import configure, restore
+from tests.test_router import RouterTestCase
+
+calls = []
+
+class AccountController:
+
+    def show(self, id):
+        calls.append(id)
+        user = self.request.headers.get('Authorization') or self.request.cookies.get('session')
+        return JsonResponse.success(data={'id': id, 'user': user, 'call': len(calls)})
+
+    def private(self, id):
+        calls.append(id)
+        response = make_response(f"private {len(calls)}")
+        response.cache_control.private = True
+        return response
+
+    def nostore(self, id):
+        calls.append(id)
+        response = make_response(f"nostore {len(calls)}")
+        response.cache_control.no_store = True
+        return response
+
+    def cookie(self, id):
+        calls.append(id)
+        response = make_response(f"cookie {len(calls)}")
+        response.set_cookie('tracking', id)
+        return response
+
+    def missing(self, id):
+        calls.append(id)
+        return JsonResponse.notFound(message="missing")
+
+class SqliteCache(ResponseCache):
+    store = 'sqlite'
+
+class TestResponseCache(RouterTestCase):
+
+    def setUp(self):
+        super().setUp()
+        calls.clear()
+        configure()
+        self.addCleanup(restore)
+
+        patch = mock.patch.object(Cache, '_stores', {})
+        patch.start()
+        self.addCleanup(patch.stop)
+
+    def client(self, middleware=ResponseCache):
+        Route().middleware(middleware).group(
+            Route.get("accounts/<id>", [AccountController, 'show']),
+            Route.get("private/<id>", [AccountController, 'private']),
+            Route.get("nostore/<id>", [AccountController, 'nostore']),
+            Route.get("cookie/<id>", [AccountController, 'cookie']),
+            Route.get("missing/<id>", [AccountController, 'missing']),
+            Route.post("accounts/<id>/touch", [AccountController, 'show'])
+        )
+        return BluePrint(Flask(__name__), logger=None).routes().test_client()
+
+    def test_repeated_requests_are_served_from_the_cache(self):
+        client = self.client()
+        first = client.get("/accounts/1")
+        second = client.get("/accounts/1")
+
+        self.assertEqual(calls, ['1'])
+        self.assertEqual(first.get_data(), second.get_data())
+        self.assertIsNotNone(second.headers.get('ETag'))
+        self.assertIsNotNone(second.headers.get('Last-Modified'))
+
+    def test_conditional_requests_receive_304(self):
+        client = self.client()
+        etag = client.get("/accounts/1").headers['ETag']
+
+        response = client.get("/accounts/1", headers={'If-None-Match': etag})
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(calls, ['1'])
+
+    def test_query_args_are_part_of_the_key(self):
+        client = self.client()
+        client.get("/accounts/1?page=1")
+        client.get("/accounts/1?page=2")
+
+        self.assertEqual(len(calls), 2)
+
+    def test_responses_are_isolated_per_authorization_header(self):
+        client = self.client()
+        alice = client.get("/accounts/1", headers={'Authorization': 'Bearer alice'}).get_json()
+        bob = client.get("/accounts/1", headers={'Authorization': 'Bearer bob'}).get_json()
+        again = client.get("/accounts/1", headers={'Authorization': 'Bearer alice'}).get_json()
+
+        self.assertEqual(len(calls), 2)
+        self.assertNotEqual(alice, bob)
+        self.assertEqual(alice, again)
+
+    def test_responses_are_isolated_per_session_cookie(self):
+        client = self.client()
+        client.set_cookie('session', 'alice')
+        alice = client.get("/accounts/1").get_json()
+        client.set_cookie('session', 'bob')
+        bob = client.get("/accounts/1").get_json()
+
+        self.assertEqual(len(calls), 2)
+        self.assertNotEqual(alice, bob)
+
+    def test_private_no_store_and_cookie_responses_are_not_stored(self):
+        client = self.client()
+        for uri in ("/private/1", "/nostore/1", "/cookie/1"):
+            client.get(uri)
+            client.get(uri)
+
+        self.assertEqual(len(calls), 6)
+
+    def test_only_successful_get_requests_are_stored(self):
+        client = self.client()
+        client.get("/missing/1")
+        client.get("/missing/1")
+        client.post("/accounts/1/touch")
+        client.post("/accounts/1/touch")
+
+        self.assertEqual(len(calls), 4)
+
+    def test_sqlite_store_is_shared_between_store_instances(self):
+        client = self.client(SqliteCache)
+        client.get("/accounts/1")
+
+        Cache._stores.clear()
+        client.get("/accounts/1")
+
+        self.assertEqual(calls, ['1'])
+
+if __name__ == '__main__':
+    unittest.main()
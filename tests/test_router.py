@@ -0,0 +1,89 @@
+import os
+import json
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+from flask import Flask
+from lib.clarity.paths import Paths
+from lib.http.router import Route, Router, BluePrint
+
+class ReportController:
+
+    def index(self):
+        return "reports"
+
+    def show(self, id):
+        return f"report {id}"
+
+class RouterTestCase(unittest.TestCase):
+    """
+    Caso base de las pruebas del ruteador: carpeta base temporal y singletons limpios.
+    """
+
+    def setUp(self):
+        self.base = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.base, True)
+
+        patches = [
+            mock.patch.object(Paths, 'base', staticmethod(lambda file=None: self.base if file is None else os.path.join(self.base, file))),
+            mock.patch.object(Router, '_instance', None),
+            mock.patch.object(Route, '_instance', None)
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+        self.path = os.path.join(self.base, 'bootstrap', 'cache', 'route.json')
+
+class TestRouter(RouterTestCase):
+
+    def test_routes_are_kept_in_memory_until_compiled(self):
+        Route().group(
+            Route.get("reports", [ReportController, 'index']),
+            Route.get("reports/<id>", [ReportController, 'show'])
+        )
+
+        self.assertFalse(os.path.exists(self.path))
+        self.assertEqual([route["uri"] for route in Router().all()], ["/reports", "/reports/<id>"])
+
+        Router().compile()
+
+        with open(self.path) as f:
+            self.assertEqual(json.load(f), Router().all())
+        self.assertEqual(os.listdir(os.path.dirname(self.path)), ['route.json'])
+
+    def test_compiled_table_is_read_when_memory_is_empty(self):
+        Route().group(Route.get("reports", [ReportController, 'index']))
+        Router().compile()
+        Router()._routes = []
+
+        self.assertEqual(Router().all()[0]["uri"], "/reports")
+
+    def test_duplicated_routes_raise(self):
+        with self.assertRaises(ValueError):
+            Route().group(
+                Route.get("reports", [ReportController, 'index']),
+                Route.get("reports", [ReportController, 'show'])
+            )
+
+        self.assertEqual(Router().all(), [])
+
+    def test_missing_method_raises(self):
+        with self.assertRaises(ValueError):
+            Route().group(Route.get("reports", [ReportController, 'missing']))
+
+    def test_prefix_and_base_build_the_uri(self):
+        Route(base='api').prefix('v1').group(Route.post("reports", [ReportController, 'index']))
+
+        self.assertEqual(Router().all()[0]["uri"], "/api/v1/reports")
+        self.assertEqual(Router().all()[0]["verb"], "POST")
+
+    def test_blueprint_registers_the_routes(self):
+        Route().group(Route.get("reports/<id>", [ReportController, 'show']))
+        app = BluePrint(Flask(__name__), logger=None).routes()
+
+        self.assertEqual(app.test_client().get("/reports/7").get_data(as_text=True), "report 7")
+
+if __name__ == '__main__':
+    unittest.main()
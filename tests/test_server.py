@@ -0,0 +1,270 @@
+import os
+import sys
+import time
+import signal
+import socket
+import shutil
+import tempfile
+import unittest
+import urllib.request
+from types import SimpleNamespace
+from unittest import mock
+from flask import Flask
+from tests.helpers import configure, restore
+from tests.test_config import ConfigTestCase
+from lib.builder.aio import AsyncBuilder
+from lib.builder.cache import QueryCache
+from lib.builder.oracle import Oracle
+from lib.builder.sqlserver import SQLServer
+from lib.cache.store import Cache
+from lib.clarity.datatable import DataTable
+from lib.environment.config import Config
+from lib.kernel.commands.serve import ServeCommand
+from lib.http import server as module
+from lib.http.server import PreforkServer
+
+def get(url):
+    """Retorna el cuerpo de la respuesta, o None si el servidor aún no responde."""
+    try:
+        with urllib.request.urlopen(url, timeout=2) as response:
+            return response.read().decode()
+    except OSError:
+        return None
+
+class ServerTestCase(unittest.TestCase):
+
+    def setUp(self):
+        configure()
+        self.addCleanup(restore)
+
+        # run() instala los manejadores de señales del maestro
+        for signum in (signal.SIGTERM, signal.SIGINT, signal.SIGHUP):
+            self.addCleanup(signal.signal, signum, signal.getsignal(signum))
+
+    def port(self):
+        with socket.socket() as probe:
+            probe.bind(('127.0.0.1', 0))
+            return probe.getsockname()[1]
+
+class TestPreforkServer(ServerTestCase):
+
+    def test_invalid_settings_raise_in_spanish(self):
+        app = Flask(__name__)
+
+        for options, message in [
+            ({'workers': -1}, "La cantidad de workers"),
+            ({'keep_alive': -1}, "El keep-alive"),
+            ({'backlog': 0}, "El backlog")
+        ]:
+            with self.assertRaises(ValueError) as error:
+                PreforkServer(app, **options)
+            self.assertIn(message, str(error.exception))
+
+    def test_reset_discards_the_inherited_pools_and_stores(self):
+        attributes = [
+            (Oracle, '_instances'), (SQLServer, '_instances'), (AsyncBuilder, '_executors'),
+            (QueryCache, '_store'), (QueryCache, '_tags'), (Cache, '_stores'), (DataTable, '_totals')
+        ]
+        for owner, attribute in attributes:
+            patch = mock.patch.object(owner, attribute, {'inherited': object()})
+            patch.start()
+            self.addCleanup(patch.stop)
+
+        for owner, lock in [(Oracle, '_lock'), (QueryCache, '_lock'), (Cache, '_lock')]:
+            patch = mock.patch.object(owner, lock, getattr(owner, lock))
+            patch.start()
+            self.addCleanup(patch.stop)
+
+        lock = QueryCache._lock
+        PreforkServer.reset()
+
+        self.assertEqual(Oracle._instances, {})
+        self.assertEqual(SQLServer._instances, {})
+        self.assertEqual(AsyncBuilder._executors, {})
+        self.assertEqual(Cache._stores, {})
+        self.assertIsNone(QueryCache._store)
+        self.assertIsNone(DataTable._totals)
+        self.assertIsNot(QueryCache._lock, lock)
+
+    def test_crashing_workers_are_logged_backed_off_and_given_up(self):
+        folder = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, folder, True)
+        log = os.path.join(folder, 'danger.log')
+
+        class BrokenServer(PreforkServer):
+            min_uptime = 5
+            backoff = 0.05
+            backoff_max = 0.1
+            max_failures = 3
+
+            def work(self):
+                raise RuntimeError("broken worker")
+
+        def danger(message=''):
+            with open(log, 'a') as file:
+                file.write(message + "\n")
+
+        spawned = []
+        spawn = BrokenServer.spawn
+
+        with mock.patch.object(module.Console, 'danger', danger), \
+             mock.patch.object(module.Console, 'info'), \
+             mock.patch.object(module.Console, 'warning'), \
+             mock.patch.object(BrokenServer, 'spawn', lambda server: spawned.append(spawn(server))):
+
+            with self.assertRaises(RuntimeError) as error:
+                BrokenServer(Flask(__name__), port=self.port(), workers=1).run()
+
+        with open(log) as file:
+            logged = file.read()
+
+        self.assertIn("fallaron al iniciar 3 veces", str(error.exception))
+        self.assertEqual(len(spawned), 3)
+        self.assertEqual(logged.count("RuntimeError: broken worker"), 3)
+
+    def test_workers_serve_requests_until_sigterm(self):
+        port = self.port()
+        app = Flask(__name__)
+
+        @app.route('/ping')
+        def ping():
+            return str(os.getpid())
+
+        pid = os.fork()
+        if pid == 0:
+            code = 0
+            try:
+                with mock.patch.object(module.Console, 'info'):
+                    PreforkServer(app, port=port, workers=2, keep_alive=0).run()
+            except BaseException:
+                code = 1
+            finally:
+                os._exit(code)
+
+        try:
+            workers = set()
+            deadline = time.monotonic() + 10
+            while time.monotonic() < deadline and len(workers) < 2:
+                try:
+                    with urllib.request.urlopen(f"http://127.0.0.1:{port}/ping", timeout=2) as response:
+                        workers.add(int(response.read()))
+                except OSError:
+                    time.sleep(0.05)
+
+            self.assertGreaterEqual(len(workers), 1)
+            self.assertNotIn(pid, workers)
+        finally:
+            os.kill(pid, signal.SIGTERM)
+            _, status = os.waitpid(pid, 0)
+
+        self.assertEqual(os.waitstatus_to_exitcode(status), 0)
+
+class TestPreforkServerReload(ConfigTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.addCleanup(os.environ.pop, 'LFX_APP_NAME', None)
+        for signum in (signal.SIGTERM, signal.SIGINT, signal.SIGHUP):
+            self.addCleanup(signal.signal, signum, signal.getsignal(signum))
+
+    def env(self, content):
+        with open(os.path.join(self.base, '.env'), 'w') as file:
+            file.write(content)
+
+    def test_sighup_workers_read_the_changed_env_file(self):
+        port = self.port()
+        url = f"http://127.0.0.1:{port}/name"
+        app = Flask(__name__)
+
+        @app.route('/name')
+        def name():
+            return Config.app('name')
+
+        self.env("LFX_APP_NAME=first\n")
+        self.assertEqual(Config.app('name'), 'first')
+
+        pid = os.fork()
+        if pid == 0:
+            code = 0
+            try:
+                with mock.patch.object(module.Console, 'info'):
+                    PreforkServer(app, port=port, workers=1, keep_alive=0).run()
+            except BaseException:
+                code = 1
+            finally:
+                os._exit(code)
+
+        try:
+            names = []
+            deadline = time.monotonic() + 10
+            while time.monotonic() < deadline and 'first' not in names:
+                names.append(get(url))
+                time.sleep(0.05)
+
+            self.env("LFX_APP_NAME=second\n")
+            os.kill(pid, signal.SIGHUP)
+
+            deadline = time.monotonic() + 10
+            while time.monotonic() < deadline and 'second' not in names:
+                names.append(get(url))
+                time.sleep(0.05)
+
+            self.assertIn('first', names)
+            self.assertIn('second', names)
+        finally:
+            os.kill(pid, signal.SIGTERM)
+            _, status = os.waitpid(pid, 0)
+
+        self.assertEqual(os.waitstatus_to_exitcode(status), 0)
+
+    def port(self):
+        with socket.socket() as probe:
+            probe.bind(('127.0.0.1', 0))
+            return probe.getsockname()[1]
+
+class TestServeProduction(unittest.TestCase):
+
+    def setUp(self):
+        self.app = Flask(__name__)
+        patches = [
+            mock.patch.dict(sys.modules, {'bootstrap.app': SimpleNamespace(laraflask=self.app)}),
+            mock.patch.dict(os.environ),
+            mock.patch.object(module.PreforkServer, 'supported', return_value=True),
+            mock.patch.object(module.PreforkServer, 'run')
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def serve(self, environment):
+        with mock.patch('lib.environment.env.Env.get', return_value=environment), \
+             mock.patch('lib.kernel.commands.serve.Console') as console:
+            ServeCommand().production('127.0.0.1', 5000, 1, 5, 2048)
+        return console
+
+    def test_missing_environment_is_set_to_production(self):
+        os.environ.pop('APP_ENVIRONMENT', None)
+
+        console = self.serve('')
+
+        self.assertEqual(os.environ['APP_ENVIRONMENT'], 'production')
+        console.warning.assert_not_called()
+
+    def test_another_environment_is_kept_with_a_warning(self):
+        os.environ['APP_ENVIRONMENT'] = 'staging'
+
+        console = self.serve('staging')
+
+        self.assertEqual(os.environ['APP_ENVIRONMENT'], 'staging')
+        self.assertIn("APP_ENVIRONMENT='staging'", console.warning.call_args.args[0])
+
+    def test_production_environment_is_kept_silently(self):
+        os.environ['APP_ENVIRONMENT'] = 'prod'
+
+        console = self.serve('prod')
+
+        self.assertEqual(os.environ['APP_ENVIRONMENT'], 'prod')
+        console.warning.assert_not_called()
+
+if __name__ == '__main__':
+    unittest.main()
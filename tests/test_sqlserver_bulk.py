@@ -0,0 +1,94 @@
+import unittest
+from unittest import mock
+from tests.helpers import DatabaseTestCase, FakeCursor, pyodbc
+from lib.builder.sqlserver import SQLServer
+
+class TestSQLServerBulkInsert(DatabaseTestCase):
+
+    def test_batches_use_fast_executemany_and_commit(self):
+        rows = ({'ID': i, 'NAME': f"name {i}"} for i in range(5))
+
+        report = SQLServer().bulk_insert('dbo.USERS', rows, batch_size=2)
+
+        batches = pyodbc.database.batches
+        self.assertEqual(report, {'rows': 5, 'batches': 3})
+        self.assertEqual([len(batch['params']) for batch in batches], [2, 2, 1])
+        self.assertTrue(all(batch['fast_executemany'] for batch in batches))
+        self.assertEqual(batches[0]['statement'], "INSERT INTO dbo.USERS (ID, NAME) VALUES (?, ?)")
+        self.assertEqual(pyodbc.database.connections[0].commits, 3)
+        self.assertTrue(pyodbc.database.cursors[0].closed)
+        self.assertEqual(SQLServer().stats()['in_use'], 0)
+
+    def test_invalid_identifiers_and_missing_columns_are_rejected(self):
+        with self.assertRaises(ValueError):
+            SQLServer().bulk_insert('USERS', [(1,)])
+
+        with self.assertRaises(ValueError):
+            SQLServer().bulk_insert('USERS]; DROP TABLE X; --', [{'ID': 1}])
+
+        self.assertEqual(pyodbc.database.connections, [])
+
+    def test_executemany_commits_each_batch(self):
+        SQLServer().executemany("INSERT INTO T VALUES (?)", [(i,) for i in range(5)], batch_size=2)
+
+        self.assertEqual([len(batch['params']) for batch in pyodbc.database.batches], [2, 2, 1])
+        self.assertEqual(pyodbc.database.connections[0].commits, 3)
+
+class TestSQLServerBulkUpsert(DatabaseTestCase):
+
+    def test_each_batch_is_staged_and_merged(self):
+        # CREATE, TRUNCATE y MERGE de cada lote (el MERGE informa las filas afectadas).
+        pyodbc.database.result(['RESULT'], [])
+        for affected in (2, 1):
+            pyodbc.database.result(['RESULT'], [])
+            pyodbc.database.result(['RESULT'], [()] * affected)
+
+        rows = [{'ID': i, 'NAME': f"name {i}", 'AGE': i} for i in range(3)]
+        report = SQLServer().bulk_upsert('dbo.USERS', rows, keys='ID', batch_size=2)
+
+        statements = [executed['statement'] for executed in pyodbc.database.executed]
+        stage = statements[0].split(' INTO ')[1].split(' ')[0]
+
+        self.assertEqual(report, {'rows': 3, 'affected': 3, 'batches': 2})
+        self.assertTrue(stage.startswith('#stage_'))
+        self.assertEqual(statements[0], f"SELECT TOP 0 ID, NAME, AGE INTO {stage} FROM dbo.USERS UNION ALL SELECT TOP 0 ID, NAME, AGE FROM dbo.USERS")
+        self.assertEqual(statements[1], f"TRUNCATE TABLE {stage}")
+        self.assertIn("ON target.ID = source.ID", statements[2])
+        self.assertIn("WHEN MATCHED THEN UPDATE SET target.NAME = source.NAME, target.AGE = source.AGE", statements[2])
+        self.assertIn("WHEN NOT MATCHED THEN INSERT (ID, NAME, AGE) VALUES (source.ID, source.NAME, source.AGE);", statements[2])
+        self.assertEqual(statements[-1], f"IF OBJECT_ID('tempdb..{stage}') IS NOT NULL DROP TABLE {stage}")
+        self.assertTrue(all(batch['fast_executemany'] and batch['statement'].startswith(f"INSERT INTO {stage}") for batch in pyodbc.database.batches))
+        self.assertTrue(pyodbc.database.cursors[0].closed)
+
+    def test_keys_only_upsert_skips_the_update_clause(self):
+        SQLServer().bulk_upsert('USER_ROLES', [{'USER_ID': 1, 'ROLE_ID': 2}], keys=['USER_ID', 'ROLE_ID'])
+
+        merge = pyodbc.database.executed[2]['statement']
+        self.assertNotIn("WHEN MATCHED", merge)
+        self.assertIn("WHEN NOT MATCHED", merge)
+
+    def test_keys_must_be_part_of_the_columns(self):
+        with self.assertRaises(ValueError):
+            SQLServer().bulk_upsert('USERS', [{'ID': 1}], keys=['CODE'])
+
+    def test_failed_batch_drops_the_stage_and_releases_the_connection(self):
+        database = SQLServer()
+        execute = FakeCursor.execute
+
+        def merge_fails(cursor, statement, params=None):
+            if statement.startswith('MERGE'):
+                raise pyodbc.Error("deadlock")
+            return execute(cursor, statement, params)
+
+        with mock.patch.object(FakeCursor, 'execute', merge_fails):
+            with self.assertRaises(ValueError) as error:
+                database.bulk_upsert('USERS', [{'ID': 1, 'NAME': 'a'}], keys='ID')
+
+        self.assertIn("Upsert Masivo Fallido en la fila 0", str(error.exception))
+        self.assertTrue(pyodbc.database.executed[-1]['statement'].startswith("IF OBJECT_ID"))
+        self.assertGreaterEqual(pyodbc.database.connections[0].rollbacks, 1)
+        self.assertEqual(pyodbc.database.connections[0].commits, 1)
+        self.assertEqual(database.stats()['in_use'], 0)
+
+if __name__ == '__main__':
+    unittest.main()
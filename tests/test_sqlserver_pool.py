@@ -0,0 +1,150 @@
+import time
+import threading
+import unittest
+from flask import Flask
+from tests.helpers import DatabaseTestCase, configure, pyodbc
+from lib.builder.pool import ConnectionPool
+from lib.builder.sqlserver import SQLServer
+from lib.builder.aio import AsyncSQLServer
+
+class Connection:
+
+    def __init__(self):
+        self.closed = False
+
+    def close(self):
+        self.closed = True
+
+class TestConnectionPool(unittest.TestCase):
+
+    def test_exhausted_pool_times_out(self):
+        pool = ConnectionPool(factory=Connection, max_size=1, timeout=0.1)
+        pool.acquire()
+
+        start = time.monotonic()
+        with self.assertRaises(RuntimeError) as error:
+            pool.acquire()
+
+        self.assertGreaterEqual(time.monotonic() - start, 0.1)
+        self.assertIn("[DB Pool]", str(error.exception))
+        self.assertEqual(pool.stats()['in_use'], 1)
+
+    def test_waiter_gets_the_released_connection(self):
+        pool = ConnectionPool(factory=Connection, max_size=1, timeout=5)
+        connection = pool.acquire()
+
+        threading.Timer(0.05, pool.release, args=(connection,)).start()
+
+        self.assertIs(pool.acquire(), connection)
+        self.assertEqual(pool.stats()['waits'], 1)
+
+    def test_idle_connections_are_reused_and_expired_ones_closed(self):
+        pool = ConnectionPool(factory=Connection, max_size=2, idle_timeout=0.05)
+        connection = pool.acquire()
+        pool.release(connection)
+        self.assertIs(pool.acquire(), connection)
+
+        pool.release(connection)
+        time.sleep(0.06)
+
+        self.assertIsNot(pool.acquire(), connection)
+        self.assertTrue(connection.closed)
+
+    def test_invalid_idle_connection_is_replaced(self):
+        def validate(connection):
+            raise RuntimeError("gone")
+
+        pool = ConnectionPool(factory=Connection, max_size=1, ping_interval=0, validate=validate)
+        connection = pool.acquire()
+        pool.release(connection)
+
+        self.assertIsNot(pool.acquire(), connection)
+        self.assertTrue(connection.closed)
+
+    def test_invalid_size_raises(self):
+        with self.assertRaises(ValueError):
+            ConnectionPool(factory=Connection, max_size=0)
+
+class TestSQLServerScopedConnection(DatabaseTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.app = Flask(__name__)
+        self.app.teardown_appcontext(ConnectionPool.teardown)
+
+    def test_request_uses_a_single_connection(self):
+        database = SQLServer()
+
+        with self.app.app_context():
+            database.select("SELECT 1")
+            database.execute("UPDATE T SET A = 1")
+            self.assertEqual(database.stats()['in_use'], 1)
+
+        self.assertEqual(database.stats()['in_use'], 0)
+        self.assertEqual(len(pyodbc.database.connections), 1)
+
+    def test_transaction_reuses_the_request_connection(self):
+        configure(database={'sqlserver': {'default': dict(self.settings(), pool={'max': 1, 'timeout': 0.2, 'validation': None})}})
+        database = SQLServer()
+
+        with self.app.app_context():
+            database.select("SELECT 1")
+
+            with database.transaction():
+                database.insert("INSERT INTO T VALUES (1)")
+
+            with database.session():
+                database.select("SELECT 2")
+
+            self.assertEqual(database.stats()['in_use'], 1)
+
+        connection = pyodbc.database.connections[0]
+        self.assertEqual(len(pyodbc.database.connections), 1)
+        self.assertEqual(connection.commits, 1)
+
+    def test_concurrent_requests_with_transactions_do_not_starve_the_pool(self):
+        database = SQLServer()
+        barrier = threading.Barrier(2)
+
+        def request():
+            with self.app.app_context():
+                database.select("SELECT 1")
+                barrier.wait()
+                with database.transaction():
+                    database.update("UPDATE T SET A = 1")
+            return True
+
+        results = [None, None]
+
+        def run(position):
+            results[position] = self.thread(request)
+
+        threads = [threading.Thread(target=run, args=(position,)) for position in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results, [{'value': True}, {'value': True}])
+
+    def test_async_queries_reuse_the_request_connection(self):
+        configure(database={'sqlserver': {'default': dict(self.settings(), pool={'max': 1, 'timeout': 0.2, 'validation': None})}})
+        pyodbc.database.result(['A'], [(1,)])
+        pyodbc.database.result(['B'], [(2,)])
+        pyodbc.database.result(['C'], [(3,)])
+
+        with self.app.app_context():
+            SQLServer().select("SELECT A")
+
+            db = AsyncSQLServer()
+            first, second = db.run(db.select("SELECT B"), db.select("SELECT C"))
+
+        self.assertEqual(len(pyodbc.database.connections), 1)
+        self.assertEqual(sorted([first.first(), second.first()], key=str), [{'B': 2}, {'C': 3}])
+
+    def settings(self):
+        from tests.helpers import SETTINGS
+        return {key: value for key, value in SETTINGS['database']['sqlserver']['default'].items() if key != 'pool'}
+
+if __name__ == '__main__':
+    unittest.main()
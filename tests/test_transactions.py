@@ -0,0 +1,89 @@
+import unittest
+from tests.helpers import DatabaseTestCase, cx_Oracle, pyodbc
+from lib.builder.oracle import Oracle
+from lib.builder.sqlserver import SQLServer
+
+class TransactionTests:
+    """
+    Pruebas comunes de transaction() para los dos builders.
+    """
+
+    def test_block_commits_once(self):
+        with self.builder().transaction() as db:
+            db.insert("INSERT INTO T VALUES (1)")
+            db.update("UPDATE T SET A = 2")
+            db.delete("DELETE FROM T WHERE A = 3")
+
+        self.assertEqual(len(self.driver.database.connections), 1)
+        self.assertEqual(self.driver.database.connections[0].commits, 1)
+
+    def test_error_rolls_back_the_whole_block(self):
+        with self.assertRaises(RuntimeError):
+            with self.builder().transaction() as db:
+                db.insert("INSERT INTO T VALUES (1)")
+                raise RuntimeError("abort")
+
+        connection = self.driver.database.connections[0]
+        self.assertEqual(connection.commits, 0)
+        self.assertGreaterEqual(connection.rollbacks, 1)
+
+    def test_nested_blocks_join_the_outer_transaction(self):
+        with self.builder().transaction() as db:
+            db.insert("INSERT INTO T VALUES (1)")
+            with db.transaction():
+                db.insert("INSERT INTO T VALUES (2)")
+            self.assertTrue(db.in_transaction())
+
+        self.assertFalse(self.builder().in_transaction())
+        self.assertEqual(len(self.driver.database.connections), 1)
+        self.assertEqual(self.driver.database.connections[0].commits, 1)
+
+    def test_statements_outside_a_block_commit_and_close_their_cursors(self):
+        database = self.builder()
+        database.insert("INSERT INTO T VALUES (1)")
+        database.select("SELECT 1")
+
+        self.assertEqual(sum(connection.commits for connection in self.driver.database.connections), 1)
+        self.assertTrue(all(cursor.closed for cursor in self.driver.database.cursors))
+
+    def test_close_discards_the_instance(self):
+        database = self.builder()
+        database.select("SELECT 1")
+        database.close()
+
+        self.assertIsNot(self.builder(), database)
+
+class TestOracleTransaction(TransactionTests, DatabaseTestCase):
+
+    driver = cx_Oracle
+
+    def builder(self):
+        return Oracle()
+
+class TestSQLServerTransaction(TransactionTests, DatabaseTestCase):
+
+    driver = pyodbc
+
+    def builder(self):
+        return SQLServer()
+
+    def test_validation_cursor_is_closed(self):
+        database = SQLServer()
+        database.select("SELECT 1")
+        database.select("SELECT 2")
+
+        statements = [executed['statement'] for executed in pyodbc.database.executed]
+        self.assertEqual(statements, ["SELECT 1", "SELECT 1", "SELECT 2"])
+        self.assertEqual(len(pyodbc.database.connections), 1)
+        self.assertTrue(all(cursor.closed for cursor in pyodbc.database.cursors))
+
+    def test_close_closes_idle_connections(self):
+        database = SQLServer()
+        database.select("SELECT 1")
+        database.close()
+
+        self.assertTrue(pyodbc.database.connections[0].closed)
+        self.assertNotIn('default', SQLServer._instances)
+
+if __name__ == '__main__':
+    unittest.main()
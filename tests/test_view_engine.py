@@ -0,0 +1,80 @@
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+from tests.helpers import configure, restore
+from lib.clarity.paths import Paths
+from lib.view.engine import View
+
+class ViewTestCase(unittest.TestCase):
+    """
+    Caso base de las pruebas de vistas: carpeta base temporal con templates y entorno limpio.
+    """
+
+    def setUp(self):
+        self.base = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.base, True)
+        self.addCleanup(restore)
+        configure()
+
+        patches = [
+            mock.patch.object(Paths, 'base', staticmethod(lambda file=None: self.base if file is None else os.path.join(self.base, file))),
+            mock.patch.object(View, '_environment', None)
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+        self.views = os.path.join(self.base, 'resources', 'views')
+        self.template('home.html', "<h1>{{ title }}</h1>")
+        self.template('reports/index.html', "{% for row in rows %}<p>{{ row }}</p>{% endfor %}")
+
+    def template(self, name, source):
+        path = os.path.join(self.views, name)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'w') as file:
+            file.write(source)
+
+class TestViewEnvironment(ViewTestCase):
+
+    def test_environment_is_created_once_with_the_configured_cache(self):
+        environment = View.environment()
+
+        self.assertIs(View.environment(), environment)
+        self.assertEqual(environment.cache.capacity, 50)
+        self.assertFalse(environment.auto_reload)
+        self.assertIsNone(environment.bytecode_cache)
+
+    def test_compiled_templates_are_served_from_memory(self):
+        self.assertEqual(View.make('home', {'title': 'A'}).render(), "<h1>A</h1>")
+
+        self.template('home.html', "<h2>{{ title }}</h2>")
+
+        self.assertEqual(View.make('home', {'title': 'A'}).render(), "<h1>A</h1>")
+
+    def test_debug_reloads_changed_templates(self):
+        configure(app={'debug': True})
+        View.make('home', {'title': 'A'}).render()
+
+        self.template('home.html', "<h2>{{ title }}</h2>")
+        os.utime(os.path.join(self.views, 'home.html'), (0, 0))
+
+        self.assertEqual(View.make('home', {'title': 'A'}).render(), "<h2>A</h2>")
+
+    def test_compile_writes_bytecode_and_clear_removes_it(self):
+        configure(view={'bytecode_cache': True, 'compiled': 'bootstrap/cache/views'})
+
+        templates = View.compile()
+
+        compiled = os.path.join(self.base, 'bootstrap', 'cache', 'views')
+        self.assertEqual(sorted(templates), ['home.html', 'reports/index.html'])
+        self.assertEqual(len(os.listdir(compiled)), 2)
+
+        View.clear()
+
+        self.assertIsNone(View._environment)
+        self.assertEqual(os.listdir(compiled), [])
+
+if __name__ == '__main__':
+    unittest.main()
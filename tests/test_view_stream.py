@@ -0,0 +1,80 @@
+import os
+import unittest
+from unittest import mock
+from flask import Flask
+from tests.helpers import configure
+from tests.test_view_engine import ViewTestCase
+from lib.kernel.commands.view import ViewCacheCommand
+from lib.view.engine import View
+
+class TestViewStream(ViewTestCase):
+
+    def setUp(self):
+        super().setUp()
+        self.app = Flask(__name__)
+
+    def test_stream_renders_the_template_in_chunks(self):
+        rows = range(12)
+
+        with self.app.test_request_context():
+            response = View.make('reports/index', {'rows': rows}).stream(buffer=5)
+            chunks = list(response.response)
+
+        self.assertTrue(response.is_streamed)
+        self.assertEqual(response.mimetype, 'text/html')
+        self.assertGreater(len(chunks), 1)
+        self.assertEqual("".join(chunks), "".join(f"<p>{row}</p>" for row in rows))
+
+    def test_stream_without_buffer_sends_each_fragment(self):
+        with self.app.test_request_context():
+            single = list(View.make('reports/index', {'rows': range(3)}).stream(buffer=0).response)
+            grouped = list(View.make('reports/index', {'rows': range(3)}).stream(buffer=3).response)
+
+        self.assertEqual(len(single), 9)
+        self.assertEqual(len(grouped), 3)
+        self.assertEqual("".join(single), "".join(grouped))
+
+    def test_streamed_response_is_served_by_flask(self):
+        @self.app.route('/reports')
+        def reports():
+            return View.make('reports/index', {'rows': range(4)}).stream()
+
+        response = self.app.test_client().get('/reports')
+
+        self.assertEqual(response.get_data(as_text=True), "<p>0</p><p>1</p><p>2</p><p>3</p>")
+
+class TestViewCacheCommand(ViewTestCase):
+
+    def setUp(self):
+        super().setUp()
+        configure(view={'bytecode_cache': True, 'compiled': 'bootstrap/cache/views'})
+
+    def test_command_recompiles_every_template(self):
+        with mock.patch('lib.kernel.commands.view.Console') as console:
+            ViewCacheCommand().handle()
+
+        messages = [call.args[0] for call in console.info.call_args_list]
+        self.assertEqual(sorted(messages), ["Compilado: home.html", "Compilado: reports/index.html"])
+        console.success.assert_called_once_with("Templates compilados: 2")
+        self.assertEqual(len(os.listdir(os.path.join(self.base, 'bootstrap', 'cache', 'views'))), 2)
+
+    def test_command_skips_compiling_without_bytecode_cache(self):
+        configure(view={'bytecode_cache': False})
+
+        with mock.patch('lib.kernel.commands.view.Console') as console, mock.patch.object(View, 'compile') as compile:
+            ViewCacheCommand().handle()
+
+        compile.assert_not_called()
+        console.success.assert_not_called()
+        self.assertIn("VIEW_BYTECODE_CACHE", console.warning.call_args.args[0])
+
+    def test_command_discards_the_previous_environment(self):
+        environment = View.environment()
+
+        with mock.patch('lib.kernel.commands.view.Console'):
+            ViewCacheCommand().handle()
+
+        self.assertIsNot(View.environment(), environment)
+
+if __name__ == '__main__':
+    unittest.main()